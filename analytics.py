@@ -0,0 +1,197 @@
+import csv
+import json
+
+import numpy as np
+
+from splits import format_hms
+from stopwatch import NS_PER_SEC
+
+NS_PER_HOUR = 3600 * NS_PER_SEC
+PERCENTILES = (10, 50, 90)
+ROLLING_WINDOW = 10
+EXPORT_CHUNK = 10_000  # CSV 로 내보낼 때 한 번에 파이썬 값으로 바꾸는 행 수
+
+
+class RunTable:
+    # 한 카테고리의 런을 열 단위 NumPy 배열로 (시작 시각 순).
+    # segments 는 (런 수, 최대 스플릿 수) 구간 ns 행렬이고 없는 칸은 NaN.
+    __slots__ = ('category', 'run_ids', 'started_at', 'total_ns', 'completed', 'segments')
+
+    def __init__(self, category, run_ids, started_at, total_ns, completed, segments):
+        self.category = category
+        self.run_ids = run_ids
+        self.started_at = started_at
+        self.total_ns = total_ns
+        self.completed = completed
+        self.segments = segments
+
+    def __len__(self):
+        return len(self.run_ids)
+
+
+def load_runs(connection, category):
+    # 런 한 행에 구간 ns 가 array('q') 바이트로 들어 있으므로 스플릿 행을 하나씩 꺼내지 않고
+    # 바이트를 이어 붙인 뒤 np.frombuffer 한 번으로 (런 수, 최대 스플릿 수) 행렬에 흩어 놓는다
+    # 인덱스로 행을 하나씩 찾아가며 정렬하는 것보다 테이블을 순서대로 한 번 훑는 편이 빠르다
+    # (+category_id 로 인덱스 사용을 막고, 시작 시각 정렬은 NumPy 에서)
+    rows = connection.execute(
+        'SELECT id, started_at, total_ns, completed, segments FROM runs '
+        'WHERE +category_id = (SELECT id FROM categories WHERE name = ?)',
+        (category,),
+    ).fetchall()
+    if not rows:
+        empty = np.empty(0)
+        return RunTable(category, empty.astype(np.int64), empty, empty.astype(np.int64), empty.astype(bool),
+                        np.empty((0, 0)))
+    run_ids, started_at, total_ns, completed, blobs = zip(*rows)
+    blobs = [blob or b'' for blob in blobs]
+    lengths = np.fromiter(map(len, blobs), dtype=np.int64, count=len(blobs)) // 8
+    flat = np.frombuffer(b''.join(blobs), dtype=np.int64)
+    segments = np.full((len(rows), int(lengths.max())), np.nan)
+    if len(flat):
+        row_of = np.repeat(np.arange(len(rows)), lengths)
+        column_of = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        segments[row_of, column_of] = flat
+    started_at = np.array(started_at, dtype=np.float64)
+    order = np.argsort(started_at, kind='stable')
+    return RunTable(
+        category,
+        np.array(run_ids, dtype=np.int64)[order],
+        started_at[order],
+        np.array(total_ns, dtype=np.int64)[order],
+        np.array(completed, dtype=bool)[order],
+        segments[order],
+    )
+
+
+def rolling_mean(values, window):
+    # 누적합 차이로 구하는 길이 window 이동 평균 (값이 window 보다 적으면 빈 배열)
+    if len(values) < window:
+        return np.empty(0)
+    sums = np.cumsum(np.concatenate(([0.0], values.astype(np.float64))))
+    return (sums[window:] - sums[:-window]) / window
+
+
+def summarize(table, window=ROLLING_WINDOW, percentiles=PERCENTILES):
+    totals = table.total_ns[table.completed]
+    segments = table.segments
+    has_splits = segments.shape[1] > 0 and len(table) > 0
+    best = np.nanmin(segments, axis=0) if has_splits else np.empty(0)
+    split_counts = np.count_nonzero(~np.isnan(segments), axis=1)
+    hours = table.total_ns / NS_PER_HOUR
+    # 시간당 구간 수 (자동 스플릿이면 지역/맵 수). 0 시간 런은 빼고 계산한다
+    timed = hours > 0
+    return {
+        'category': table.category,
+        'runs': len(table),
+        'completed': int(table.completed.sum()),
+        'pb_ns': int(totals.min()) if len(totals) else None,
+        'mean_ns': float(totals.mean()) if len(totals) else None,
+        'stddev_ns': float(totals.std()) if len(totals) else None,
+        'sum_of_best_ns': float(best.sum()) if has_splits else None,
+        'rolling_mean_ns': rolling_mean(totals, window),
+        'maps_per_hour': float(split_counts[timed].sum() / hours[timed].sum()) if timed.any() else None,
+        'maps_per_hour_by_run': np.divide(split_counts, hours, out=np.zeros(len(table)), where=timed),
+        'splits': {
+            'count': np.count_nonzero(~np.isnan(segments), axis=0),
+            'best_ns': best,
+            'mean_ns': np.nanmean(segments, axis=0) if has_splits else np.empty(0),
+            'stddev_ns': np.nanstd(segments, axis=0) if has_splits else np.empty(0),
+            'percentiles': {
+                f'p{q}': (np.nanpercentile(segments, q, axis=0) if has_splits else np.empty(0)) for q in percentiles
+            },
+        },
+    }
+
+
+def json_default(value):
+    # NumPy 값을 JSON 으로. NaN 은 null
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'f':
+            return np.where(np.isnan(value), None, value).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def write_json(summaries, f):
+    # 큰 문자열을 만들지 않고 인코더가 내놓는 조각을 바로 쓴다
+    for chunk in json.JSONEncoder(default=json_default, indent=1).iterencode(summaries):
+        f.write(chunk)
+    f.write('\n')
+
+
+def write_runs_csv(tables, f):
+    # 런 한 줄에 구간 ns 를 열로 (카테고리마다 스플릿 수가 달라도 가장 넓은 쪽에 맞춘다).
+    # EXPORT_CHUNK 행씩 파이썬 값으로 바꿔 흘려 쓴다
+    writer = csv.writer(f)
+    width = max((table.segments.shape[1] for table in tables), default=0)
+    writer.writerow(['category', 'run_id', 'started_at', 'total_ns', 'completed']
+                    + [f'segment_{i}_ns' for i in range(width)])
+    for table in tables:
+        padding = [''] * (width - table.segments.shape[1])
+        for start in range(0, len(table), EXPORT_CHUNK):
+            end = start + EXPORT_CHUNK
+            segments = table.segments[start:end]
+            cells = np.where(np.isnan(segments), '', np.nan_to_num(segments).astype(np.int64).astype(str))
+            writer.writerows(
+                [table.category, run_id, started_at, total_ns, int(completed)] + row + padding
+                for run_id, started_at, total_ns, completed, row in zip(
+                    table.run_ids[start:end].tolist(), table.started_at[start:end].tolist(),
+                    table.total_ns[start:end].tolist(), table.completed[start:end].tolist(), cells.tolist())
+            )
+
+
+def summary_rows(summary, prefix=''):
+    # 요약 dict 를 (항목, 번호, 값) 줄로 펼친다. 배열은 원소마다 한 줄 (번호는 배열 안 위치: 구간 / 런 / 이동 평균 창),
+    # 하위 dict 는 'splits.percentiles.p50' 처럼 이름을 이어 붙인다
+    for key, value in summary.items():
+        if key == 'category':
+            continue
+        name = prefix + key
+        if isinstance(value, dict):
+            yield from summary_rows(value, name + '.')
+        elif isinstance(value, np.ndarray):
+            for index, item in enumerate(value.tolist()):
+                yield name, index, item
+        else:
+            yield name, '', value
+
+
+def write_results_csv(summaries, f):
+    # summarize() 결과 (PB, 백분위수, 이동 평균, sum of best, 시간당 구간 수) 를 카테고리별로.
+    # 원시 구간은 write_runs_csv. 값이 없으면 (NaN / None) 빈 칸
+    writer = csv.writer(f)
+    writer.writerow(['category', 'metric', 'index', 'value'])
+    for summary in summaries:
+        for name, index, value in summary_rows(summary):
+            if value is None or value != value:
+                value = ''
+            writer.writerow([summary['category'], name, index, value])
+
+
+def format_ns(ns):
+    if ns is None:
+        return '-'
+    return format_hms(int(ns) // NS_PER_SEC)
+
+
+def format_summary(summary):
+    # 사람이 읽는 요약 (CLI 출력과 오버레이 통계 창에서 같이 쓴다)
+    lines = [
+        f"[{summary['category']}] runs {summary['runs']} (completed {summary['completed']})",
+        f"  PB {format_ns(summary['pb_ns'])}  sum of best {format_ns(summary['sum_of_best_ns'])}",
+        f"  mean {format_ns(summary['mean_ns'])}  stddev {format_ns(summary['stddev_ns'])}",
+    ]
+    rolling = summary['rolling_mean_ns']
+    if len(rolling):
+        lines.append(f"  rolling mean (last) {format_ns(rolling[-1])}")
+    if summary['maps_per_hour'] is not None:
+        lines.append(f"  splits/hour {summary['maps_per_hour']:.1f}")
+    splits = summary['splits']
+    for i in range(len(splits['best_ns'])):
+        median = splits['percentiles']['p50'][i] if 'p50' in splits['percentiles'] else None
+        lines.append(f"  #{i + 1:<3d} best {format_ns(splits['best_ns'][i])}  median {format_ns(median)}"
+                     f"  stddev {splits['stddev_ns'][i] / NS_PER_SEC:.1f}s  n={splits['count'][i]}")
+    return '\n'.join(lines)
@@ -0,0 +1,80 @@
+# 카운트다운 알림 지연 측정 (offscreen Qt)
+#   python -m bench.alert_lateness --timers 20 --seconds 6
+#
+# 여러 카운트다운을 무작위 길이로 동시에 돌리고, 알림이 목표 시각(남은 시간 = 임계값)보다
+# 얼마나 늦게 울렸는지 분포를 본다. 부하 없음 / GUI 스레드 바쁨 / 파이썬 스레드 CPU 경쟁.
+import argparse
+import random
+import sys
+import threading
+import time
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from bench.common import HeadlessOverlayTimer, fmt_ms
+
+
+def busy(ms):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def run(load, args, rng):
+    app = QApplication.instance() or QApplication(sys.argv)
+    timer = HeadlessOverlayTimer()
+    timer.show()
+    timer.settings.timers = [
+        (f'cd{i}', 'countdown', rng.uniform(1, args.seconds), (1.25, 0)) for i in range(args.timers)
+    ]
+    timer.session.set_timers(timer.settings.timers)
+    timer.start_timer()
+
+    stop = threading.Event()
+    threads = []
+    gui_load = QTimer()
+    if load == 'gui':
+        # GUI 스레드가 주기적으로 몇 ms 씩 다른 일을 한다
+        gui_load.timeout.connect(lambda: busy(args.busy_ms))
+        gui_load.start(args.busy_every_ms)
+    elif load == 'threads':
+        # 파이썬 스레드들이 GIL 을 두고 경쟁한다
+        def spin():
+            while not stop.is_set():
+                sum(range(1000))
+        threads = [threading.Thread(target=spin, daemon=True) for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+
+    QTimer.singleShot(int(args.seconds * 1000) + 300, app.quit)
+    app.exec_()
+    gui_load.stop()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    timer.tick_timer.stop()
+    timer.hide()
+    return list(timer.alert_lateness), args.timers * 2
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--timers', type=int, default=20)
+    parser.add_argument('--seconds', type=float, default=6)
+    parser.add_argument('--busy-ms', type=float, default=5)
+    parser.add_argument('--busy-every-ms', type=int, default=20)
+    parser.add_argument('--threads', type=int, default=2)
+    parser.add_argument('--loads', nargs='+', default=['none', 'gui', 'threads'])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.timers} countdowns (1..{args.seconds:g}s), alerts at 1.25s left and at 0")
+    for load in args.loads:
+        lateness, expected = run(load, args, random.Random(args.seed))
+        p50 = sorted(lateness)[len(lateness) // 2] / 1e6 if lateness else float('nan')
+        print(f"  {load:<8} alerts={len(lateness)}/{expected}  p50={p50:8.3f}ms  {fmt_ms(lateness)}")
+
+
+if __name__ == '__main__':
+    main()
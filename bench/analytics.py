@@ -0,0 +1,54 @@
+# 런 통계 벤치마크: 합성 런 DB 에서 불러오기 / 요약 / CSV·JSON 내보내기 시간
+#   python -m bench.analytics --runs 200000 --splits 10
+import argparse
+import io
+import os
+import tempfile
+import time
+
+import analytics
+from bench.history import synthetic_runs
+from history import History, HistoryWriter
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=200_000)
+    parser.add_argument('--splits', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'history.db')
+        writer = HistoryWriter(path)
+        for record in synthetic_runs(args.runs, args.splits, args.seed):
+            record.category = 'any%'  # 한 카테고리에 모두 넣어 가장 큰 경우를 잰다
+            writer.add(record)
+        writer.close()
+
+        history = History(path)
+        t0 = time.perf_counter()
+        table = analytics.load_runs(history.connection, 'any%')
+        load_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        summary = analytics.summarize(table)
+        summarize_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        analytics.write_runs_csv([table], io.StringIO())
+        csv_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        analytics.write_json([summary], io.StringIO())
+        json_s = time.perf_counter() - t0
+        history.close()
+
+    entries = len(table) * (1 + args.splits)
+    print(f"{len(table)} runs, {entries} runs+splits")
+    print(f"  load      {load_s * 1e3:8.1f}ms")
+    print(f"  summarize {summarize_s * 1e3:8.1f}ms")
+    print(f"  csv       {csv_s * 1e3:8.1f}ms")
+    print(f"  json      {json_s * 1e3:8.1f}ms")
+    print(analytics.format_summary(summary))
+
+
+if __name__ == '__main__':
+    main()
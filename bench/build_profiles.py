@@ -0,0 +1,149 @@
+# PyInstaller 빌드 프로필 비교: 프로필마다 빌드해서 배포 크기와 첫 페인트까지의 실행 시간을 잰다
+#   python -m bench.build_profiles                       # m_clock.spec 의 모든 프로필
+#   python -m bench.build_profiles --profile onedir --runs 20
+#   python -m bench.build_profiles --skip-build --drop-caches   # (리눅스, root) 매번 페이지 캐시를 비운 콜드 실행
+# 리눅스 onedir 빌드는 남긴 Qt 플러그인이 링크하는 Qt 라이브러리가 빠지지 않았는지 readelf 로 확인한다
+# (offscreen 으로만 띄우면 qxcb 가 못 뜨는 빌드도 통과하기 때문).
+# cold: 빌드 직후 첫 실행 (--drop-caches 면 실행 전에 캐시를 비운다), warm: 이어지는 --runs 번의 중앙값
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILES = ('onefile', 'onefile-slim', 'onedir')
+OUTPUT = os.path.join(ROOT, 'build', 'profiles')
+LAUNCH_TIMEOUT_S = 60
+
+
+def build(profile):
+    directory = os.path.join(OUTPUT, profile)
+    subprocess.run(
+        [sys.executable, '-m', 'PyInstaller', 'm_clock.spec', '--noconfirm', '--log-level', 'WARN',
+         '--distpath', os.path.join(directory, 'dist'), '--workpath', os.path.join(directory, 'work'),
+         '--', '--profile', profile, '--probe'],
+        cwd=ROOT, check=True,
+    )
+
+
+def executable(profile):
+    dist = os.path.join(OUTPUT, profile, 'dist')
+    name = 'm_clock.exe' if sys.platform == 'win32' else 'm_clock'
+    if profile == 'onedir':
+        return os.path.join(dist, 'm_clock', name), os.path.join(dist, 'm_clock')
+    return os.path.join(dist, name), os.path.join(dist, name)
+
+
+def bundle_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path), 1
+    total = files = 0
+    for directory, _, names in os.walk(path):
+        for name in names:
+            total += os.lstat(os.path.join(directory, name)).st_size  # 심볼릭 링크는 링크 크기만
+            files += 1
+    return total, files
+
+
+def missing_qt_libraries(bundle):
+    # [(플러그인, 없는 라이브러리)]. 폴더 배포 + readelf 가 있는 리눅스에서만 본다
+    if not os.path.isdir(bundle) or sys.platform != 'linux':
+        return []
+    names = set()
+    plugins = []
+    for directory, _, files in os.walk(bundle):
+        for name in files:
+            names.add(name)
+            if name.endswith('.so') and os.sep + 'plugins' + os.sep in directory + os.sep:
+                plugins.append(os.path.join(directory, name))
+    missing = []
+    for plugin in plugins:
+        try:
+            dynamic = subprocess.run(['readelf', '-d', plugin], capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return []
+        for library in re.findall(r'NEEDED.*\[(libQt5\w+\.so[.\d]*)\]', dynamic):
+            if library not in names:
+                missing.append((os.path.relpath(plugin, bundle), library))
+    return missing
+
+
+def drop_caches():
+    # 리눅스에서만 (root 필요). 다른 플랫폼은 빌드 직후 첫 실행을 콜드로 본다
+    subprocess.run(['sync'], check=True)
+    with open('/proc/sys/vm/drop_caches', 'w') as f:
+        f.write('3\n')
+
+
+def launch(exe):
+    # 빈 작업 디렉터리에서 띄워 첫 페인트 / 지연 준비 완료 시각을 훅이 남긴 파일에서 읽는다
+    with tempfile.TemporaryDirectory() as directory:
+        probe = os.path.join(directory, 'probe.json')
+        env = dict(os.environ, M_CLOCK_STARTUP_PROBE=probe)
+        if sys.platform not in ('win32', 'darwin'):
+            env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        spawned = time.monotonic_ns()
+        subprocess.run([exe], cwd=directory, env=env, timeout=LAUNCH_TIMEOUT_S, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        with open(probe) as f:
+            marks = json.load(f)
+    return {
+        'to_python_ms': (marks['main'] - spawned) / 1e6,  # onefile 은 여기에 압축 풀기가 들어간다
+        'first_paint_ms': (marks['first_paint'] - spawned) / 1e6,
+        'ready_ms': (marks['ready'] - spawned) / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--profile', action='append', choices=PROFILES, help='여러 번 줄 수 있다 (기본: 전부)')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--skip-build', action='store_true', help='build/profiles 에 있는 빌드를 그대로 쓴다')
+    parser.add_argument('--drop-caches', action='store_true', help='콜드 실행 전에 페이지 캐시를 비운다 (리눅스, root)')
+    parser.add_argument('--log', help='결과를 JSON 한 줄로 덧붙일 파일')
+    args = parser.parse_args()
+
+    results = {}
+    for profile in args.profile or PROFILES:
+        if not args.skip_build:
+            build(profile)
+        exe, bundle = executable(profile)
+        missing = missing_qt_libraries(bundle)
+        for plugin, library in missing:
+            print(f"{profile}: {plugin} needs {library}, which is not in the bundle", file=sys.stderr)
+        if missing:
+            sys.exit(1)
+        size, files = bundle_size(bundle)
+        if args.drop_caches:
+            drop_caches()
+        cold = launch(exe)
+        warm = [launch(exe) for _ in range(args.runs)]
+        results[profile] = {
+            'size_bytes': size,
+            'files': files,
+            'cold': cold,
+            'warm': {key: statistics.median(sample[key] for sample in warm) for key in cold},
+        }
+
+    print(f"{'profile':14s} {'size MB':>8s} {'files':>6s} {'cold paint':>11s} {'warm paint':>11s} "
+          f"{'cold ready':>11s} {'warm ready':>11s}")
+    for profile, result in results.items():
+        cold, warm = result['cold'], result['warm']
+        print(f"{profile:14s} {result['size_bytes'] / 2**20:8.1f} {result['files']:6d} "
+              f"{cold['first_paint_ms']:9.1f}ms {warm['first_paint_ms']:9.1f}ms "
+              f"{cold['ready_ms']:9.1f}ms {warm['ready_ms']:9.1f}ms")
+    fastest = min(results, key=lambda profile: results[profile]['warm']['first_paint_ms'])
+    print(f"fastest warm first paint: {fastest}")
+    if args.log:
+        with open(args.log, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'time': time.time(), 'platform': sys.platform, 'runs': args.runs,
+                                'profiles': results}) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# 벤치마크 공용 도우미
+import os
+import statistics
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import m_clock
+from screen_provider import FixedScreenProvider
+from hotkeys import SyntheticBackend
+from history import HistoryWriter
+from checkpoint import Checkpoint
+
+
+class HeadlessOverlayTimer(m_clock.OverlayTimer):
+    # 합성 입력 백엔드로 1920x1080 고정 화면에 띄우는 벤치마크용 오버레이 (런 기록/체크포인트는 메모리에만)
+    def __init__(self):
+        self.painted_ns = []
+        super().__init__(FixedScreenProvider(1920, 1080), SyntheticBackend(), HistoryWriter(':memory:'),
+                         Checkpoint(None))
+        # 화면에 띄우지 않으므로 첫 페인트 뒤에 하던 준비를 바로 끝낸다
+        self.finish_startup()
+
+    def updateDisplay(self, seconds):
+        self.painted_ns.append(time.monotonic_ns())
+        return super().updateDisplay(seconds)
+
+
+def fmt_ms(values_ns):
+    ms = sorted(v / 1e6 for v in values_ns)
+    p99 = ms[int(len(ms) * 0.99) - 1] if len(ms) >= 100 else ms[-1]
+    return f"mean={statistics.fmean(ms):8.3f}ms  p99={p99:8.3f}ms  max={ms[-1]:8.3f}ms"
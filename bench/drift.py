@@ -0,0 +1,97 @@
+# 누적 드리프트 / 틱 지터 벤치마크
+#   python -m bench.drift                # 6, 10 시간 세션을 시뮬레이션
+#   python -m bench.drift --real 30      # 실제 time.sleep 으로 30초 측정
+import argparse
+import random
+import statistics
+import time
+
+from stopwatch import Stopwatch, NS_PER_SEC
+
+
+class SimulatedClock:
+    # 항상 조금 늦게 깨어나는 OS sleep 과 시그널 emit 비용을 흉내 내는 가짜 시계
+    def __init__(self, overshoot_ns, emit_cost_ns, seed=0):
+        self.now = 0
+        self.overshoot_ns = overshoot_ns
+        self.emit_cost_ns = emit_cost_ns
+        self._rng = random.Random(seed)
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, ns):
+        self.now += ns + self._rng.randint(0, self.overshoot_ns)
+
+    def emit(self):
+        self.now += self._rng.randint(0, self.emit_cost_ns)
+
+
+def run_legacy(clock, duration_ns):
+    # 기존 timer_function: time.sleep(1); seconds += 1
+    seconds = 0
+    lateness = []
+    while clock.now < duration_ns:
+        clock.sleep(NS_PER_SEC)
+        seconds += 1
+        lateness.append(clock.now - seconds * NS_PER_SEC)
+        clock.emit()
+    return clock.now // NS_PER_SEC - seconds, lateness
+
+
+def run_monotonic(clock, duration_ns):
+    stopwatch = Stopwatch(clock)
+    stopwatch.start()
+    displayed = 0
+    lateness = []
+    while clock.now < duration_ns:
+        clock.sleep(stopwatch.ns_until_next_second())
+        displayed = stopwatch.seconds
+        lateness.append(stopwatch.elapsed_ns() - displayed * NS_PER_SEC)
+        clock.emit()
+    return clock.now // NS_PER_SEC - displayed, lateness
+
+
+def run_real(seconds):
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    lateness = []
+    while stopwatch.seconds < seconds:
+        time.sleep(stopwatch.ns_until_next_second() / NS_PER_SEC)
+        elapsed = stopwatch.elapsed_ns()
+        lateness.append(elapsed % NS_PER_SEC)
+    return 0, lateness
+
+
+def report(name, drift_s, lateness):
+    ms = [x / 1e6 for x in lateness]
+    ms.sort()
+    p99 = ms[int(len(ms) * 0.99) - 1] if len(ms) >= 100 else ms[-1]
+    print(f"  {name:<10} ticks={len(ms):>6}  drift={drift_s:>4d}s  "
+          f"tick lateness mean={statistics.fmean(ms):9.3f}ms  p99={p99:9.3f}ms  max={ms[-1]:9.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--hours', type=float, nargs='+', default=[6, 10])
+    parser.add_argument('--overshoot-ms', type=float, default=2.0)
+    parser.add_argument('--emit-ms', type=float, default=0.5)
+    parser.add_argument('--real', type=int, default=0, help='실제 sleep 으로 측정할 초')
+    args = parser.parse_args()
+
+    if args.real:
+        print(f"real clock, {args.real}s")
+        report('monotonic', *run_real(args.real))
+        return
+
+    overshoot_ns = int(args.overshoot_ms * 1e6)
+    emit_ns = int(args.emit_ms * 1e6)
+    for hours in args.hours:
+        duration_ns = int(hours * 3600 * NS_PER_SEC)
+        print(f"simulated {hours:g}h, sleep overshoot <= {args.overshoot_ms}ms, emit <= {args.emit_ms}ms")
+        report('legacy', *run_legacy(SimulatedClock(overshoot_ns, emit_ns), duration_ns))
+        report('monotonic', *run_monotonic(SimulatedClock(overshoot_ns, emit_ns), duration_ns))
+
+
+if __name__ == '__main__':
+    main()
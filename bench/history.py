@@ -0,0 +1,74 @@
+# 런 기록 SQLite 벤치마크: 합성 런을 대량으로 넣고 PB / 구간 최고 / 최근 N 조회 시간을 잰다
+#   python -m bench.history --runs 100000 --splits 10
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from history import History, HistoryWriter, RunRecord
+from stopwatch import NS_PER_SEC
+
+CATEGORIES = ('any%', 'act1-10', 'league start', 'mapping')
+
+
+def synthetic_runs(count, split_count, seed):
+    rng = random.Random(seed)
+    started_at = time.time() - count * 3600
+    for i in range(count):
+        marks = []
+        elapsed = 0
+        for _ in range(split_count):
+            elapsed += rng.randint(120, 900) * NS_PER_SEC + rng.randrange(NS_PER_SEC)
+            marks.append(elapsed)
+        completed = rng.random() < 0.7
+        yield RunRecord(rng.choice(CATEGORIES), started_at + i * 3600, elapsed, completed, marks)
+
+
+def time_query(function, repeat):
+    t0 = time.perf_counter_ns()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter_ns() - t0) / repeat / 1e6, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=100_000)
+    parser.add_argument('--splits', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'history.db')
+        writer = HistoryWriter(path)
+        # GUI 스레드 쪽 비용: 큐에 넣는 시간만
+        add_ns = 0
+        for record in synthetic_runs(args.runs, args.splits, args.seed):
+            t0 = time.perf_counter_ns()
+            writer.add(record)
+            add_ns += time.perf_counter_ns() - t0
+        t0 = time.perf_counter_ns()
+        writer.close()
+        drain_s = (time.perf_counter_ns() - t0) / 1e9
+        size_mb = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)) / 1e6
+        print(f"runs={args.runs} splits/run={args.splits}  add()={add_ns / args.runs:.0f}ns/run  "
+              f"writer drain={drain_s:.2f}s  db={size_mb:.1f}MB")
+
+        history = History(path)
+        queries = [
+            ('personal_best', lambda: history.personal_best('any%')),
+            ('personal_bests', history.personal_bests),
+            ('best_segments', lambda: history.best_segments('any%')),
+            ('last_runs(10)', lambda: history.last_runs(10)),
+            ('run_splits(pb)', lambda: history.run_splits(history.personal_best('any%')[0])),
+        ]
+        for name, function in queries:
+            ms, _ = time_query(function, args.repeat)
+            print(f"  {name:<16} {ms:8.3f}ms")
+        history.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# 전역 키보드 훅 이벤트당 비용 마이크로 벤치마크
+#   python -m bench.hook_cost                      # 합성 전투 입력 스트림
+#   python -m bench.hook_cost --stream keys.txt    # 기록된 스트림 ("down 17" / "up 17" 한 줄에 하나)
+#   python -m bench.hook_cost --save keys.txt      # 합성 스트림을 파일로 저장
+#
+# keyboard 라이브러리가 이벤트마다 핸들러를 찾는 경로를 그대로 옮겨,
+#   add_hotkey: 눌린 키 전체를 정렬한 튜플로 핫키 테이블 조회 후 콜백(lambda) 실행
+#   hook_key  : 스캔 코드로 키 테이블 조회 후 ScanCodeHotkeys.on_event 실행
+# 두 방식의 이벤트당 시간과 메모리 할당을 비교한다. OS 훅 자체 비용은 두 방식이 같으므로 제외.
+import argparse
+import collections
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from hotkeys import ScanCodeHotkeys
+
+# Windows set-1 스캔 코드
+HOTKEY_SCAN_CODES = {60: 'reset', 61: 'start', 62: 'toggle', 64: 'lock', 65: 'close'}
+# 전투 중 자주 누르는 키: q w e r t, 1-5, space, shift, ctrl, alt
+GAME_SCAN_CODES = [16, 17, 18, 19, 20, 2, 3, 4, 5, 6, 57, 42, 29, 56]
+
+
+class Event:
+    __slots__ = ('event_type', 'scan_code')
+
+    def __init__(self, event_type, scan_code):
+        self.event_type = event_type
+        self.scan_code = scan_code
+
+
+def synthetic_stream(count, seed=0):
+    # 게임 키를 누르고 떼는 사이 가끔 F 키를 섞고, 일부 키는 자동 반복으로 여러 번 KEY_DOWN
+    rng = random.Random(seed)
+    events = []
+    while len(events) < count:
+        if rng.random() < 0.01:
+            scan_code = rng.choice(list(HOTKEY_SCAN_CODES))
+        else:
+            scan_code = rng.choice(GAME_SCAN_CODES)
+        repeats = 1 + (rng.random() < 0.1) * rng.randint(1, 20)
+        events.extend(Event('down', scan_code) for _ in range(repeats))
+        events.append(Event('up', scan_code))
+    return events[:count]
+
+
+def load_stream(path):
+    events = []
+    with open(path) as f:
+        for line in f:
+            event_type, scan_code = line.split()
+            events.append(Event(event_type, int(scan_code)))
+    return events
+
+
+def save_stream(path, events):
+    with open(path, 'w') as f:
+        for event in events:
+            f.write(f"{event.event_type} {event.scan_code}\n")
+
+
+def add_hotkey_dispatch(post):
+    # keyboard.add_hotkey 등록 + _KeyboardListener.direct_callback/pre_process_event 의 핫키 조회
+    pressed = {}
+    lock = threading.Lock()
+    hotkeys = collections.defaultdict(list)
+    for scan_code, command in HOTKEY_SCAN_CODES.items():
+        callback = lambda command=command: post(command)
+        hotkeys[(scan_code,)].append(lambda e, callback=callback: e.event_type == 'down' and callback())
+
+    def dispatch(event):
+        with lock:
+            if event.event_type == 'down':
+                pressed[event.scan_code] = event
+            hotkey = tuple(sorted(pressed))
+            if event.event_type == 'up':
+                pressed.pop(event.scan_code, None)
+        for callback in hotkeys[hotkey]:
+            callback(event)
+    return dispatch
+
+
+def hook_key_dispatch(post):
+    # keyboard.hook_key 등록 + _KeyboardListener.pre_process_event 의 스캔 코드 조회
+    keys = collections.defaultdict(list)
+    hotkeys = ScanCodeHotkeys(dict(HOTKEY_SCAN_CODES), post)
+    for scan_code in HOTKEY_SCAN_CODES:
+        keys[scan_code].append(hotkeys.on_event)
+
+    def dispatch(event):
+        for key_hook in keys[event.scan_code]:
+            key_hook(event)
+    return dispatch
+
+
+def measure(make_dispatch, events, rounds):
+    # 명령 수는 따로 세고, 측정할 때는 아무것도 하지 않는 post 를 쓴다
+    posted = []
+    count = make_dispatch(posted.append)
+    for event in events:
+        count(event)
+
+    dispatch = make_dispatch(lambda command: None)
+    # 예열: defaultdict 키, set 크기 등을 미리 채운다
+    for event in events:
+        dispatch(event)
+
+    best = float('inf')
+    for _ in range(rounds):
+        t0 = time.perf_counter_ns()
+        for event in events:
+            dispatch(event)
+        best = min(best, time.perf_counter_ns() - t0)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for event in events:
+        dispatch(event)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return best / len(events), peak, grown, len(posted)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=int, default=200_000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--stream')
+    parser.add_argument('--save')
+    args = parser.parse_args()
+
+    events = load_stream(args.stream) if args.stream else synthetic_stream(args.events)
+    if args.save:
+        save_stream(args.save, events)
+        return
+
+    downs = sum(e.event_type == 'down' for e in events)
+    print(f"{len(events)} events ({downs} key-down), python {sys.version.split()[0]}")
+    for name, make_dispatch in (('add_hotkey', add_hotkey_dispatch), ('hook_key', hook_key_dispatch)):
+        ns, peak, grown, posted = measure(make_dispatch, events, args.rounds)
+        print(f"  {name:<10} {ns:7.1f} ns/event  traced peak {peak} B  retained {grown:+d} B  "
+              f"commands posted={posted}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# 핫키 → 화면 상태 반영 지연 벤치마크 (offscreen Qt)
+#   QT_QPA_PLATFORM=offscreen python -m bench.hotkey_latency
+#
+# legacy : 기존 스레드-per-run 모델. 일시정지/리셋이 핫키 스레드에서 join 으로 막힌다.
+# current: SyntheticBackend 가 훅 스레드처럼 F 키를 누르고, 명령 큐 → Qt 이벤트 루프로 처리된다.
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from bench.common import HeadlessOverlayTimer, fmt_ms
+from hotkeys import DEFAULT_BINDINGS
+
+
+class LegacyThreadTimer:
+    # baseline 의 start_timer / toggle_timer / reset_timer 를 그대로 옮긴 것
+    def __init__(self):
+        self.seconds = 0
+        self.is_running = False
+        self.timer_thread = None
+
+    def timer_function(self):
+        while self.is_running:
+            time.sleep(1)
+            self.seconds += 1
+
+    def start_timer(self):
+        if not self.is_running:
+            self.is_running = True
+            self.timer_thread = threading.Thread(target=self.timer_function)
+            self.timer_thread.start()
+
+    def toggle_timer(self):
+        if self.is_running:
+            self.is_running = False
+            if self.timer_thread:
+                self.timer_thread.join()
+        else:
+            self.start_timer()
+
+    def reset_timer(self):
+        self.is_running = False
+        if self.timer_thread:
+            self.timer_thread.join()
+        self.seconds = 0
+
+
+def key_sequence(count, seed=0):
+    # 매 키가 화면 상태를 바꾸도록 F3 은 멈춰 있을 때만 누른다
+    rng = random.Random(seed)
+    keys = []
+    running = False
+    for _ in range(count):
+        key = rng.choice(['toggle', 'toggle', 'reset'] + ([] if running else ['start']))
+        running = key != 'reset' and not running
+        keys.append(key)
+    return keys
+
+
+def run_legacy(keys, gap_s):
+    timer = LegacyThreadTimer()
+    actions = {'start': timer.start_timer, 'toggle': timer.toggle_timer, 'reset': timer.reset_timer}
+    latencies = []
+    for key in keys:
+        time.sleep(gap_s)
+        t0 = time.monotonic_ns()
+        actions[key]()
+        # 기존 모델은 콜백이 끝나야 emit 이 가능하므로 콜백 소요 시간이 지연의 하한
+        latencies.append(time.monotonic_ns() - t0)
+    timer.reset_timer()
+    return latencies, latencies
+
+
+def run_current(keys, gap_s):
+    app = QApplication.instance() or QApplication(sys.argv)
+    timer = HeadlessOverlayTimer()
+    timer.show()
+    backend = timer.input_backend
+    # 합성 백엔드가 훅 스레드 역할을 하며 F 키를 누른다
+    key_names = {command: key for key, command in DEFAULT_BINDINGS.items()}
+    player = backend.play([(gap_s, key_names[key]) for key in keys] + [(gap_s, None)])
+
+    def quit_when_done():
+        if not player.is_alive():
+            app.quit()
+
+    poll = QTimer()
+    poll.timeout.connect(quit_when_done)
+    poll.start(50)
+    app.exec_()
+
+    latencies = []
+    blocked = []
+    for key, t0, t1 in backend.sent:
+        blocked.append(t1 - t0)
+        # KEY_DOWN 이후 처음으로 실행된 updateDisplay 시각
+        after = [t for t in timer.painted_ns if t >= t0]
+        if after:
+            latencies.append(after[0] - t0)
+    timer.tick_timer.stop()
+    print(f"  current  coalesced/dropped commands={timer.command_queue.dropped}")
+    for name, (count, mean_ms, max_ms) in sorted(timer.command_queue.latency.summary().items()):
+        print(f"  current  {name:<6} input->paint n={count:<3d} mean={mean_ms:8.3f}ms  max={max_ms:8.3f}ms")
+    return latencies, blocked
+
+
+def report(name, latencies, blocked):
+    print(f"  {name:<8} key->state {fmt_ms(latencies)}")
+    print(f"  {'':<8} hook blocked {fmt_ms(blocked)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--keys', type=int, default=30)
+    # 명령 큐가 자동 반복으로 합치지 않도록 반복 간격보다 길게 누른다
+    parser.add_argument('--gap-ms', type=float, default=600)
+    args = parser.parse_args()
+
+    keys = key_sequence(args.keys)
+    gap_s = args.gap_ms / 1000
+    print(f"{args.keys} hotkeys, {args.gap_ms:g}ms apart")
+    report('legacy', *run_legacy(keys, gap_s))
+    report('current', *run_current(keys, gap_s))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# 유휴 상태 벤치마크: 상태별로 이벤트 루프가 깨어난 횟수/초와 CPU 시간
+#   python -m bench.idle --seconds 5
+#
+# 앱 전체 이벤트 필터로 타이머/소켓 알림/큐 시그널/페인트 이벤트를 센다.
+# Client.txt 감시는 윈도우처럼 1초 느린 확인을 켠 채로 띄운다. 그 확인은 지역 이동이 타이머를
+# 바꿀 수 있는 상태(0 에서 자동 시작 대기, 은신처 자동 멈춤, 달리는 중)에서만 돈다.
+import argparse
+import os
+import tempfile
+import time
+
+from bench.common import HeadlessOverlayTimer
+from PyQt5.QtCore import QEvent, QEventLoop, QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+from log_watcher import ClientLogWatcher
+
+COUNTED = {
+    QEvent.Timer: 'timer',
+    QEvent.SockAct: 'socket',
+    QEvent.MetaCall: 'signal',
+    QEvent.UpdateRequest: 'paint',
+}
+
+
+class WakeupCounter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.counts = dict.fromkeys(COUNTED.values(), 0)
+
+    def eventFilter(self, obj, event):
+        name = COUNTED.get(event.type())
+        if name is not None:
+            self.counts[name] += 1
+        return False
+
+    def reset(self):
+        for name in self.counts:
+            self.counts[name] = 0
+
+
+def measure(app, counter, seconds):
+    # 측정 창을 닫는 타이머 한 번은 빼고 센다
+    loop = QEventLoop()
+    counter.reset()
+    cpu0 = time.process_time()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+    cpu = time.process_time() - cpu0
+    counter.counts['timer'] -= 1
+    return {name: count / seconds for name, count in counter.counts.items()}, cpu / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    counter = WakeupCounter()
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, 'Client.txt')
+        open(log_path, 'w').close()
+
+        w = HeadlessOverlayTimer()
+        w.log_watcher = ClientLogWatcher(log_path, poll_ms=1000, parent=w)
+        w.log_watcher.zone_entered.connect(w.on_zone_entered)
+        w.show()
+        app.processEvents()
+        app.installEventFilter(counter)
+
+        results = []
+        w.schedule_tick()
+        results.append(('zero', measure(app, counter, args.seconds)))
+        w.start_timer()
+        results.append(('running', measure(app, counter, args.seconds)))
+        w.toggle_timer()
+        results.append(('paused', measure(app, counter, args.seconds)))
+        # 은신처에서 자동으로 멈춘 상태: 나가면 다시 달려야 하므로 느린 확인은 켜 둔다
+        w.toggle_timer()
+        w.on_zone_entered('Celestial Hideout')
+        results.append(('hideout', measure(app, counter, args.seconds)))
+
+        app.removeEventFilter(counter)
+        w.log_watcher.close()
+        w.hide()
+
+    names = list(COUNTED.values())
+    print(f"{'state':8s} " + ' '.join(f"{name + '/s':>9s}" for name in names) + f" {'total/s':>9s} {'cpu':>7s}")
+    for state, (rates, cpu) in results:
+        print(f"{state:8s} " + ' '.join(f"{rates[name]:9.2f}" for name in names)
+              + f" {sum(rates.values()):9.2f} {cpu * 100:6.2f}%")
+
+
+if __name__ == '__main__':
+    main()
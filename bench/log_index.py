@@ -0,0 +1,88 @@
+# Client.txt 색인 벤치마크: 가짜 로그를 만들어 전체 색인 / 이어서 색인 / 조회 속도를 잰다
+#   python -m bench.log_index --mb 1024
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from log_index import LogIndex
+
+ZONES = ['The Twilight Strand', "Lioneye's Watch", 'The Coast', 'The Mud Flats', 'Celestial Hideout',
+         'Strand Map', 'Tower Map', 'Dunes Map', 'The Rogue Harbour', 'Cemetery Map']
+
+
+def write_log(path, megabytes, seed, start, mode='wb'):
+    # 대부분은 DEBUG 잡음, 가끔 채팅 / 지역 이동 / 레벨업 / 사망 줄. 시각은 줄마다 조금씩 증가.
+    rng = random.Random(seed)
+    stamp = start
+    target = megabytes << 20
+    written = 0
+    with open(path, mode) as f:
+        while written < target:
+            lines = []
+            for _ in range(10_000):
+                stamp += rng.random() * 0.5
+                head = time.strftime('%Y/%m/%d %H:%M:%S', time.gmtime(stamp))
+                roll = rng.random()
+                if roll < 0.004:
+                    body = f"[INFO Client 1234] : You have entered {rng.choice(ZONES)}."
+                elif roll < 0.005:
+                    body = f"[INFO Client 1234] : Hero (Witch) is now level {rng.randint(2, 100)}"
+                elif roll < 0.0055:
+                    body = "[INFO Client 1234] : Hero has been slain."
+                elif roll < 0.05:
+                    body = f"[INFO Client 1234] #Someone: wtb {rng.randint(1, 99)} chaos"
+                else:
+                    body = "[DEBUG Client 1234] Got Instance Details from login server"
+                lines.append(f"{head} {rng.randint(0, 1 << 30)} cffb0719 {body}\r\n")
+            block = ''.join(lines).encode()
+            f.write(block)
+            written += len(block)
+    return stamp, written
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mb', type=int, default=1024)
+    parser.add_argument('--append-mb', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'Client.txt')
+        t0 = time.perf_counter()
+        stamp, size = write_log(path, args.mb, args.seed, 1_700_000_000)
+        print(f"generated {size / 1e6:.0f}MB log in {time.perf_counter() - t0:.1f}s")
+
+        index = LogIndex(path)
+        t0 = time.perf_counter()
+        added = index.update()
+        elapsed = time.perf_counter() - t0
+        index_size = os.path.getsize(index.index_path) + os.path.getsize(index.zones_path)
+        print(f"full build   {added} events  {elapsed:.2f}s  {size / 1e6 / elapsed:.0f} MB/s  "
+              f"index={index_size / 1e3:.0f}KB")
+
+        _, appended = write_log(path, args.append_mb, args.seed + 1, stamp, 'ab')
+        t0 = time.perf_counter()
+        reopened = LogIndex(path)
+        added = reopened.update()
+        elapsed = time.perf_counter() - t0
+        print(f"incremental  {added} events  {elapsed:.3f}s  for {appended / 1e6:.0f}MB appended  "
+              f"({appended / 1e6 / elapsed:.0f} MB/s)")
+
+        t0 = time.perf_counter()
+        reopened.update()
+        print(f"no-op update {(time.perf_counter() - t0) * 1e3:.2f}ms")
+
+        t0 = time.perf_counter()
+        totals = reopened.zone_times()
+        print(f"zone_times   {(time.perf_counter() - t0) * 1e3:.1f}ms over {reopened.count} events, "
+              f"top: {max(totals, key=totals.get)}")
+        t0 = time.perf_counter()
+        reopened.zone_times(since=int(stamp) - 86400)
+        print(f"zone_times(last day) {(time.perf_counter() - t0) * 1e3:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# Client.txt 테일러 확인/측정 (offscreen Qt, 로컬에 쓰는 가짜 로그)
+#   python -m bench.log_tail --prefill-mb 500 --idle 5
+#
+# 큰 로그를 미리 만들어 두고(끝에서부터 읽으므로 크기와 무관해야 함), 다른 스레드가
+# 게임처럼 지역 이동 줄을 덧붙이는 동안 오버레이가 자동 시작/스플릿/멈춤하는지 보고,
+# 쓰기 → 반영 지연, 잘림/로테이션 처리, 아무것도 쓰지 않을 때의 CPU 를 잰다.
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from bench.common import HeadlessOverlayTimer, fmt_ms
+
+FILLER = b'2023/08/20 14:23:11 123456789 cffb0719 [DEBUG Client 12345] Got Instance Details from login server\n'
+CHAT = b"2023/08/20 14:23:11 123456789 cffb0719 [INFO Client 12345] #Someone: ] : You have entered Fake Zone.\n"
+
+
+def zone_line(zone):
+    stamp = time.strftime('%Y/%m/%d %H:%M:%S').encode()
+    return stamp + b' 123456789 cffb0719 [INFO Client 12345] : You have entered ' + zone.encode() + b'.\r\n'
+
+
+def prefill(path, megabytes):
+    block = FILLER * ((1 << 20) // len(FILLER) + 1)
+    with open(path, 'wb') as f:
+        for _ in range(megabytes):
+            f.write(block[:1 << 20])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--prefill-mb', type=int, default=200)
+    parser.add_argument('--idle', type=float, default=3, help='아무것도 쓰지 않고 CPU 를 재는 시간 (초)')
+    parser.add_argument('--gap-ms', type=float, default=200)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'Client.txt')
+    t0 = time.perf_counter()
+    prefill(path, args.prefill_mb)
+    print(f"prefilled {args.prefill_mb}MB in {time.perf_counter() - t0:.1f}s")
+
+    timer = HeadlessOverlayTimer()
+    timer.show()
+    events = []  # (지역, 반영 시각)
+    on_zone = timer.on_zone_entered
+
+    def record(zone):
+        events.append((zone, time.monotonic_ns()))
+        on_zone(zone)
+
+    timer.settings.log_path = path
+    t0 = time.perf_counter()
+    timer.start_log_watcher()
+    timer.log_watcher.zone_entered.disconnect()
+    timer.log_watcher.zone_entered.connect(record)
+    print(f"watcher attached in {(time.perf_counter() - t0) * 1e3:.2f}ms, offset={timer.log_watcher.tail.offset}")
+
+    script = [
+        ('zone', 'The Twilight Strand'),  # 시작
+        ('zone', 'Lioneye\'s Watch'),  # 스플릿
+        ('chat', None),  # 채팅 속 같은 문구는 무시돼야 함
+        ('zone', 'The Coast'),  # 스플릿
+        ('zone', 'Celestial Hideout'),  # 멈춤
+        ('zone', 'The Mud Flats'),  # 다시 달림
+        ('truncate', None),
+        ('zone', 'The Tidal Island'),  # 잘린 뒤 스플릿
+        ('rotate', None),
+        ('zone', 'The Ledge'),  # 로테이션 뒤 스플릿
+    ]
+    written = []
+    cpu_idle = []
+
+    def writer():
+        gap = args.gap_ms / 1000
+        f = open(path, 'ab')
+        for action, zone in script:
+            time.sleep(gap)
+            if action == 'zone':
+                f.write(zone_line(zone))
+                f.flush()
+                written.append((zone, time.monotonic_ns()))
+            elif action == 'chat':
+                f.write(CHAT)
+                f.flush()
+            elif action == 'truncate':
+                f.truncate(0)
+            elif action == 'rotate':
+                f.close()
+                os.replace(path, path + '.1')
+                f = open(path, 'ab')
+        f.close()
+        # 유휴 CPU: 아무것도 쓰지 않는 동안 프로세스 CPU 시간
+        cpu0 = time.process_time()
+        time.sleep(args.idle)
+        cpu_idle.append(time.process_time() - cpu0)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    poll = QTimer()
+    poll.timeout.connect(lambda: thread.is_alive() or app.quit())
+    poll.start(100)
+    app.exec_()
+
+    print(f"zones seen: {[zone for zone, _ in events]}")
+    print(f"splits={len(timer.splits)} running={timer.is_running} elapsed={timer.stopwatch.elapsed_ns() / 1e9:.2f}s")
+    latencies = []
+    seen = dict(events)
+    for zone, t in written:
+        if zone in seen:
+            latencies.append(seen[zone] - t)
+    print(f"write -> zone event {fmt_ms(latencies)}  ({len(latencies)}/{len(written)})")
+    print(f"idle cpu {cpu_idle[0] / args.idle * 100:.3f}% over {args.idle:g}s, bytes read={timer.log_watcher.bytes_read}")
+    timer.log_watcher.close()
+    timer.hide()
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# 다중 타이머 벤치마크: 타이머마다 스레드 (기존 timer_function 방식) vs 힙 스케줄러 하나
+#   python -m bench.multi_timer --counts 1 10 100 1000 --seconds 5
+#
+# 타이머는 서로 다른 위상(0~1초)에서 시작한다. 깨어난 횟수/초와 프로세스 CPU 시간을 잰다.
+import argparse
+import random
+import threading
+import time
+
+from stopwatch import NS_PER_SEC
+from timers import NamedStopwatch, TimerScheduler
+
+
+def run_threads(count, seconds, seed):
+    # 타이머마다 time.sleep(1) 루프를 도는 스레드
+    rng = random.Random(seed)
+    stop = threading.Event()
+    wakeups = [0] * count
+
+    def loop(i, phase):
+        time.sleep(phase)
+        while not stop.is_set():
+            time.sleep(1)
+            wakeups[i] += 1
+
+    threads = [threading.Thread(target=loop, args=(i, rng.random()), daemon=True) for i in range(count)]
+    cpu0 = time.process_time()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    cpu = time.process_time() - cpu0
+    for thread in threads:
+        thread.join()
+    return sum(wakeups), cpu
+
+
+def run_heap(count, seconds, seed, slack_ns):
+    # 힙 스케줄러 하나가 가장 이른 마감에만 깨어나 마감이 지난 타이머만 갱신한다
+    rng = random.Random(seed)
+    scheduler = TimerScheduler(slack_ns=slack_ns)
+    start = time.monotonic_ns()
+    timers = []
+    for i in range(count):
+        timer = NamedStopwatch(str(i))
+        # 위상을 흩어 놓기 위해 기준점을 과거로 당긴다
+        timer.restore(0, start - int(rng.random() * NS_PER_SEC))
+        scheduler.add(timer, start)
+        timers.append(timer)
+
+    end = start + seconds * NS_PER_SEC
+    late = 0
+    updated = 0
+    cpu0 = time.process_time()
+    while True:
+        wake = scheduler.next_wake_ns()
+        now = time.monotonic_ns()
+        if wake >= end:
+            break
+        if wake > now:
+            time.sleep((wake - now) / 1e9)
+        now = time.monotonic_ns()
+        deadline = scheduler.next_deadline_ns()
+        late = max(late, now - deadline)
+        for timer in scheduler.pop_due(now):
+            timer.display()
+            updated += 1
+    cpu = time.process_time() - cpu0
+    return scheduler.wakeups, updated, cpu, late
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--slack-ms', type=float, nargs='+', default=[0, 2, 16])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'timers':>6}  {'model':<12}  {'wakeups/s':>10}  {'updates/s':>10}  {'cpu %':>7}  {'max late':>9}")
+    for count in args.counts:
+        wakeups, cpu = run_threads(count, args.seconds, args.seed)
+        print(f"{count:>6}  {'threads':<12}  {wakeups / args.seconds:10.1f}  {wakeups / args.seconds:10.1f}  "
+              f"{cpu / args.seconds * 100:6.2f}%  {'-':>9}")
+        for slack_ms in args.slack_ms:
+            wakeups, updated, cpu, late = run_heap(count, args.seconds, args.seed, int(slack_ms * 1e6))
+            label = f"heap/{slack_ms:g}ms"
+            print(f"{count:>6}  {label:<12}  {wakeups / args.seconds:10.1f}  {updated / args.seconds:10.1f}  "
+                  f"{cpu / args.seconds * 100:6.2f}%  {late / 1e6:7.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
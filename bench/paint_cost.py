@@ -0,0 +1,129 @@
+# 오버레이 페인트 비용 벤치마크 (offscreen Qt)
+#   python -m bench.paint_cost --frames 2000
+#
+# stylesheet: baseline. QLCDNumber 자식 + paintEvent 마다 lcd.setStyleSheet
+# palette   : QLCDNumber 자식 + 상태 전환 시에만 팔레트 적용
+# atlas     : 현재 구현. 글리프 아틀라스에서 바뀐 글자 칸만 부분 갱신
+import argparse
+import sys
+import time
+
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtGui import QPainter, QPalette
+from PyQt5.QtWidgets import QApplication, QLCDNumber
+
+from bench.common import HeadlessOverlayTimer, fmt_ms
+from digit_renderer import BACKGROUND
+
+
+class PaintCounter(QObject):
+    # 페인트 이벤트 수와 다시 그린 면적(픽셀)을 센다
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.area = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.count += 1
+            for rect in event.region().rects():
+                self.area += rect.width() * rect.height()
+        return False
+
+
+class LcdOverlayTimer(HeadlessOverlayTimer):
+    restyle_on_paint = True
+
+    def __init__(self):
+        self.lcd = None
+        super().__init__()
+        self.lcd = QLCDNumber(self)
+        self.lcd.setDigitCount(8)
+        self.lcd.setSegmentStyle(QLCDNumber.Flat)
+        self.lcd.setAutoFillBackground(True)
+        self.lcd.resize(self.width(), self.height())
+        self.style_key = None
+        self.apply_state_style()
+
+    def updateDisplay(self, seconds):
+        if self.lcd is None:
+            return
+        m, s = divmod(seconds, 60)
+        h, m = divmod(m, 60)
+        self.lcd.display(f"{h:02d}:{m:02d}:{s:02d}")
+        self.apply_state_style()
+        self.update()
+
+    def apply_state_style(self):
+        key = (self.session.state(), self.is_locked)
+        if self.lcd is None or key == self.style_key:
+            return False
+        self.style_key = key
+        digit_color, self.border_pen = self.state_styles[key]
+        if not self.restyle_on_paint:
+            palette = QPalette()
+            palette.setColor(QPalette.Window, BACKGROUND)
+            palette.setColor(QPalette.WindowText, digit_color)
+            self.lcd.setPalette(palette)
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self.border_pen)
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        if self.restyle_on_paint:
+            color = self.state_styles[self.style_key][0]
+            self.lcd.setStyleSheet(f"background-color: rgba(0, 0, 0, 100); color: {color.name()};")
+
+
+class PaletteLcdOverlayTimer(LcdOverlayTimer):
+    restyle_on_paint = False
+
+
+def measure(app, cls, frames):
+    timer = cls()
+    timer.show()
+    counter = PaintCounter()
+    for widget in timer.findChildren(QObject) + [timer]:
+        widget.installEventFilter(counter)
+    app.processEvents()
+    counter.count = counter.area = 0
+
+    # 첫 틱 전에 실행 상태로 두어 색상 전환이 섞이지 않게 한다
+    timer.stopwatch.start()
+    timer.updateDisplay(0)
+    app.processEvents()
+    counter.count = counter.area = 0
+
+    frame_ns = []
+    for i in range(1, frames + 1):
+        t0 = time.perf_counter_ns()
+        timer.updateDisplay(i)
+        # 예약된 페인트(스타일 재적용으로 생긴 것 포함)를 모두 처리
+        app.processEvents()
+        frame_ns.append(time.perf_counter_ns() - t0)
+    timer.stopwatch.reset()
+    timer.hide()
+    return frame_ns, counter.count / frames, counter.area / frames
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=2000)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{args.frames} ticks, offscreen, 96x27 overlay")
+    variants = (
+        ('stylesheet', LcdOverlayTimer),
+        ('palette', PaletteLcdOverlayTimer),
+        ('atlas', HeadlessOverlayTimer),
+    )
+    for name, cls in variants:
+        frame_ns, paints, area = measure(app, cls, args.frames)
+        print(f"  {name:<10} frame {fmt_ms(frame_ns)}  paint events/tick={paints:.2f}  painted px/tick={area:.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+# PyInstaller 런타임 훅 (m_clock.spec --probe 로 빌드할 때만 들어간다).
+# M_CLOCK_STARTUP_PROBE 경로가 주어지면 첫 페인트와 지연 준비(finish_startup)가 끝난 시각을
+# monotonic ns 로 그 파일에 쓰고 종료한다. 창 모드 EXE 는 stdout 이 없어서 파일로 넘긴다.
+import json
+import os
+import time
+
+path = os.environ.get('M_CLOCK_STARTUP_PROBE')
+if path:
+    marks = {'main': time.monotonic_ns()}
+    from PyQt5 import QtWidgets
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+
+    def done():
+        marks['ready'] = time.monotonic_ns()
+        with open(path, 'w') as f:
+            json.dump(marks, f)
+        QtWidgets.QApplication.instance().quit()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint' not in marks:
+                marks['first_paint'] = time.monotonic_ns()
+                # 페인트가 걸어 둔 finish_startup 이 먼저 돌도록 한 바퀴 더 돌고 끝낸다
+                QTimer.singleShot(0, lambda: QTimer.singleShot(0, done))
+            return False
+
+    class ProbeApplication(QtWidgets.QApplication):
+        # m_clock 이 from PyQt5.QtWidgets import QApplication 으로 가져가기 전에 바꿔 둔다
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.first_paint = FirstPaint()
+            self.installEventFilter(self.first_paint)
+
+    QtWidgets.QApplication = ProbeApplication
@@ -0,0 +1,96 @@
+# 가상 시계 재생 벤치마크: 기록된 세션을 기다리지 않고(또는 원하는 배속으로) TimerSession 에 다시 돌린다
+#   python -m bench.replay                          # 10시간짜리 합성 세션 (지역 이동/스플릿/카운트다운)
+#   python -m bench.replay --recording run.jsonl    # python main.py run --record run.jsonl 로 남긴 명령
+#   python -m bench.replay --client-log Client.txt  # Client.txt 지역 이동을 자동 스플릿으로
+#   python -m bench.replay --speed 3600             # 한 시간을 1초에 (실제로 기다림)
+#
+# 같은 입력을 두 번 돌려 표시/스플릿/알림이 같은지도 확인한다.
+import argparse
+import random
+import time
+
+from client_log import DEFAULT_AUTOSPLIT, AutoSplitter
+from clock import VirtualClock
+from replay import Replay, log_events, read_recording
+from session import TimerSession
+from stopwatch import NS_PER_SEC
+
+TICK_SLACK_NS = 2_000_000  # m_clock.TICK_SLACK_NS 와 같게 (Qt 없이 돌리려고 따로 둔다)
+TIMERS = [
+    ('flask', 'countdown', 4.8, (1, 0)),
+    ('buff', 'countdown', 60, (10, 0)),
+    ('map', 'stopwatch', 0, ()),
+]
+ZONES = ['The Twilight Strand', 'The Coast', 'The Mud Flats', 'The Submerged Passage', 'The Ledge',
+         'The Climb', 'The Lower Prison', 'Prisoner\'s Gate', 'The Ship Graveyard', 'Lioneye\'s Watch']
+
+
+def synthetic(hours, seed):
+    # 지역을 30초~3분마다 옮기고, 가끔 은신처에 들르고, 플라스크 카운트다운을 수시로 다시 시작한다.
+    # 한 시간쯤마다 런을 끝내고(reset) 첫 지역에서 새로 시작한다
+    rng = random.Random(seed)
+    end_ns = int(hours * 3600 * NS_PER_SEC)
+    t = 0
+    run_end = 0
+    while t < end_ns:
+        if t >= run_end:
+            yield t, 'reset', None
+            yield t, 'zone', ZONES[0]
+            run_end = t + rng.randint(45, 75) * 60 * NS_PER_SEC
+        t += rng.randint(30, 180) * NS_PER_SEC
+        for _ in range(rng.randint(2, 12)):
+            yield t + rng.randint(0, 30) * NS_PER_SEC, 'countdown', None
+        t += 30 * NS_PER_SEC
+        if rng.random() < 0.1:
+            yield t, 'zone', 'Celestial Hideout'
+            t += rng.randint(10, 120) * NS_PER_SEC
+        yield t, 'zone', rng.choice(ZONES[1:])
+
+
+def load_events(args):
+    if args.recording:
+        with open(args.recording, encoding='utf-8') as f:
+            return list(read_recording(f))
+    if args.client_log:
+        from log_index import LogIndex
+        index = LogIndex(args.client_log)
+        index.update()
+        return list(log_events(index))
+    return sorted(synthetic(args.hours, args.seed), key=lambda event: event[0])
+
+
+def replay(events, speed):
+    clock = VirtualClock(wall_start_ns=1_700_000_000 * NS_PER_SEC)
+    session = TimerSession(clock, slack_ns=TICK_SLACK_NS)
+    session.set_timers(TIMERS)
+    session.autosplitter = AutoSplitter(*DEFAULT_AUTOSPLIT.values())
+    t0 = time.perf_counter()
+    player = Replay(session, clock, speed=speed).run(events)
+    wall_s = time.perf_counter() - t0
+    result = (session.display_text(), list(session.splits.marks), player.alerts, player.ticks)
+    return player, wall_s, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--recording', help='python main.py run --record 로 남긴 JSONL')
+    parser.add_argument('--client-log', help='Client.txt (옆에 .idx 색인을 만들거나 이어서 쓴다)')
+    parser.add_argument('--hours', type=float, default=10, help='합성 세션 길이')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--speed', type=float, default=0, help='배속 (0 이면 기다리지 않음)')
+    args = parser.parse_args()
+
+    events = load_events(args)
+    player, wall_s, first = replay(events, args.speed)
+    simulated_s = player.elapsed_ns() / NS_PER_SEC
+    print(f"events {player.events}  ticks {player.ticks}  alerts {len(player.alerts)}")
+    print(f"  simulated {simulated_s / 3600:8.2f}h  wall {wall_s * 1000:8.1f}ms"
+          f"  ({simulated_s / max(wall_s, 1e-9):,.0f}x real time, {wall_s / max(player.ticks, 1) * 1e6:.2f}us/tick)")
+    print(f"  final    {first[0]}  splits {len(first[1])}")
+    if args.speed == 0:
+        _, _, second = replay(events, 0)
+        print(f"  deterministic {'yes' if first == second else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# 타이머 코어 벤치마크: GUI 없이 TimerSession 상태 전환 / 틱 처리량 (가짜 시계, 저장소 없음)
+#   python -m bench.session --transitions 1000000 --timers 4
+import argparse
+import time
+
+from clock import VirtualClock
+from session import TimerSession
+from stopwatch import NS_PER_SEC
+
+
+class StepClock(VirtualClock):
+    # 부를 때마다 step_ns 씩 가는 가상 시계
+    __slots__ = ('step_ns',)
+
+    def __init__(self, step_ns):
+        super().__init__()
+        self.step_ns = step_ns
+
+    def __call__(self):
+        self.now_ns += self.step_ns
+        return self.now_ns
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--transitions', type=int, default=1_000_000)
+    parser.add_argument('--timers', type=int, default=0, help='같이 돌릴 보조 카운트다운 수')
+    args = parser.parse_args()
+
+    clock = StepClock(NS_PER_SEC // 10)
+    session = TimerSession(clock)
+    session.set_timers([(f'cd{i}', 'countdown', 60 + i, (10, 0)) for i in range(args.timers)])
+
+    # start → split → pause → reset 순환 (reset 마다 스플릿 버퍼를 비운다)
+    cycle = (session.start, session.split, session.pause, session.reset)
+    t0 = time.perf_counter()
+    for i in range(args.transitions):
+        cycle[i % 4]()
+    transitions_s = time.perf_counter() - t0
+
+    # 달리는 중에 가장 이른 마감으로 시계를 옮겨 가며 틱 처리
+    session.start()
+    ticks = 0
+    t0 = time.perf_counter()
+    while ticks < args.transitions:
+        clock.now_ns = session.next_wake_ns()
+        session.tick(clock.now_ns)
+        ticks += 1
+    ticks_s = time.perf_counter() - t0
+
+    print(f"timers={1 + args.timers}")
+    print(f"  transitions {args.transitions / transitions_s / 1e6:6.2f}M/s  ({transitions_s / args.transitions * 1e9:6.0f}ns each)")
+    print(f"  ticks       {ticks / ticks_s / 1e6:6.2f}M/s  ({ticks_s / ticks * 1e9:6.0f}ns each)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# 스플릿 저장 비용 벤치마크
+#   python -m bench.splits --counts 1000 10000 100000
+import argparse
+import sys
+import time
+
+from splits import SplitLog, split_display
+from stopwatch import NS_PER_SEC
+
+
+def measure(count):
+    splits = SplitLog()
+    elapsed = 0
+    t0 = time.perf_counter_ns()
+    for i in range(count):
+        elapsed += 37 * NS_PER_SEC + i
+        splits.mark(elapsed)
+    append_ns = (time.perf_counter_ns() - t0) / count
+
+    # 틱마다 하는 표시 문자열 계산 비용 (스플릿 수와 무관해야 함)
+    total_seconds = elapsed // NS_PER_SEC
+    t0 = time.perf_counter_ns()
+    for i in range(10_000):
+        split_display(total_seconds + i, splits)
+    display_ns = (time.perf_counter_ns() - t0) / 10_000
+
+    marks_bytes = sys.getsizeof(splits.marks)
+    as_list = list(splits.marks)
+    list_bytes = sys.getsizeof(as_list) + sum(sys.getsizeof(x) for x in as_list)
+    return append_ns, display_ns, marks_bytes / count, list_bytes / count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--counts', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'splits':>9}  {'append':>10}  {'display/tick':>12}  {'array B/split':>13}  {'list B/split':>12}")
+    for count in args.counts:
+        append_ns, display_ns, array_bytes, list_bytes = measure(count)
+        print(f"{count:>9}  {append_ns:8.1f}ns  {display_ns:10.1f}ns  {array_bytes:13.2f}  {list_bytes:12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# 시작 시간 벤치마크: 새 프로세스마다 m_clock import 시간과 첫 페인트까지 걸린 시간 (offscreen Qt)
+#   python -m bench.startup --runs 10
+#   python -m bench.startup --log bench-startup.jsonl   # 결과를 한 줄씩 덧붙여 추이를 본다
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child():
+    # 측정 대상 프로세스: 빈 작업 디렉터리에서 기본 기록기/체크포인트로 띄운다 (핫키만 합성 입력)
+    marks = {'main': time.monotonic_ns()}
+    import m_clock
+    marks['imported'] = time.monotonic_ns()
+    from PyQt5.QtWidgets import QApplication
+    from screen_provider import FixedScreenProvider
+    from hotkeys import SyntheticBackend
+
+    class Probe(m_clock.OverlayTimer):
+        def paintEvent(self, event):
+            super().paintEvent(event)
+            marks.setdefault('first_paint', time.monotonic_ns())
+
+        def finish_startup(self):
+            super().finish_startup()
+            marks.setdefault('ready', time.monotonic_ns())
+            app.quit()
+
+    app = QApplication(sys.argv[:1])
+    marks['app'] = time.monotonic_ns()
+    window = Probe(FixedScreenProvider(1920, 1080), SyntheticBackend())
+    marks['constructed'] = time.monotonic_ns()
+    window.show()
+    app.exec_()
+    window.history_writer.close()
+    window.checkpoint.close()
+    print(json.dumps(marks), flush=True)
+
+
+def measure():
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONPATH=ROOT)
+        spawned = time.monotonic_ns()
+        output = subprocess.run([sys.executable, '-m', 'bench.startup', '--child'], cwd=directory, env=env,
+                                capture_output=True, text=True, check=True).stdout
+    marks = json.loads(output.splitlines()[-1])
+    return {
+        'interpreter_ms': (marks['main'] - spawned) / 1e6,
+        'import_ms': (marks['imported'] - marks['main']) / 1e6,
+        'construct_ms': (marks['constructed'] - marks['app']) / 1e6,
+        'first_paint_ms': (marks['first_paint'] - spawned) / 1e6,
+        'ready_ms': (marks['ready'] - spawned) / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--log', help='결과 요약을 JSON 한 줄로 덧붙일 파일')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    # 첫 실행은 디스크 캐시가 비어 있을 수 있으므로 따로 보여 주고 나머지로 통계를 낸다
+    first = measure()
+    samples = [measure() for _ in range(args.runs)]
+    summary = {'time': time.time(), 'python': sys.version.split()[0], 'runs': args.runs, 'first': first}
+    print(f"{'':16s} {'first':>8s} {'median':>8s} {'min':>8s} {'max':>8s}")
+    for key in first:
+        values = [sample[key] for sample in samples]
+        summary[key] = statistics.median(values)
+        print(f"{key:16s} {first[key]:8.1f} {statistics.median(values):8.1f} {min(values):8.1f} {max(values):8.1f}")
+    if args.log:
+        with open(args.log, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+import math
+import mmap
+import os
+import struct
+import time
+import zlib
+from array import array
+
+from stopwatch import NS_PER_SEC
+
+CHECKPOINT_PATH = 'm_clock_state.bin'
+
+MAGIC = b'MCLK'
+VERSION = 2
+RUNNING = 1
+
+# 슬롯 하나: 헤더 + 최근 스플릿 ns 배열 + 끝의 crc32. 슬롯 두 개를 번갈아 쓴다.
+# 슬롯에 다 못 들어가는 앞쪽 스플릿은 슬롯 뒤의 저널(덧붙이기만 하는 ns 배열)로 옮기고,
+# 헤더에는 저널에 옮긴 수와 그 부분의 crc32 를 남긴다.
+# magic, version, flags, sequence, accumulated_ns, anchor_ns, saved_mono_ns, saved_wall_ns, started_at,
+# 전체 split 수, 저널에 있는 split 수, 저널 crc32
+HEADER = struct.Struct('<4sHHQqqqqdIII')
+HEADER_V1 = struct.Struct('<4sHHQqqqqdI')  # 저널 없는 예전 형식 (읽기만)
+CRC = struct.Struct('<I')
+SLOT_SIZE = 4096
+MAX_INLINE_SPLITS = (SLOT_SIZE - HEADER.size - CRC.size) // 8  # 넘으면 저널로 옮긴다
+SLOTS_SIZE = SLOT_SIZE * 2  # 저널은 이 뒤에서 시작한다
+
+# 저장 후 monotonic 경과와 벽시계 경과가 이만큼 넘게 어긋나면 재부팅으로 보고 벽시계를 쓴다
+CLOCK_MISMATCH_NS = 2 * NS_PER_SEC
+
+
+class CheckpointState:
+    __slots__ = ('running', 'sequence', 'accumulated_ns', 'anchor_ns', 'saved_mono_ns', 'saved_wall_ns',
+                 'started_at', 'marks', 'journaled', 'journal_crc')
+
+    def __init__(self, running, sequence, accumulated_ns, anchor_ns, saved_mono_ns, saved_wall_ns,
+                 started_at, marks):
+        self.running = running
+        self.sequence = sequence
+        self.accumulated_ns = accumulated_ns
+        self.anchor_ns = anchor_ns  # 실행 중일 때의 monotonic 기준점 (저장한 프로세스의 시계 기준)
+        self.saved_mono_ns = saved_mono_ns
+        self.saved_wall_ns = saved_wall_ns
+        self.started_at = started_at
+        self.marks = marks
+        self.journaled = 0  # marks 중 저널에서 읽은 앞부분 수
+        self.journal_crc = 0
+
+    def resume_anchor(self, now_ns, wall_ns):
+        # 지금 시계 기준으로 옮긴 기준점. 같은 부팅이면 monotonic 이 그대로 이어지므로 원래 값과 같고,
+        # 재부팅 등으로 monotonic 이 끊겼으면 저장 후 흐른 벽시계 시간만큼 이어 붙인다.
+        since_save = now_ns - self.saved_mono_ns
+        wall_since_save = wall_ns - self.saved_wall_ns
+        if since_save < 0 or abs(since_save - wall_since_save) > CLOCK_MISMATCH_NS:
+            since_save = max(wall_since_save, 0)
+        return now_ns - (self.saved_mono_ns - self.anchor_ns) - since_save
+
+
+class Checkpoint:
+    # 타이머 상태를 mmap 슬롯 파일에 남긴다. 상태 전환 때만 쓰고 틱마다는 쓰지 않는다.
+    # 두 슬롯을 번갈아 쓰고 crc 로 검사하므로 쓰는 도중 죽어도 직전 상태는 남는다.
+    # 스플릿이 슬롯보다 많아지면 앞부분을 저널로 옮긴다. 저널은 헤더가 가리키는 범위 뒤에만 덧붙이므로
+    # 옮기다 죽어도 슬롯이 가리키는 스플릿은 그대로다. 수만 개 스플릿도 버리지 않는다.
+    # 프로세스가 죽어도 페이지 캐시는 살아 있으므로 전환마다 msync/fsync 로 디스크까지 밀지 않는다.
+    def __init__(self, path=CHECKPOINT_PATH, wall_clock=time.time_ns):
+        self.path = path
+        self.wall_clock = wall_clock  # 재부팅으로 monotonic 이 끊긴 경우를 메우는 데만 쓴다
+        if path is None:
+            # 파일 없이 메모리에만 (벤치마크용)
+            self.file = None
+            self.map = mmap.mmap(-1, SLOTS_SIZE)
+            self.memory_journal = bytearray()
+        else:
+            # 윈도우에서는 O_BINARY 가 없으면 텍스트 모드로 열린다. 저널은 버퍼 없이 바로 읽고 쓴다
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+            self.file = os.fdopen(fd, 'r+b', buffering=0)
+            if os.fstat(fd).st_size < SLOTS_SIZE:
+                self.file.truncate(SLOTS_SIZE)
+            self.map = mmap.mmap(self.file.fileno(), SLOTS_SIZE)
+        # 이번 런에서 저널에 옮긴 스플릿 수와 그 crc (저장 때 이어서 쓴다)
+        self.journaled = 0
+        self.journal_crc = 0
+        latest = self.load()
+        self.sequence = latest.sequence if latest else 0
+        if latest is not None:
+            self.journaled, self.journal_crc = latest.journaled, latest.journal_crc
+        self.writes = 0
+
+    def changed(self):
+        # 다른 프로세스(헤드리스 CLI 명령 등)가 같은 파일에 더 새 상태를 썼으면 그 상태.
+        # 이후 저장은 그 다음 번호로 이어서 쓴다. 번호가 그대로면 헤더만 보고 끝난다.
+        if max(self.slot_sequence(0), self.slot_sequence(1)) <= self.sequence:
+            return None
+        latest = self.load()
+        if latest is None or latest.sequence <= self.sequence:
+            return None
+        self.sequence = latest.sequence
+        self.journaled, self.journal_crc = latest.journaled, latest.journal_crc
+        return latest
+
+    def close(self):
+        self.map.flush()
+        self.map.close()
+        if self.file is not None:
+            self.file.close()
+
+    def slot_sequence(self, index):
+        magic, version, _, sequence = struct.unpack_from('<4sHHQ', self.map, index * SLOT_SIZE)
+        return sequence if magic == MAGIC else 0
+
+    def read_journal(self, count):
+        size = count * 8
+        if self.file is None:
+            return bytes(self.memory_journal[:size])
+        # os.pread/pwrite 는 윈도우에 없으므로 seek 후 read/write
+        self.file.seek(SLOTS_SIZE)
+        return self.file.read(size)
+
+    def write_journal(self, index, data):
+        # 저널의 index 번째 스플릿 자리부터 덧쓴다
+        if self.file is None:
+            self.memory_journal[index * 8:] = data
+        else:
+            self.file.seek(SLOTS_SIZE + index * 8)
+            self.file.write(data)
+
+    def read_slot(self, index):
+        offset = index * SLOT_SIZE
+        magic, version = struct.unpack_from('<4sH', self.map, offset)
+        if magic != MAGIC:
+            return None
+        if version == VERSION:
+            (_, _, flags, sequence, accumulated_ns, anchor_ns, saved_mono_ns, saved_wall_ns,
+             started_at, count, journaled, journal_crc) = HEADER.unpack_from(self.map, offset)
+            header_size = HEADER.size
+        elif version == 1:
+            (_, _, flags, sequence, accumulated_ns, anchor_ns, saved_mono_ns, saved_wall_ns,
+             started_at, count) = HEADER_V1.unpack_from(self.map, offset)
+            header_size, journaled, journal_crc = HEADER_V1.size, 0, 0
+        else:
+            return None
+        inline = count - journaled
+        if inline < 0 or header_size + inline * 8 > SLOT_SIZE - CRC.size:
+            return None
+        end = offset + header_size + inline * 8
+        crc, = CRC.unpack_from(self.map, offset + SLOT_SIZE - CRC.size)
+        if zlib.crc32(self.map[offset:end]) != crc:
+            return None
+        marks = array('q')
+        if journaled:
+            # 저널이 뒤의 런에 덧쓰였거나 덜 쓰였으면 이 슬롯은 믿지 않는다
+            data = self.read_journal(journaled)
+            if len(data) != journaled * 8 or zlib.crc32(data) != journal_crc:
+                return None
+            marks.frombytes(data)
+        marks.frombytes(self.map[offset + header_size:end])
+        state = CheckpointState(
+            bool(flags & RUNNING), sequence, accumulated_ns, anchor_ns, saved_mono_ns, saved_wall_ns,
+            None if math.isnan(started_at) else started_at, marks,
+        )
+        state.journaled = journaled
+        state.journal_crc = journal_crc
+        return state
+
+    def load(self):
+        # 두 슬롯 중 검사를 통과한 최신 상태 (최신 슬롯이 통과하면 다른 슬롯은 읽지 않는다)
+        for index in sorted((0, 1), key=self.slot_sequence, reverse=True):
+            state = self.read_slot(index)
+            if state is not None:
+                return state
+        return None
+
+    def save(self, stopwatch, splits, started_at):
+        accumulated_ns, anchor_ns = stopwatch.state()
+        now_ns = stopwatch.now()
+        wall_ns = self.wall_clock()
+        marks = splits.marks
+        count = len(marks)
+        if count < self.journaled:
+            # 리셋 등으로 스플릿이 줄었다: 저널을 처음부터 다시 쓴다
+            self.journaled = 0
+            self.journal_crc = 0
+        if count - self.journaled > MAX_INLINE_SPLITS:
+            # 슬롯에 남은 스플릿을 저널 끝으로 옮긴다 (슬롯을 쓰기 전에 먼저)
+            data = marks[self.journaled:].tobytes()
+            self.write_journal(self.journaled, data)
+            self.journal_crc = zlib.crc32(data, self.journal_crc)
+            self.journaled = count
+        inline = marks[self.journaled:]
+        self.sequence += 1
+        offset = (self.sequence % 2) * SLOT_SIZE
+        HEADER.pack_into(
+            self.map, offset, MAGIC, VERSION, RUNNING if anchor_ns is not None else 0, self.sequence,
+            accumulated_ns, anchor_ns if anchor_ns is not None else 0, now_ns, wall_ns,
+            math.nan if started_at is None else started_at, count, self.journaled, self.journal_crc,
+        )
+        end = offset + HEADER.size + len(inline) * 8
+        self.map[offset + HEADER.size:end] = inline.tobytes()
+        CRC.pack_into(self.map, offset + SLOT_SIZE - CRC.size, zlib.crc32(self.map[offset:end]))
+        self.writes += 1
+
+    def restore(self, stopwatch, splits):
+        # 남아 있는 상태를 스톱워치/스플릿에 되돌리고 런 시작 시각을 돌려준다 (없으면 None)
+        state = self.load()
+        if state is None:
+            return None
+        self.journaled, self.journal_crc = state.journaled, state.journal_crc
+        anchor_ns = None
+        if state.running:
+            anchor_ns = state.resume_anchor(stopwatch.now(), self.wall_clock())
+        stopwatch.restore(state.accumulated_ns, anchor_ns)
+        splits.clear()
+        splits.marks.extend(state.marks)
+        return state.started_at
+
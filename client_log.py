@@ -0,0 +1,132 @@
+import fnmatch
+import os
+import re
+
+CHUNK_SIZE = 1 << 20  # 한 번에 읽는 바이트 수 (수 GB 로그도 이 크기로만 메모리에 올림)
+
+# 2023/08/20 14:23:11 123456789 cffb0719 [INFO Client 12345] : You have entered Lioneye's Watch.
+# 줄 머리를 고정해서 채팅 본문에 같은 문구가 들어 있어도 걸리지 않게 한다
+ZONE_ENTERED = re.compile(rb'^[^\[\n]*\[INFO Client \d+\] : You have entered (.+?)\.\r?$', re.MULTILINE)
+
+
+# Client.txt 지역 이동 자동 시작/스플릿/멈춤 기본값 ([AutoSplit], 쉼표로 구분, * 와일드카드)
+DEFAULT_AUTOSPLIT = {
+    'start': 'The Twilight Strand',  # 캠페인 첫 지역에서 시작
+    'split': '*',  # 지역을 옮길 때마다 스플릿
+    'pause': '*Hideout',  # 은신처에서는 멈춤
+}
+
+
+def zones_in(block):
+    # 완성된 줄들로 이뤄진 bytes 에서 들어간 지역 이름을 순서대로
+    return [match.group(1).decode('utf-8', 'replace') for match in ZONE_ENTERED.finditer(block)]
+
+
+class LogTail:
+    # 로그 파일의 읽은 위치(바이트 오프셋)를 기억하고 새로 붙은 부분만 읽는다.
+    # 파일이 바뀌었으면(로테이션) 옛 파일의 남은 부분을 마저 읽고 새 파일 처음부터,
+    # 크기가 오프셋보다 작아졌으면(잘림) 처음부터 다시 읽는다.
+    def __init__(self, path, from_end=True, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.file = None
+        self.identity = None
+        self.offset = 0
+        self.partial = b''  # 아직 줄바꿈이 오지 않은 마지막 줄
+        self.open(from_end)
+
+    def open(self, from_end=False):
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return False
+        stat = os.fstat(f.fileno())
+        if self.file is not None:
+            self.file.close()
+        self.file = f
+        self.identity = (stat.st_dev, stat.st_ino)
+        self.offset = stat.st_size if from_end else 0
+        self.partial = b''
+        return True
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def blocks(self):
+        # 새로 붙은 데이터를 완성된 줄 단위 bytes 블록으로 (블록 하나는 chunk_size 안팎)
+        if self.file is None and not self.open():
+            return
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            stat = None  # 옮겨지는 중. 열려 있는 옛 파일만 마저 읽는다
+        if stat is not None and (stat.st_dev, stat.st_ino) != self.identity:
+            yield from self.read_to_end()
+            self.open()
+        elif stat is not None and stat.st_size < self.offset:
+            self.offset = 0
+            self.partial = b''
+        yield from self.read_to_end()
+
+    def read_to_end(self):
+        self.file.seek(self.offset)
+        while True:
+            data = self.file.read(self.chunk_size)
+            if not data:
+                return
+            self.offset += len(data)
+            end = data.rfind(b'\n') + 1
+            if not end:
+                self.partial += data
+                continue
+            block = self.partial + data[:end] if self.partial else data[:end]
+            self.partial = data[end:]
+            yield block
+
+
+def compile_zones(patterns):
+    # 쉼표로 구분한 지역 이름/와일드카드 (*Hideout) 를 정규식 하나로. 비어 있으면 None
+    parts = [pattern.strip() for pattern in patterns.split(',') if pattern.strip()]
+    if not parts:
+        return None
+    return re.compile('|'.join(fnmatch.translate(part) for part in parts), re.IGNORECASE)
+
+
+class AutoSplitter:
+    # 지역 이동을 타이머 명령으로 바꾼다.
+    #   start_zones: 타이머가 0 일 때 이 지역에 들어가면 시작
+    #   split_zones: 달리는 중에 이 지역에 들어가면 스플릿
+    #   pause_zones: 이 지역(은신처 등)에 들어가면 멈추고, 다른 지역으로 나가면 다시 달린다
+    def __init__(self, start_zones='', split_zones='', pause_zones=''):
+        self.start_zones = compile_zones(start_zones)
+        self.split_zones = compile_zones(split_zones)
+        self.pause_zones = compile_zones(pause_zones)
+        self.paused = False  # 우리가 멈춘 상태인지 (수동으로 멈춘 것은 다시 시작하지 않음)
+
+    def listening(self, running, zero):
+        # 지금 상태에서 지역 이동이 명령이 될 수 있는지 (on_zone 과 같은 규칙)
+        if running:
+            return self.split_zones is not None or self.pause_zones is not None
+        if self.paused:
+            return True
+        return zero and self.start_zones is not None
+
+    def on_zone(self, zone, running, zero):
+        # 'start' | 'split' | 'pause' | 'resume' | None
+        if self.pause_zones is not None and self.pause_zones.match(zone):
+            if running:
+                self.paused = True
+                return 'pause'
+            return None
+        if self.paused:
+            self.paused = False
+            return 'resume' if not running else None
+        if not running:
+            if zero and self.start_zones is not None and self.start_zones.match(zone):
+                return 'start'
+            return None
+        if self.split_zones is not None and self.split_zones.match(zone):
+            return 'split'
+        return None
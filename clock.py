@@ -0,0 +1,49 @@
+import time
+
+from stopwatch import NS_PER_SEC
+
+
+class SystemClock:
+    # 실제 시계. 호출하면 monotonic ns, wall()/wall_ns() 는 벽시계.
+    # 파이썬 함수 한 겹 없이 내장 함수를 그대로 부르도록 staticmethod 로 둔다.
+    __slots__ = ()
+    __call__ = staticmethod(time.monotonic_ns)
+    wall = staticmethod(time.time)
+    wall_ns = staticmethod(time.time_ns)
+
+    def sleep(self, ns):
+        time.sleep(ns / NS_PER_SEC)
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock:
+    # 직접 옮길 때만 흐르는 시계. 열 시간짜리 세션도 기다리지 않고 바로 끝까지 돌릴 수 있고,
+    # 같은 입력이면 항상 같은 결과가 나온다. 벽시계는 wall_start_ns 에서 같은 만큼 흐른다.
+    __slots__ = ('now_ns', 'wall_start_ns')
+
+    def __init__(self, start_ns=0, wall_start_ns=0):
+        self.now_ns = start_ns
+        self.wall_start_ns = wall_start_ns
+
+    def __call__(self):
+        return self.now_ns
+
+    def wall(self):
+        return self.wall_ns() / NS_PER_SEC
+
+    def wall_ns(self):
+        return self.wall_start_ns + self.now_ns
+
+    def sleep(self, ns):
+        self.advance(ns)
+
+    def advance(self, ns):
+        if ns > 0:
+            self.now_ns += ns
+
+    def advance_to(self, ns):
+        # 시계는 거꾸로 가지 않는다
+        if ns > self.now_ns:
+            self.now_ns = ns
@@ -0,0 +1,107 @@
+import itertools
+from array import array
+
+from splits import format_segment
+from stopwatch import NS_PER_SEC
+
+
+def format_delta(ns):
+    # +MM:SS (뒤처짐) / -MM:SS (앞섬)
+    return ('-' if ns < 0 else '+') + format_segment(abs(ns) // NS_PER_SEC)
+
+
+class Comparison:
+    # 기록에서 한 번만 읽어 두는 비교 기준. 이후 끝낸 런은 add_run 으로 메모리에서 합친다.
+    #   pb_ns : PB 런의 누적 스플릿 시각 (+ 마지막 스플릿 뒤 완주 시각)
+    #   sob_ns: 구간 최고 기록의 누적합 (sum of best)
+    # 틱마다는 현재 구간 번호(= 찍은 스플릿 수)로 배열을 한 번 보는 것이 전부라 저장소를 건드리지 않는다.
+    # 배열은 제자리에서 바꾸지 않으므로 copy() 한 것끼리 같이 써도 된다.
+    __slots__ = ('pb_ns', 'pb_total_ns', 'best_ns', 'sob_ns', 'gold')
+
+    def __init__(self, pb_marks, pb_total_ns, best_segments):
+        self.pb_ns = array('q', pb_marks)
+        if pb_total_ns and (not self.pb_ns or pb_total_ns > self.pb_ns[-1]):
+            self.pb_ns.append(pb_total_ns)
+        self.pb_total_ns = pb_total_ns  # 0 이면 완주한 런이 없음
+        self.best_ns = array('q', best_segments)
+        self.sob_ns = array('q', itertools.accumulate(best_segments))
+        self.gold = False  # 마지막 구간이 구간 최고 기록을 깼는지
+
+    @classmethod
+    def from_history(cls, history, category):
+        # 기록이 없어도 빈 기준을 돌려준다 (이후 런을 add_run 으로 합칠 수 있게)
+        pb = history.personal_best(category)
+        best = history.best_segments(category)
+        if pb is None:
+            return cls((), 0, best)
+        run_id, total_ns, _ = pb
+        return cls(history.run_splits(run_id), total_ns, best)
+
+    def copy(self):
+        # 런마다 쓸 사본 (gold 만 따로)
+        comparison = Comparison.__new__(Comparison)
+        comparison.pb_ns = self.pb_ns
+        comparison.pb_total_ns = self.pb_total_ns
+        comparison.best_ns = self.best_ns
+        comparison.sob_ns = self.sob_ns
+        comparison.gold = False
+        return comparison
+
+    def add_run(self, marks, total_ns, completed):
+        # 방금 기록한 런을 DB 를 다시 읽지 않고 반영한다 (History.personal_best / best_segments 와 같은 규칙)
+        best = array('q', self.best_ns)
+        previous = 0
+        for index, mark in enumerate(marks):
+            segment = mark - previous
+            previous = mark
+            if index >= len(best):
+                best.append(segment)
+            elif segment < best[index]:
+                best[index] = segment
+        if best != self.best_ns:
+            self.best_ns = best
+            self.sob_ns = array('q', itertools.accumulate(best))
+        if completed and (not self.pb_total_ns or total_ns < self.pb_total_ns):
+            self.pb_ns = array('q', marks)
+            if not self.pb_ns or total_ns > self.pb_ns[-1]:
+                self.pb_ns.append(total_ns)
+            self.pb_total_ns = total_ns
+
+    def on_split(self, splits):
+        index = len(splits) - 1
+        self.gold = index < len(self.best_ns) and splits.segment_ns(index) < self.best_ns[index]
+
+    @staticmethod
+    def delta(cumulative, splits, elapsed_ns):
+        # 현재 구간에서 이미 기준보다 늦었으면 그 차이(실시간), 아니면 마지막 스플릿 시점의 차이
+        index = len(splits)
+        if index < len(cumulative):
+            live = elapsed_ns - cumulative[index]
+            if live > 0:
+                return live
+        if 0 < index <= len(cumulative):
+            return splits.last_ns() - cumulative[index - 1]
+        return None
+
+    def pb_delta(self, splits, elapsed_ns):
+        return self.delta(self.pb_ns, splits, elapsed_ns)
+
+    def sob_delta(self, splits, elapsed_ns):
+        return self.delta(self.sob_ns, splits, elapsed_ns)
+
+    def state(self, splits, elapsed_ns):
+        # 'ahead' | 'behind' | 'gold' | None (비교할 PB 위치가 없음)
+        delta = self.pb_delta(splits, elapsed_ns)
+        if delta is None:
+            return 'gold' if self.gold else None
+        if delta > 0:
+            return 'behind'
+        return 'gold' if self.gold else 'ahead'
+
+    def display(self, splits, elapsed_ns):
+        # 오버레이에 덧붙일 "PB 대비 SOB 대비" 문자열 (없는 쪽은 생략)
+        parts = []
+        for delta in (self.pb_delta(splits, elapsed_ns), self.sob_delta(splits, elapsed_ns)):
+            if delta is not None:
+                parts.append(format_delta(delta))
+        return ' '.join(parts)
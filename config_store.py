@@ -0,0 +1,98 @@
+import io
+import os
+import threading
+import time
+
+SAVE_DELAY = 0.5  # 연속 저장 요청을 모으는 시간 (초)
+RETRY_DELAY = 5.0  # 쓰기에 실패한 뒤 다시 써 보기까지 기다리는 시간 (초)
+
+
+class ConfigWriter:
+    # 설정 저장 요청을 모아서 백그라운드 스레드에서 한 번만 쓴다.
+    # 임시 파일에 쓰고 os.replace 로 바꿔치기하므로 쓰는 도중 죽어도 기존 파일이 남는다.
+    # 쓰기에 실패해도(없는/읽기 전용 디렉터리, 윈도우에서 다른 프로그램이 잡고 있는 파일) 스레드는 살아 있고,
+    # 못 쓴 내용은 들고 있다가 retry_delay 뒤에 다시 쓴다. 마지막 오류는 error 에 남는다.
+    def __init__(self, path, delay=SAVE_DELAY, retry_delay=RETRY_DELAY):
+        self.path = path
+        self.delay = delay
+        self.retry_delay = retry_delay
+        self.condition = threading.Condition()
+        # 요청을 꺼내는 것과 쓰는 것을 한 번에 묶는다. 그래야 먼저 꺼낸 옛 내용이 나중에 꺼낸 새 내용을
+        # 덮어쓰지 않고, flush 가 이미 쓰는 중인 것이 끝날 때까지 기다린다. 순서: write_lock -> condition
+        self.write_lock = threading.Lock()
+        self.pending = None  # 아직 쓰지 않은 직렬화 결과
+        self.due = 0.0
+        self.written = self.read_existing()
+        self.writes = 0
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def read_existing(self):
+        try:
+            with open(self.path) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def save(self, config):
+        # 직렬화는 호출한 스레드에서 해서 ConfigParser 를 스레드 간에 공유하지 않는다
+        buffer = io.StringIO()
+        config.write(buffer)
+        with self.condition:
+            self.pending = buffer.getvalue()
+            self.due = time.monotonic() + self.delay
+            self.condition.notify()
+
+    def flush(self):
+        # 남은 저장 요청을 지금 바로 쓴다 (종료 시 사용). 백그라운드 스레드가 쓰는 중이면 끝날 때까지
+        # 기다린다 (데몬 스레드는 종료할 때 그냥 죽는다). 다 썼으면 True, 실패하면 False (error 참고)
+        with self.write_lock:
+            return self.write_pending()
+
+    def write_pending(self):
+        # write_lock 을 잡은 채로 부른다
+        with self.condition:
+            text, self.pending = self.pending, None
+        if text is None:
+            return True
+        try:
+            self.write(text)
+        except OSError as e:
+            self.error = e
+            print(f"Error writing {self.path} (will retry): {e}")
+            with self.condition:
+                # 그 사이 새 요청이 없으면 못 쓴 내용을 다시 넣는다 (새 요청이 있으면 그게 더 새 내용)
+                if self.pending is None:
+                    self.pending = text
+                self.due = time.monotonic() + self.retry_delay
+            return False
+        self.error = None
+        return True
+
+    def run(self):
+        while True:
+            with self.condition:
+                # 요청이 없으면 깨지 않고 기다린다
+                while self.pending is None:
+                    self.condition.wait()
+                remaining = self.due - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+            # 기다리는 동안 flush 가 가져갔으면 쓸 것이 없다
+            with self.write_lock:
+                self.write_pending()
+
+    def write(self, text):
+        # 내용이 같으면 쓰지 않는다
+        if text == self.written:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.written = text
+        self.writes += 1
@@ -0,0 +1,130 @@
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPixmap, QPainter, QFont, QFontMetrics, QColor
+
+GLYPHS = '0123456789+-: '
+NARROW = ': '  # 숫자 칸보다 좁게 그리는 구분자
+BACKGROUND = QColor(0, 0, 0, 100)  # 숫자 뒤 반투명 배경
+COLON_RATIO = 0.5  # 구분자 칸 폭 (숫자 칸 대비)
+MARGIN = 2  # 테두리 두께만큼 안쪽으로
+BASE_TEXT = '00:00:00'  # [Size] 영역에 딱 맞게 칸 크기를 정하는 기준 글자. 더 긴 줄이나 더 많은 줄은 위젯을 넓히고 늘린다
+
+
+def text_units(text):
+    # 숫자 칸 폭 기준 글자 폭 합 (구분자는 COLON_RATIO 칸)
+    colons = sum(ch in NARROW for ch in text)
+    return (len(text) - colons) + colons * COLON_RATIO
+
+
+def text_shape(text):
+    # 칸 배치가 같은지 비교하는 키 (줄바꿈 위치와 구분자 위치)
+    return ['\n' if ch == '\n' else ch in NARROW for ch in text]
+
+
+class GlyphAtlas:
+    # 숫자/부호와 구분자 글리프를 한 장의 QPixmap 에 미리 그려 두고 잘라 쓴다
+    def __init__(self, digit_width, colon_width, height, color, dpr=1.0):
+        self.source = {}
+        width = digit_width * (len(GLYPHS) - len(NARROW)) + colon_width * len(NARROW)
+        self.pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        self.pixmap.setDevicePixelRatio(dpr)
+        self.pixmap.fill(Qt.transparent)
+
+        font = QFont()
+        font.setStyleHint(QFont.Monospace)
+        font.setBold(True)
+        font.setPixelSize(max(1, int(height * 0.85)))
+        # 가장 넓은 숫자가 칸에 들어가도록 글꼴 크기를 줄인다
+        advance = max(QFontMetrics(font).horizontalAdvance(ch) for ch in '0123456789')
+        if advance > digit_width * 0.9:
+            font.setPixelSize(max(1, int(font.pixelSize() * digit_width * 0.9 / advance)))
+
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(color)
+        x = 0
+        for ch in GLYPHS:
+            cell_width = colon_width if ch in NARROW else digit_width
+            rect = QRect(x, 0, cell_width, height)
+            painter.drawText(rect, Qt.AlignCenter, ch)
+            # drawPixmap 의 원본 좌표는 물리 픽셀 기준
+            self.source[ch] = QRect(int(x * dpr), 0, int(cell_width * dpr), int(height * dpr))
+            x += cell_width
+        painter.end()
+
+
+class DigitRenderer:
+    # 기준 크기([Size])마다 아틀라스를 한 번만 만들고, 바뀐 글자 칸만 다시 그리게 한다.
+    # 칸 크기는 기준 크기에 BASE_TEXT 가 맞게 고정하고, 글자가 '\n' 으로 나눈 여러 줄이거나 더 길면
+    # 칸을 줄이지 않고 content_size 를 키운다 (위젯이 그 크기로 맞춘다)
+    def __init__(self):
+        self.size = None
+        self.dpr = 1.0
+        self.text = ''
+        self.glyphs = ''  # 줄바꿈을 뺀 글자 (cells 와 같은 순서)
+        self.cells = []  # 글자 위치별 대상 QRect
+        self.content_size = None  # 모든 줄을 담는 (폭, 높이)
+        self.digit_width = self.colon_width = self.cell_height = 0
+        self.atlases = {}  # 색상 rgba -> GlyphAtlas
+
+    def resize(self, width, height, dpr=1.0):
+        if self.size == (width, height) and self.dpr == dpr:
+            return False
+        self.size = (width, height)
+        self.dpr = dpr
+        self.layout()
+        return True
+
+    def layout(self):
+        self.atlases.clear()
+        self.cells = []
+        self.glyphs = self.text.replace('\n', '')
+        self.content_size = self.size
+        if self.size is None:
+            return
+        width, height = self.size
+        self.cell_height = max(1, height - MARGIN * 2)
+        self.digit_width = max(1, int((width - MARGIN * 2) / text_units(BASE_TEXT)))
+        self.colon_width = max(1, int(self.digit_width * COLON_RATIO))
+        rows = self.text.split('\n')
+        row_widths = []
+        for row in rows:
+            colons = sum(ch in NARROW for ch in row)
+            row_widths.append(self.digit_width * (len(row) - colons) + self.colon_width * colons)
+        inner_width = max([width - MARGIN * 2] + row_widths)
+        self.content_size = (inner_width + MARGIN * 2, self.cell_height * len(rows) + MARGIN * 2)
+        # 줄마다 가운데 정렬
+        for index, (row, used) in enumerate(zip(rows, row_widths)):
+            x = MARGIN + (inner_width - used) // 2
+            y = MARGIN + index * self.cell_height
+            for ch in row:
+                cell_width = self.colon_width if ch in NARROW else self.digit_width
+                self.cells.append(QRect(x, y, cell_width, self.cell_height))
+                x += cell_width
+
+    def set_text(self, text):
+        # 다시 그려야 할 영역 목록을 돌려준다 (None 이면 배치가 바뀌어 전체, content_size 도 바뀌었을 수 있다)
+        old = self.text
+        self.text = text
+        if len(old) != len(text) or text_shape(old) != text_shape(text):
+            self.layout()
+            return None
+        glyphs = text.replace('\n', '')
+        old_glyphs, self.glyphs = self.glyphs, glyphs
+        return [self.cells[i] for i, (a, b) in enumerate(zip(old_glyphs, glyphs)) if a != b]
+
+    def atlas(self, color):
+        key = color.rgba()
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.digit_width, self.colon_width, self.cell_height, color, self.dpr)
+            self.atlases[key] = atlas
+        return atlas
+
+    def paint(self, painter, clip, color):
+        if not self.cells:
+            return
+        atlas = self.atlas(color)
+        for ch, cell in zip(self.glyphs, self.cells):
+            if cell.intersects(clip):
+                painter.drawPixmap(cell, atlas.pixmap, atlas.source[ch])
@@ -0,0 +1,43 @@
+from collections import namedtuple
+from PyQt5.QtCore import QRect
+
+# 설정 파일의 [Position]/[Size] 비율 (문자열은 한 번만 파싱해 둔다)
+GeometryRatios = namedtuple('GeometryRatios', 'x y width height')
+
+DEFAULT_RATIOS = GeometryRatios(x=0.9, y=0.05, width=0.05, height=0.025)
+
+
+def ratios_from_config(config):
+    return GeometryRatios(
+        x=config.getfloat('Position', 'x', fallback=DEFAULT_RATIOS.x),
+        y=config.getfloat('Position', 'y', fallback=DEFAULT_RATIOS.y),
+        width=config.getfloat('Size', 'width', fallback=DEFAULT_RATIOS.width),
+        height=config.getfloat('Size', 'height', fallback=DEFAULT_RATIOS.height),
+    )
+
+
+class GeometryCache:
+    # (화면 이름, 화면 영역, DPR) 별로 계산한 위젯 영역을 보관한다.
+    # 비율이 바뀌면 모든 항목이 무효가 되므로 통째로 비운다.
+    def __init__(self, ratios=DEFAULT_RATIOS):
+        self.ratios = ratios
+        self.entries = {}
+
+    def set_ratios(self, ratios):
+        if ratios != self.ratios:
+            self.ratios = ratios
+            self.entries.clear()
+
+    def lookup(self, screen_key):
+        rect = self.entries.get(screen_key)
+        if rect is None:
+            name, (x, y, width, height), dpr = screen_key
+            ratios = self.ratios
+            rect = QRect(
+                x + int(width * ratios.x),
+                y + int(height * ratios.y),
+                int(width * ratios.width),
+                int(height * ratios.height),
+            )
+            self.entries[screen_key] = rect
+        return rect
@@ -0,0 +1,232 @@
+import queue
+import sqlite3
+import threading
+from array import array
+
+HISTORY_PATH = 'm_clock_history.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories(id),
+    started_at REAL NOT NULL,        -- 벽시계 시작 시각 (epoch 초)
+    total_ns INTEGER NOT NULL,       -- 스톱워치 경과 ns
+    completed INTEGER NOT NULL,      -- 멈춘 뒤 기록했으면 1, 달리는 중에 끊겼으면 0
+    segments BLOB                    -- 구간 ns array('q') 바이트 (통계에서 런 단위로 한 번에 읽는다)
+);
+CREATE TABLE IF NOT EXISTS splits (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,    -- 구간 최고 기록 조회용 비정규화
+    elapsed_ns INTEGER NOT NULL,
+    segment_ns INTEGER NOT NULL,
+    PRIMARY KEY (run_id, idx)
+) WITHOUT ROWID;
+-- 카테고리별 PB: (category, completed, total) 첫 항목
+CREATE INDEX IF NOT EXISTS runs_category_best ON runs(category_id, completed, total_ns);
+-- 최근 N 개
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started_at);
+-- 구간별 최고 기록: (category, idx) 마다 MIN(segment) 을 인덱스 한 번으로
+CREATE INDEX IF NOT EXISTS splits_best_segment ON splits(category_id, idx, segment_ns);
+"""
+
+SCHEMA_VERSION = 1  # PRAGMA user_version
+
+
+def connect(path=HISTORY_PATH):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    # WAL 에서는 NORMAL 로도 커밋 단위 일관성이 보장된다
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.execute('PRAGMA foreign_keys=ON')
+    connection.executescript(SCHEMA)
+    if connection.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+        migrate(connection)
+    return connection
+
+
+def migrate(connection):
+    # 기록 스레드와 조회 쪽이 동시에 열 수 있으므로 쓰기 잠금을 잡고 다시 확인한다
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        if connection.execute('PRAGMA user_version').fetchone()[0] < 1:
+            columns = {row[1] for row in connection.execute('PRAGMA table_info(runs)')}
+            if 'segments' not in columns:
+                # 0 -> 1: runs.segments 추가 후 기존 런은 splits 에서 한 번만 채운다
+                connection.execute('ALTER TABLE runs ADD COLUMN segments BLOB')
+                for run_id, in connection.execute('SELECT id FROM runs').fetchall():
+                    segments = array('q', (segment for segment, in connection.execute(
+                        'SELECT segment_ns FROM splits WHERE run_id = ? ORDER BY idx', (run_id,))))
+                    connection.execute('UPDATE runs SET segments = ? WHERE id = ?', (segments.tobytes(), run_id))
+        connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+
+
+class RunRecord:
+    # 기록 스레드로 넘기는 완료된 런 한 개
+    __slots__ = ('category', 'started_at', 'total_ns', 'completed', 'marks')
+
+    def __init__(self, category, started_at, total_ns, completed, marks=()):
+        self.category = category
+        self.started_at = started_at
+        self.total_ns = total_ns
+        self.completed = completed
+        self.marks = list(marks)  # 스플릿 경과 ns (SplitLog.marks 복사본)
+
+
+class HistoryWriter:
+    # GUI 스레드는 add() 로 넣기만 하고, 백그라운드 스레드가 쌓인 것을 트랜잭션 하나로 묶어 쓴다.
+    # 열기/쓰기에 실패해도(다른 프로세스의 잠금, 디스크 부족, 잘못된 경로) 스레드는 살아 있고,
+    # 못 쓴 기록은 들고 있다가 다음 묶음과 같이 다시 쓴다. 마지막 오류는 error 에 남는다.
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.queue = queue.Queue()
+        self.category_ids = {}
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def add(self, record):
+        self.queue.put(record)
+
+    def sync(self, timeout=None):
+        # 지금까지 넣은 기록을 모두 처리할 때까지 기다린다 (곧바로 조회할 때).
+        # 시간 안에 처리했으면 True. 쓰지 못하고 들고 있는 기록이 있는지는 error 로 본다
+        if not self.thread.is_alive():
+            return False
+        done = self.queue.all_tasks_done
+        with done:
+            return done.wait_for(lambda: not self.queue.unfinished_tasks, timeout)
+
+    def close(self):
+        # 남은 기록을 모두 쓰고 스레드를 끝낸다
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self):
+        connection = None
+        retry = []  # 지난번에 쓰지 못한 기록
+        while True:
+            batch = [self.queue.get()]
+            # 이미 쌓여 있는 것은 기다리지 않고 같이 가져온다
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            records = retry + [record for record in batch if record is not None]
+            retry = []
+            try:
+                if records:
+                    if connection is None:
+                        connection = connect(self.path)
+                    with connection:
+                        for record in records:
+                            self.insert(connection, record)
+                self.error = None
+            except sqlite3.Error as e:
+                # 롤백된 트랜잭션에서 만든 카테고리 id 는 믿을 수 없다
+                self.category_ids.clear()
+                retry = records
+                self.error = e
+                print(f"Error writing run history ({len(records)} runs kept for retry): {e}")
+            except Exception as e:
+                # 기록 자체가 잘못된 경우: 다시 써도 같으므로 버린다
+                self.category_ids.clear()
+                self.error = e
+                print(f"Error writing run history ({len(records)} runs dropped): {e}")
+            finally:
+                # 기다리는 쪽(sync)이 영원히 막히지 않게 항상 끝냈다고 알린다
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                if retry:
+                    print(f"Run history not written: {len(retry)} runs lost")
+                if connection is not None:
+                    connection.close()
+                return
+
+    def category_id(self, connection, name):
+        category_id = self.category_ids.get(name)
+        if category_id is None:
+            connection.execute('INSERT OR IGNORE INTO categories(name) VALUES (?)', (name,))
+            category_id = connection.execute('SELECT id FROM categories WHERE name = ?', (name,)).fetchone()[0]
+            self.category_ids[name] = category_id
+        return category_id
+
+    def insert(self, connection, record):
+        category_id = self.category_id(connection, record.category)
+        segments = array('q')
+        previous = 0
+        for mark in record.marks:
+            segments.append(mark - previous)
+            previous = mark
+        cursor = connection.execute(
+            'INSERT INTO runs(category_id, started_at, total_ns, completed, segments) VALUES (?, ?, ?, ?, ?)',
+            (category_id, record.started_at, record.total_ns, int(record.completed), segments.tobytes()),
+        )
+        run_id = cursor.lastrowid
+        rows = [(run_id, idx, category_id, mark, segment)
+                for idx, (mark, segment) in enumerate(zip(record.marks, segments))]
+        connection.executemany(
+            'INSERT INTO splits(run_id, idx, category_id, elapsed_ns, segment_ns) VALUES (?, ?, ?, ?, ?)',
+            rows,
+        )
+
+
+class History:
+    # 읽기 전용 조회 (WAL 이라 기록 스레드와 동시에 읽을 수 있다)
+    def __init__(self, path=HISTORY_PATH):
+        self.connection = connect(path)
+
+    def close(self):
+        self.connection.close()
+
+    def categories(self):
+        return [name for name, in self.connection.execute('SELECT name FROM categories ORDER BY name')]
+
+    def personal_best(self, category):
+        # (run id, total_ns, started_at) 또는 None
+        return self.connection.execute(
+            'SELECT runs.id, total_ns, started_at FROM runs '
+            'WHERE category_id = (SELECT id FROM categories WHERE name = ?) AND completed = 1 '
+            'ORDER BY total_ns LIMIT 1',
+            (category,),
+        ).fetchone()
+
+    def personal_bests(self):
+        return {category: self.personal_best(category) for category in self.categories()}
+
+    def run_splits(self, run_id):
+        return [mark for mark, in self.connection.execute(
+            'SELECT elapsed_ns FROM splits WHERE run_id = ? ORDER BY idx', (run_id,))]
+
+    def best_segments(self, category):
+        # 구간 번호별 최고 구간 시간 ns. 구간마다 인덱스 MIN 최적화를 타도록 나눠서 묻는다.
+        row = self.connection.execute('SELECT id FROM categories WHERE name = ?', (category,)).fetchone()
+        if row is None:
+            return []
+        category_id = row[0]
+        last = self.connection.execute(
+            'SELECT MAX(idx) FROM splits WHERE category_id = ?', (category_id,)).fetchone()[0]
+        if last is None:
+            return []
+        query = 'SELECT MIN(segment_ns) FROM splits WHERE category_id = ? AND idx = ?'
+        return [self.connection.execute(query, (category_id, idx)).fetchone()[0] for idx in range(last + 1)]
+
+    def last_runs(self, limit=10):
+        # [(run id, category, started_at, total_ns, completed)] 최근 것부터
+        return self.connection.execute(
+            'SELECT runs.id, categories.name, started_at, total_ns, completed FROM runs '
+            'JOIN categories ON categories.id = runs.category_id '
+            'ORDER BY started_at DESC LIMIT ?',
+            (limit,),
+        ).fetchall()
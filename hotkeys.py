@@ -0,0 +1,222 @@
+import abc
+import threading
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, pyqtSignal
+
+REPEAT_WINDOW_NS = 150_000_000  # 같은 명령이 이 간격 안에 다시 들어오면 채터링으로 보고 합친다
+
+# 핫키 이름 -> 명령
+DEFAULT_BINDINGS = {
+    'F2': 'reset',
+    'F3': 'start',
+    'F4': 'toggle',
+    'F5': 'split',
+    'F6': 'lock',
+    'F7': 'close',
+    'F8': 'countdown',
+}
+
+
+class Command:
+    # 훅 스레드가 큐에 넣는 작은 명령 객체
+    __slots__ = ('name', 'posted_ns', 'handled_ns')
+
+    def __init__(self, name, posted_ns):
+        self.name = name
+        self.posted_ns = posted_ns
+        self.handled_ns = 0
+
+
+class LatencyStats:
+    # 명령별 입력 → 처리 / 입력 → 페인트 지연 (ns) 최근 샘플
+    def __init__(self, maxlen=1000):
+        self.samples = deque(maxlen=maxlen)
+
+    def record(self, command, painted_ns):
+        self.samples.append((command.name, command.handled_ns - command.posted_ns, painted_ns - command.posted_ns))
+
+    def summary(self):
+        # {명령: (횟수, 평균 ms, 최대 ms)} 입력 → 페인트 기준
+        grouped = {}
+        for name, _, to_paint in self.samples:
+            grouped.setdefault(name, []).append(to_paint)
+        return {
+            name: (len(values), sum(values) / len(values) / 1e6, max(values) / 1e6)
+            for name, values in grouped.items()
+        }
+
+
+class CommandQueue(QObject):
+    # 키보드 훅 스레드는 post() 로 명령만 넣고 바로 돌아가고,
+    # Qt 이벤트 루프(GUI 스레드)가 drain() 에서 핸들러를 실행한다.
+    wake = pyqtSignal()
+
+    def __init__(self, handlers, maxlen=32, repeat_window_ns=REPEAT_WINDOW_NS, parent=None):
+        super().__init__(parent)
+        self.handlers = handlers
+        self.maxlen = maxlen
+        self.repeat_window_ns = repeat_window_ns
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.last_name = None
+        self.last_seen_ns = 0
+        self.dropped = 0
+        self.awaiting_paint = []
+        self.latency = LatencyStats()
+        # 다른 스레드에서 emit 하면 큐 연결로 GUI 스레드에서 drain 이 실행된다
+        self.wake.connect(self.drain)
+
+    def post(self, name):
+        now = time.monotonic_ns()
+        with self.lock:
+            # 같은 명령이 연달아 들어오면 마지막 입력 시각을 갱신하며 버린다
+            repeat = name == self.last_name and now - self.last_seen_ns < self.repeat_window_ns
+            self.last_name = name
+            self.last_seen_ns = now
+            if repeat or len(self.pending) >= self.maxlen:
+                self.dropped += 1
+                return False
+            was_empty = not self.pending
+            self.pending.append(Command(name, now))
+        if was_empty:
+            self.wake.emit()
+        return True
+
+    def drain(self):
+        with self.lock:
+            commands = list(self.pending)
+            self.pending.clear()
+        for command in commands:
+            # 핸들러가 다시 그리기를 예약했을 때만 페인트까지의 지연을 잰다.
+            # 바뀐 게 없는 명령(0 에서 리셋 등)은 다음에 상관없는 페인트가 올 때까지 남아 지연을 부풀린다
+            if not self.handlers[command.name]():
+                continue
+            command.handled_ns = time.monotonic_ns()
+            self.awaiting_paint.append(command)
+
+    def painted(self):
+        # paintEvent 끝에서 호출: 처리된 명령이 화면에 반영된 시각을 기록
+        if self.awaiting_paint:
+            now = time.monotonic_ns()
+            for command in self.awaiting_paint:
+                self.latency.record(command, now)
+            self.awaiting_paint.clear()
+
+
+class ScanCodeHotkeys:
+    # 전역 훅에서 등록한 스캔 코드만 보고 명령을 큐에 넣는다.
+    # keyboard.hook_key 로 스캔 코드별로 걸기 때문에 다른 키 입력에서는 이 코드가 아예 불리지 않고,
+    # 불리더라도 dict 조회와 set 갱신뿐이라 이벤트마다 새 객체를 만들지 않는다.
+    def __init__(self, commands, post):
+        self.commands = commands  # 스캔 코드 -> 명령
+        self.post = post
+        self.held = set()  # 눌려 있는 핫키 (자동 반복 무시용)
+
+    @classmethod
+    def from_bindings(cls, bindings, post):
+        import keyboard
+        commands = {}
+        for key, command in bindings.items():
+            for scan_code in keyboard.key_to_scan_codes(key):
+                commands[scan_code] = command
+        return cls(commands, post)
+
+    def on_event(self, event):
+        scan_code = event.scan_code
+        command = self.commands.get(scan_code)
+        if command is None:
+            return
+        if event.event_type == 'down':
+            # 누르고 있는 동안 들어오는 자동 반복 KEY_DOWN 은 무시
+            if scan_code not in self.held:
+                self.held.add(scan_code)
+                self.post(command)
+        else:
+            self.held.discard(scan_code)
+
+    def install(self):
+        import keyboard
+        for scan_code in self.commands:
+            keyboard.hook_key(scan_code, self.on_event)
+
+    def uninstall(self):
+        # hook_key 는 같은 콜백을 여러 키에 건 경우 개별 해제가 안 되므로 한 번에 푼다
+        import keyboard
+        keyboard.unhook_all()
+
+
+class KeyEvent:
+    # keyboard.KeyboardEvent 중 ScanCodeHotkeys 가 보는 필드만 가진 이벤트
+    __slots__ = ('event_type', 'scan_code')
+
+    def __init__(self, event_type, scan_code):
+        self.event_type = event_type
+        self.scan_code = scan_code
+
+
+class InputBackend(abc.ABC):
+    # 핫키 입력 백엔드: install 에서 bindings(키 이름 -> 명령)를 받아 키가 눌리면 post(명령) 을 부른다.
+    # uninstall 은 install 이 실패했거나 한 번도 부르지 않았어도 안전해야 한다.
+    @abc.abstractmethod
+    def install(self, bindings, post):
+        pass
+
+    @abc.abstractmethod
+    def uninstall(self):
+        pass
+
+
+class KeyboardBackend(InputBackend):
+    # keyboard 패키지의 전역 OS 훅 (Windows, 리눅스는 root 필요)
+    def __init__(self):
+        self.hotkeys = None
+
+    def install(self, bindings, post):
+        # 훅을 다 건 뒤에만 기억한다 (실패하면 keyboard 리스너가 뜨지 않아 풀 것도 없다)
+        hotkeys = ScanCodeHotkeys.from_bindings(bindings, post)
+        hotkeys.install()
+        self.hotkeys = hotkeys
+
+    def uninstall(self):
+        if self.hotkeys is not None:
+            self.hotkeys.uninstall()
+            self.hotkeys = None
+
+
+class SyntheticBackend(InputBackend):
+    # 프로세스 안에서 키 입력을 주입하는 백엔드 (헤드리스 테스트/벤치마크용).
+    # 키 이름을 그대로 스캔 코드 자리에 써서 ScanCodeHotkeys 의 필터/자동 반복 처리를 같이 탄다.
+    def __init__(self):
+        self.hotkeys = None
+        self.sent = []  # (키 이름, KEY_DOWN 시각 ns, 콜백이 돌아온 시각 ns)
+
+    def install(self, bindings, post):
+        self.hotkeys = ScanCodeHotkeys(dict(bindings), post)
+
+    def uninstall(self):
+        self.hotkeys = None
+
+    def press(self, key):
+        down_ns = time.monotonic_ns()
+        self.hotkeys.on_event(KeyEvent('down', key))
+        self.sent.append((key, down_ns, time.monotonic_ns()))
+
+    def release(self, key):
+        self.hotkeys.on_event(KeyEvent('up', key))
+
+    def tap(self, key):
+        self.press(key)
+        self.release(key)
+
+    def play(self, sequence):
+        # [(대기 초, 키 이름), ...] 을 별도 스레드(훅 스레드 역할)에서 차례로 누른다.
+        # 키 이름이 None 이면 기다리기만 한다.
+        def run():
+            for delay, key in sequence:
+                time.sleep(delay)
+                if key is not None:
+                    self.tap(key)
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,228 @@
+import calendar
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+
+SCAN_CHUNK = 64 << 20  # 한 번에 정규식으로 훑는 범위 (줄 경계에 맞춤)
+FINGERPRINT_BYTES = 4096  # 같은 로그인지 확인할 때 보는 앞부분
+
+# 이벤트 종류
+ZONE = 1
+LEVEL = 2
+DEATH = 3
+
+# [INFO Client 123] : You have entered Lioneye's Watch.
+# [INFO Client 123] : Name (Witch) is now level 12
+# [INFO Client 123] : Name has been slain.
+# 고정 문자열로 시작해야 정규식 엔진이 앞부분 검색으로 빠르게 건너뛴다.
+EVENT = re.compile(
+    rb'\[INFO Client \d+\] : (?:You have entered (.+?)\.|\S+ \(\w+\) is now level (\d+)|\S+ (has been slain)\.)\r?$',
+    re.MULTILINE,
+)
+
+MAGIC = b'MCIX'
+VERSION = 1
+# magic, version, 예약, 색인한 로그 오프셋, 레코드 수, 로그 앞부분 crc32, 오프셋 시점의 현재 지역
+HEADER = struct.Struct('<4sHHQQIi')
+# 시각(로그에 찍힌 현지 시각을 UTC 처럼 센 초), 종류, 값(레벨), 지역 id
+RECORD = struct.Struct('<IBBH')
+NO_ZONE = 0xFFFF
+# 줄 머리 시각 b'2023/08/20 14:23:11'
+STAMP = re.compile(rb'\d{4}/\d\d/\d\d \d\d:\d\d:\d\d')
+
+
+def parse_stamp(line_head, days_cache):
+    # b'2023/08/20 14:23:11' -> 초. 날짜 부분은 캐시해 두고 시분초만 더한다.
+    # 머리가 그 형식이 아니거나 없는 날짜면 None (색인할 때 그 줄은 건너뛴다)
+    if not STAMP.fullmatch(line_head):
+        return None
+    date = line_head[:10]
+    days = days_cache.get(date)
+    if days is None:
+        try:
+            days = calendar.timegm((int(date[:4]), int(date[5:7]), int(date[8:10]), 0, 0, 0))
+        except ValueError:
+            return None
+        days_cache[date] = days
+    return days + int(line_head[11:13]) * 3600 + int(line_head[14:16]) * 60 + int(line_head[17:19])
+
+
+class LogIndex:
+    # Client.txt 옆에 두는 압축 이진 색인 (<로그>.idx + 지역 이름 <로그>.zones).
+    # 레코드는 8바이트 고정 길이로 이어 붙이고, 헤더의 오프셋부터 이어서 색인한다.
+    # 헤더는 레코드를 다 쓴 뒤에 갱신하므로 중간에 죽으면 헤더 이후의 꼬리는 버려진다.
+    def __init__(self, log_path, index_path=None):
+        self.log_path = log_path
+        self.index_path = index_path or log_path + '.idx'
+        self.zones_path = self.index_path + '.zones'
+        self.zones = []  # id -> 이름
+        self.zone_ids = {}
+        self.offset = 0
+        self.count = 0
+        self.fingerprint = 0
+        self.current_zone = -1
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(HEADER.size)
+            magic, version, _, offset, count, fingerprint, current_zone = HEADER.unpack(header)
+        except (OSError, struct.error):
+            return
+        if magic != MAGIC or version != VERSION:
+            return
+        try:
+            with open(self.zones_path, encoding='utf-8') as f:
+                zones = f.read().split('\n')[:-1]
+        except OSError:
+            return
+        self.offset, self.count, self.fingerprint, self.current_zone = offset, count, fingerprint, current_zone
+        self.zones = zones
+        self.zone_ids = {name: i for i, name in enumerate(zones)}
+
+    def reset(self):
+        self.zones = []
+        self.zone_ids = {}
+        self.offset = self.count = self.fingerprint = 0
+        self.current_zone = -1
+
+    def zone_id(self, name, new_zones):
+        zone_id = self.zone_ids.get(name)
+        if zone_id is None:
+            zone_id = len(self.zones)
+            self.zones.append(name)
+            self.zone_ids[name] = zone_id
+            new_zones.append(name)
+        return zone_id
+
+    def update(self):
+        # 지난번 오프셋부터 로그 끝(마지막 줄바꿈)까지 색인하고 새로 붙은 레코드 수를 돌려준다
+        with open(self.log_path, 'rb') as log:
+            size = os.fstat(log.fileno()).st_size
+            if size == 0:
+                return 0
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # 로그가 잘렸거나 다른 파일로 바뀌었으면 처음부터
+                head = data[:min(FINGERPRINT_BYTES, self.offset)]
+                if size < self.offset or zlib.crc32(head) != self.fingerprint:
+                    self.reset()
+                end = data.rfind(b'\n') + 1
+                if end <= self.offset:
+                    return 0
+                records, new_zones = self.scan(data, self.offset, end)
+                fingerprint = zlib.crc32(data[:min(FINGERPRINT_BYTES, end)])
+        self.write(records, new_zones, end, fingerprint)
+        return len(records) // RECORD.size
+
+    def scan(self, data, start, end):
+        records = bytearray()
+        new_zones = []
+        days_cache = {}
+        current_zone = self.current_zone
+        pack = RECORD.pack
+        rfind = data.rfind
+        find = data.find
+        position = start
+        while position < end:
+            chunk_end = min(position + SCAN_CHUNK, end)
+            if chunk_end < end:
+                chunk_end = rfind(b'\n', position, chunk_end) + 1 or end
+            for match in EVENT.finditer(data, position, chunk_end):
+                line_start = rfind(b'\n', 0, match.start()) + 1
+                # 줄 머리의 태그여야 한다 (채팅 본문에 같은 문구가 있는 경우 제외)
+                if find(b'[', line_start, match.start()) != -1:
+                    continue
+                stamp = parse_stamp(data[line_start:line_start + 19], days_cache)
+                if stamp is None:
+                    continue
+                zone, level, slain = match.groups()
+                if zone is not None:
+                    current_zone = self.zone_id(zone.decode('utf-8', 'replace'), new_zones)
+                    records += pack(stamp, ZONE, 0, current_zone)
+                elif level is not None:
+                    records += pack(stamp, LEVEL, min(int(level), 255), current_zone if current_zone >= 0 else NO_ZONE)
+                else:
+                    records += pack(stamp, DEATH, 0, current_zone if current_zone >= 0 else NO_ZONE)
+            position = chunk_end
+        self.current_zone = current_zone
+        return records, new_zones
+
+    def write(self, records, new_zones, offset, fingerprint):
+        mode = 'r+b' if self.count and os.path.exists(self.index_path) else 'w+b'
+        with open(self.index_path, mode) as f:
+            # 헤더가 모르는 꼬리(쓰다 죽은 레코드)는 잘라 낸다
+            f.truncate(HEADER.size + self.count * RECORD.size)
+            f.seek(HEADER.size + self.count * RECORD.size)
+            f.write(records)
+            with open(self.zones_path, 'a' if mode == 'r+b' else 'w', encoding='utf-8') as zones:
+                zones.write(''.join(name + '\n' for name in (new_zones if mode == 'r+b' else self.zones)))
+            f.flush()
+            self.offset = offset
+            self.count += len(records) // RECORD.size
+            self.fingerprint = fingerprint
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, 0, self.offset, self.count, self.fingerprint, self.current_zone))
+
+    def events(self, since=None, until=None):
+        # (시각, 종류, 값, 지역 id) 를 색인 파일에서 바로 읽는다
+        if not self.count:
+            return
+        with open(self.index_path, 'rb') as f:
+            f.seek(HEADER.size)
+            records = f.read(self.count * RECORD.size)
+        for record in RECORD.iter_unpack(records):
+            if since is not None and record[0] < since:
+                continue
+            if until is not None and record[0] >= until:
+                break
+            yield record
+
+    def zone_times(self, since=None, until=None, max_gap=2 * 3600):
+        # 지역별 머문 시간 (초). 다음 지역 입장까지를 그 지역 시간으로 보고,
+        # 게임을 끈 동안처럼 max_gap 보다 긴 간격은 세지 않는다.
+        totals = {}
+        previous_stamp = previous_zone = None
+        for stamp, kind, _, zone in self.events(since, until):
+            if kind != ZONE:
+                continue
+            if previous_zone is not None and stamp - previous_stamp <= max_gap:
+                name = self.zones[previous_zone]
+                totals[name] = totals.get(name, 0) + stamp - previous_stamp
+            previous_stamp, previous_zone = stamp, zone
+        return totals
+
+    def counts(self, since=None, until=None):
+        # {지역 이름: (입장 수, 죽은 수)}
+        counts = {}
+        for _, kind, _, zone in self.events(since, until):
+            if zone == NO_ZONE or kind == LEVEL:
+                continue
+            name = self.zones[zone]
+            entered, deaths = counts.get(name, (0, 0))
+            counts[name] = (entered + (kind == ZONE), deaths + (kind == DEATH))
+        return counts
+
+
+def parse_since(text):
+    # 'YYYY/MM/DD' 또는 'YYYY/MM/DD HH:MM:SS' -> 색인 시각
+    text = text.strip().replace('-', '/')
+    if len(text) == 10:
+        text += ' 00:00:00'
+    stamp = parse_stamp(text.encode(), {})
+    if stamp is None:
+        raise ValueError(f"expected YYYY/MM/DD [HH:MM:SS], got {text!r}")
+    return stamp
+
+
+if __name__ == '__main__':
+    # python log_index.py Client.txt [YYYY/MM/DD]  : 색인을 갱신하고 그 날짜 이후 지역별 시간 출력
+    index = LogIndex(sys.argv[1])
+    added = index.update()
+    print(f"{added} new events, {index.count} indexed")
+    since = parse_since(sys.argv[2]) if len(sys.argv) > 2 else None
+    for name, seconds in sorted(index.zone_times(since).items(), key=lambda item: -item[1]):
+        print(f"{seconds // 3600:4d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}  {name}")
@@ -0,0 +1,61 @@
+import os
+import sys
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from client_log import LogTail, zones_in
+
+# 윈도우는 다른 프로세스가 열어 둔 채 덧붙이는 파일의 변경 알림이 늦을 수 있어 느린 확인을 같이 건다
+FALLBACK_POLL_MS = 1000 if sys.platform == 'win32' else 0
+
+
+class ClientLogWatcher(QObject):
+    # Client.txt 를 파일 감시(inotify / ReadDirectoryChangesW)로 지켜보다가 덧붙은 부분만 읽어
+    # 지역 이동을 알린다. 변경이 없으면 깨어나지 않는다.
+    zone_entered = pyqtSignal(str)
+
+    def __init__(self, path, from_end=True, poll_ms=FALLBACK_POLL_MS, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.tail = LogTail(path, from_end)
+        self.bytes_read = 0
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_changed)
+        # 로테이션/새로 생성은 디렉터리 변경으로 알 수 있다
+        self.watcher.directoryChanged.connect(self.on_changed)
+        self.watch()
+        self.poll = None
+        if poll_ms:
+            self.poll = QTimer(self)
+            self.poll.timeout.connect(self.on_changed)
+            self.poll.start(poll_ms)
+
+    def set_polling(self, enabled):
+        # 지역 이동으로 바뀔 것이 없는 동안(수동으로 멈춤, 자동 스플릿 없음)은 느린 확인을 끄고
+        # 파일 변경 알림만 기다린다
+        if self.poll is None:
+            return
+        if not enabled:
+            self.poll.stop()
+        elif not self.poll.isActive():
+            self.poll.start()
+
+    def watch(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if directory not in self.watcher.directories():
+            self.watcher.addPath(directory)
+        # 파일이 바뀌어 끼워졌으면 감시가 풀리므로 다시 건다
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+
+    def on_changed(self, *args):
+        self.watch()
+        for block in self.tail.blocks():
+            self.bytes_read += len(block)
+            for zone in zones_in(block):
+                self.zone_entered.emit(zone)
+
+    def close(self):
+        if self.poll is not None:
+            self.poll.stop()
+        self.watcher.removePaths(self.watcher.files() + self.watcher.directories())
+        self.tail.close()
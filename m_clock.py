@@ -1,20 +1,51 @@
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QWidget, QLCDNumber, QSystemTrayIcon, QMenu, QAction
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QFileSystemWatcher, QRect
 from PyQt5.QtGui import QIcon, QFont, QPainter, QColor, QPen
-import ctypes
 import configparser
-import keyboard
+import math
 import threading
-import time
-from PyQt5.QtWidgets import QMessageBox
+from collections import deque
+from stopwatch import NS_PER_SEC
+from digit_renderer import DigitRenderer, BACKGROUND
+from screen_provider import create_screen_provider
+from geometry import GeometryCache
+from hotkeys import CommandQueue, KeyboardBackend
+from config_store import ConfigWriter
+from settings import Settings
+from checkpoint import Checkpoint
+from clock import SYSTEM_CLOCK
+from session import TimerSession
+
+TICK_SLACK_NS = 2_000_000  # 가까운 마감들을 한 번에 깨우는 허용 지연
+STATS_SYNC_TIMEOUT = 2.0  # 통계 창: 기록 스레드가 남은 런을 쓸 때까지 기다리는 최대 시간 (초)
+
+def play_alert_sound():
+    # 윈도우에서는 시스템 경고음 (비동기), 그 외에는 Qt 기본 비프음
+    if sys.platform == 'win32':
+        import winsound
+        winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+    else:
+        QApplication.beep()
 
 class TimerSignals(QObject):
     update = pyqtSignal(int)
-    
+    statistics = pyqtSignal(str)
+
+def build_state_styles(colors):
+    # (타이머 상태, 잠금 여부) 조합마다 숫자 색상과 테두리 펜을 미리 만들어 둔다
+    styles = {}
+    for state in ('running', 'paused', 'zero', 'alert', 'ahead', 'behind', 'gold'):
+        digit_color = QColor(colors[state])
+        for locked in (True, False):
+            pen = QPen(QColor(colors['locked' if locked else 'unlocked']))
+            pen.setWidth(2)  # 테두리 두께 설정
+            styles[(state, locked)] = (digit_color, pen)
+    return styles
+
 class OverlayTimer(QWidget):
-    def __init__(self):
+    def __init__(self, screen_provider=None, input_backend=None, history_writer=None, checkpoint=None, clock=None):
         super().__init__()
         self.setWindowFlags(
             Qt.Window |  # 작업 표시줄에 표시하기 위해 Qt.Window 플래그 사용
@@ -25,55 +56,182 @@ class OverlayTimer(QWidget):
         self.setWindowIcon(QIcon("m_clock.ico"))
         self.signals = TimerSignals()
         self.signals.update.connect(self.updateDisplay)
+        self.signals.statistics.connect(self.show_statistics_text)
+        self.statistics_thread = None
         
         self.config = configparser.ConfigParser()
         self.ini_path = 'timer_config.ini'
+        # 설정 파일 쓰기는 모아서 백그라운드에서 원자적으로
+        self.config_writer = ConfigWriter(self.ini_path)
         self.load_config()
-        
+
+        # 화면 크기 변화는 폴링 대신 QScreen 시그널로 받는다
+        self.screen_provider = screen_provider or create_screen_provider(self)
+        self.screen_provider.changed.connect(self.update_size_and_position)
+        # 핫키 입력 백엔드 (기본은 keyboard 패키지의 전역 훅)
+        self.input_backend = input_backend or KeyboardBackend()
+        # 끝난 런은 SQLite 기록 스레드로 넘긴다 (GUI 스레드에서는 큐에 넣기만).
+        # 기본 기록기는 첫 화면을 그린 뒤 finish_startup 에서 만든다
+        self.history_writer = history_writer
+        # 모든 타이머가 보는 시계 (테스트/재생에서는 clock.VirtualClock)
+        self.clock = clock or SYSTEM_CLOCK
+        # 프로세스가 죽어도 이어서 달릴 수 있게 상태 전환마다 남기는 체크포인트
+        self.checkpoint = checkpoint or Checkpoint(wall_clock=self.clock.wall_ns)
+        # 화면별(이름, 영역, DPR) 위젯 지오메트리 캐시
+        self.geometry_cache = GeometryCache(self.settings.ratios)
+
+        # 첫 화면에 필요 없는 것(트레이, 핫키, 설정/로그 감시, 기록 스레드)은 첫 페인트 뒤로 미룬다
+        self.started = False
+        self.tray_icon = None
+        self.hotkey_error = None  # 전역 핫키를 걸지 못한 이유 (트레이로 알린다)
+        self.log_watcher = None
         self.initUI()
-        self.initTrayIcon()
 
     def initUI(self):
-        # LCD 숫자 디스플레이 설정
-        self.lcd = QLCDNumber(self)
-        self.lcd.setDigitCount(8)
-        self.lcd.setSegmentStyle(QLCDNumber.Flat)
-
-        # 타이머 설정
-        self.seconds = 0
-        self.is_running = False
-        self.timer_thread = None
+        # 숫자 디스플레이 설정 (글리프 아틀라스에서 바뀐 글자 칸만 다시 그림)
+        self.renderer = DigitRenderer()
+        self.base_rect = None  # [Size] 비율로 잡은 기준 영역 (글자 칸 크기)
+        self.screen_area = None
+
+        # 상태별 스타일은 미리 만들어 두고 상태가 바뀔 때만 적용
+        self.state_styles = build_state_styles(self.settings.colors)
+        self.style_key = None
+        self.digit_color = None
+        self.border_pen = None
+
+        # 타이머 상태 전환은 Qt 없는 TimerSession 이 맡고, 여기서는 그리기와 깨어날 시각 예약만 한다.
+        # (경과 시간은 Stopwatch 의 monotonic 기준점에서 계산, 스플릿/랩은 F5)
+        self.session = TimerSession(
+            self.clock, slack_ns=TICK_SLACK_NS, category=self.settings.category, history_writer=self.history_writer,
+            checkpoint=self.checkpoint, comparisons=self.load_comparison,
+        )
+        self.stopwatch = self.session.stopwatch
+        self.splits = self.session.splits
+        self.scheduler = self.session.scheduler
         self.is_locked = False
-
-        # 화면 크기 체크 타이머
-        self.screen_check_timer = QTimer(self)
-        self.screen_check_timer.timeout.connect(self.check_screen_size)
-        self.screen_check_timer.start(1000)  # 1초마다 화면 크기 체크
+        # 강제 종료 전에 남긴 상태가 있으면 이어서 (달리던 중이었으면 그동안 흐른 시간 포함)
+        self.session.restore()
+        # PB 조회용 연결 (처음 쓸 때 연다)
+        self.history = None
+
+        # 틱 스케줄러: 스레드 대신 Qt 이벤트 루프의 단발 타이머 하나를
+        # 모든 타이머(메인 + [Timers] 보조 타이머) 중 가장 이른 표시 변경 시각에 다시 건다
+        self.session.set_timers(self.settings.timers)
+        # 카운트다운 알림이 목표 시각보다 늦게 울린 정도 (ns) 최근 샘플
+        self.alert_lateness = deque(maxlen=1000)
+        self.tick_timer = QTimer(self)
+        self.tick_timer.setSingleShot(True)
+        self.tick_timer.setTimerType(Qt.PreciseTimer)
+        self.tick_timer.timeout.connect(self.on_tick)
 
         self.update_size_and_position()
         self.updateDisplay(self.seconds)
+        self.schedule_tick()
+
+        # 핫키 명령 큐: 훅 스레드는 명령 이름만 넣고, GUI 스레드가 꺼내 실행한다
+        self.command_queue = CommandQueue({
+            'reset': self.reset_timer,
+            'start': self.start_timer,
+            'toggle': self.toggle_timer,
+            'split': self.split_timer,
+            'lock': self.toggle_lock,
+            'countdown': self.restart_countdowns,
+            'close': self.close,
+        }, parent=self)
+
+        self.setWindowTitle("PoE Timer v0.1")  # 작업 표시줄에 표시될 제목 설정
+
+    def finish_startup(self):
+        # 첫 페인트 직후 한 번 (닫기처럼 그 전에 필요해지면 그때 바로)
+        if self.started:
+            return
+        self.started = True
+        from client_log import AutoSplitter
+
+        # 설정 파일이 바뀌면 다시 읽어 바뀐 항목만 적용 (폴링 없이 파일 감시)
+        self.config_watcher = QFileSystemWatcher(self)
+        self.config_watcher.fileChanged.connect(self.reload_config)
+        self.config_watcher.directoryChanged.connect(self.reload_config)
+        self.watch_config()
+
+        if self.history_writer is None:
+            from history import HistoryWriter
+            self.history_writer = HistoryWriter()
+            self.session.history_writer = self.history_writer
+        # 이어 달리는 런이면 비교 기준도 지금 읽는다
+        if self.stopwatch.elapsed_ns() > 0:
+            self.session.comparison = self.session.load_comparison()
+            self.updateDisplay(self.seconds)
 
         # 전역 핫키 등록
         self.register_hotkeys()
 
-        self.setWindowTitle("PoE Timer v0.1")  # 작업 표시줄에 표시될 제목 설정
+        # Client.txt 지역 이동으로 자동 시작/스플릿/멈춤
+        self.session.autosplitter = AutoSplitter(*self.settings.autosplit)
+        self.start_log_watcher()
+
+        self.initTrayIcon()
+        # 트레이보다 먼저 핫키를 걸었으므로 실패했으면 지금 알린다
+        self.report_hotkey_error()
 
     def initTrayIcon(self):
+        from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(QIcon("m_clock.png"))  # 아이콘 파일 경로 지정
         
         # 트레이 아이콘 메뉴 생성
         tray_menu = QMenu()
         show_action = QAction("Show", self)
+        stats_action = QAction("Statistics", self)
         quit_action = QAction("Exit", self)
         show_action.triggered.connect(self.show)
+        stats_action.triggered.connect(self.show_statistics)
         quit_action.triggered.connect(self.close)  # self.close()를 호출하도록 변경
         tray_menu.addAction(show_action)
+        tray_menu.addAction(stats_action)
         tray_menu.addAction(quit_action)
         
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
         
+    def show_statistics(self):
+        # 현재 카테고리의 런 통계. 기록 스레드 대기, 읽기, 계산은 백그라운드 스레드에서 하고
+        # 결과 글만 시그널로 받아 GUI 스레드에서 창을 띄운다 (numpy 는 이 창을 열 때만 불러온다)
+        if self.statistics_thread is not None and self.statistics_thread.is_alive():
+            return
+        self.statistics_thread = threading.Thread(
+            target=self.compute_statistics, args=(self.settings.category,), daemon=True)
+        self.statistics_thread.start()
+
+    def compute_statistics(self, category):
+        import sqlite3
+        from history import History
+        try:
+            import analytics
+        except ImportError:
+            self.signals.statistics.emit("numpy is required for statistics.")
+            return
+        # 방금 끝낸 런까지 보이게 기록 스레드를 기다린다 (죽었거나 막혀 있으면 시간 제한 뒤 있는 것만)
+        written = self.history_writer.sync(STATS_SYNC_TIMEOUT) and self.history_writer.error is None
+        try:
+            # 조회용 연결(history_reader)은 GUI 스레드 것이라 따로 연다
+            history = History(self.history_writer.path)
+            try:
+                table = analytics.load_runs(history.connection, category)
+            finally:
+                history.close()
+        except sqlite3.Error as e:
+            self.signals.statistics.emit(f"Could not read history: {e}")
+            return
+        text = analytics.format_summary(analytics.summarize(table))
+        if not written:
+            text += "\n\nThe latest runs are not written yet and may be missing."
+        self.signals.statistics.emit(text)
+
+    def show_statistics_text(self, text):
+        from PyQt5.QtWidgets import QMessageBox
+        QMessageBox.information(self, "Statistics", text)
+
     def load_config(self):
         if os.path.exists(self.ini_path):
             self.config.read(self.ini_path)
@@ -81,60 +239,217 @@ class OverlayTimer(QWidget):
             self.config['Position'] = {'x': '0.9', 'y': '0.05'}
             self.config['Size'] = {'width': '0.05', 'height': '0.025'}
             self.save_config()
+        # 설정 값은 여기서 한 번만 파싱하고 이후에는 self.settings 필드를 쓴다
+        self.settings = Settings.from_config(self.config)
+
+    def watch_config(self):
+        # os.replace 로 바뀐 파일은 감시가 풀리므로 다시 건다.
+        # 파일이 아직 없으면 생길 때까지 디렉터리를 감시한다.
+        directory = os.path.dirname(os.path.abspath(self.ini_path))
+        if os.path.exists(self.ini_path):
+            if self.ini_path not in self.config_watcher.files():
+                self.config_watcher.addPath(self.ini_path)
+            if directory in self.config_watcher.directories():
+                self.config_watcher.removePath(directory)
+            return True
+        if directory not in self.config_watcher.directories():
+            self.config_watcher.addPath(directory)
+        return False
+
+    def reload_config(self, path=None):
+        if not self.watch_config():
+            return
+        try:
+            with open(self.ini_path) as f:
+                text = f.read()
+        except OSError:
+            return
+        # 우리가 방금 쓴 내용이면 무시
+        if text == self.config_writer.written:
+            return
+        # 문법 오류나 잘못된 값 (x = 0.9a 등) 이면 지금 설정을 그대로 두고 다음 저장을 기다린다
+        config = configparser.ConfigParser()
+        try:
+            config.read_string(text)
+            settings = Settings.from_config(config)
+        except (configparser.Error, ValueError) as e:
+            print(f"Ignoring invalid {self.ini_path}: {e}", file=sys.stderr)
+            return
+        changed = self.settings.changed_fields(settings)
+        self.config = config
+        self.settings = settings
+        self.apply_settings(changed)
+
+    def apply_settings(self, changed):
+        # 바뀐 항목만 창을 다시 만들지 않고 적용한다
+        if 'ratios' in changed or 'screen' in changed:
+            self.geometry_cache.set_ratios(self.settings.ratios)
+            self.update_size_and_position()
+        if 'colors' in changed:
+            self.state_styles = build_state_styles(self.settings.colors)
+            self.style_key = None
+            self.apply_state_style()
+        if 'hotkeys' in changed:
+            self.input_backend.uninstall()
+            self.register_hotkeys()
+        if 'autosplit' in changed:
+            from client_log import AutoSplitter
+            self.session.autosplitter = AutoSplitter(*self.settings.autosplit)
+            if self.log_watcher is not None:
+                self.log_watcher.set_polling(self.session.listens_for_zones())
+        if 'log_path' in changed:
+            self.start_log_watcher()
+        if 'category' in changed:
+            self.session.category = self.settings.category
+            self.session.baseline = None
+        if 'timers' in changed:
+            self.session.set_timers(self.settings.timers)
+            self.schedule_tick()
+            self.updateDisplay(self.seconds)
 
     def save_config(self):
-        with open(self.ini_path, 'w') as configfile:
-            self.config.write(configfile)
+        self.config_writer.save(self.config)
 
     def register_hotkeys(self):
-        keyboard.add_hotkey('F2', self.reset_timer_wrapper)
-        keyboard.add_hotkey('F3', self.start_timer_wrapper)
-        keyboard.add_hotkey('F4', self.toggle_timer_wrapper)
-        keyboard.add_hotkey('F6', self.toggle_lock)
-        keyboard.add_hotkey('F7', self.close)
+        # 콜백은 keyboard 훅 스레드에서 불리므로 위젯을 건드리지 않고 큐에만 넣는다.
+        # 전역 훅을 걸 수 없으면 (리눅스에서 root 아님, dumpkeys 없음, 잘못된 키 이름) 핫키 없이 계속 돈다.
+        # finish_startup 은 Qt 슬롯에서 불리므로 여기서 예외가 새면 PyQt5 가 프로세스를 끝내 버린다
+        try:
+            self.input_backend.install(self.settings.hotkeys, self.command_queue.post)
+            self.hotkey_error = None
+        except (ImportError, OSError, ValueError) as e:
+            self.hotkey_error = f"Global hotkeys are unavailable: {e}"
+            print(self.hotkey_error, file=sys.stderr)
+            self.report_hotkey_error()
+
+    def report_hotkey_error(self):
+        if self.hotkey_error and self.tray_icon is not None:
+            from PyQt5.QtWidgets import QSystemTrayIcon
+            self.tray_icon.showMessage("PoE Timer", self.hotkey_error, QSystemTrayIcon.Warning, 5000)
+
+    def start_log_watcher(self):
+        if self.log_watcher is not None:
+            self.log_watcher.close()
+            self.log_watcher = None
+        if self.settings.log_path:
+            from log_watcher import ClientLogWatcher
+            # 이미 쌓인 로그는 건너뛰고 지금부터 덧붙는 줄만
+            self.log_watcher = ClientLogWatcher(self.settings.log_path, parent=self)
+            self.log_watcher.zone_entered.connect(self.on_zone_entered)
+            self.log_watcher.set_polling(self.session.listens_for_zones())
+
+    def on_zone_entered(self, zone):
+        if self.session.on_zone(zone) is not None:
+            self.refresh()
+
+    @property
+    def seconds(self):
+        return self.stopwatch.seconds
+
+    @property
+    def is_running(self):
+        return self.stopwatch.is_running
+
+    def history_reader(self):
+        # 조회용 연결은 처음 쓸 때 한 번 열어 계속 쓴다
+        if self.history is None:
+            from history import History
+            self.history = History(self.history_writer.path)
+        return self.history
+
+    def load_comparison(self):
+        # 카테고리의 PB/구간 최고 기록을 배열로 읽어 둔다 (세션이 처음 한 번만 부른다).
+        # 기록 스레드를 기다리지 않는다: 이 프로세스에서 끝낸 런은 세션이 메모리에서 합친다
+        import sqlite3
+        from comparison import Comparison
+        if self.history_writer is None:
+            return None
+        try:
+            return Comparison.from_history(self.history_reader(), self.settings.category)
+        except sqlite3.Error as e:
+            print(f"Error loading personal best: {e}")
+            return None
 
-    def reset_timer_wrapper(self):
-        self.reset_timer()
-
-    def start_timer_wrapper(self):
-        self.start_timer()
+    def updateDisplay(self, seconds):
+        # 메인 표시 뒤에 PB/SOB 차이와 보조 타이머를 이어 붙여 한 오버레이에 그린다.
+        # 다시 그리기를 예약했으면 True (핫키 지연 측정은 이때만 페인트를 기다린다)
+        dirty = self.renderer.set_text('\n'.join(self.session.display_rows(seconds)))
+        if dirty is None:
+            # 줄 수나 글자 배치가 바뀌었으면 위젯 크기도 맞춘다
+            self.fit_to_text()
+        if self.apply_state_style():
+            return True
+        # 색상이 그대로면 바뀐 글자 칸만 갱신
+        if dirty is None:
+            self.update()
+            return True
+        for rect in dirty:
+            self.update(rect)
+        return bool(dirty)
+
+    def apply_state_style(self):
+        # 상태 전환 시에만 색상을 바꾸고 전체를 다시 그린다
+        key = (self.session.state(), self.is_locked)
+        if key == self.style_key:
+            return False
+        self.style_key = key
+        self.digit_color, self.border_pen = self.state_styles[key]
+        self.update()
+        return True
+
+    def schedule_tick(self):
+        # 가장 이른 마감까지 남은 시간만큼 단발 타이머 예약 (올림해서 경계 직후에 깨어남).
+        # 달리는 타이머가 없으면 (0 이거나 멈춤) 틱 타이머를 걸지 않는다.
+        # Client.txt 느린 확인(윈도우)은 지역 이동이 타이머를 바꿀 수 있는 동안에는 켜 둔다
+        # (0 에서 자동 시작, 은신처에서 자동으로 멈춘 뒤 다시 달리기). 알림이 늦어도 놓치지 않게.
+        wake = self.session.next_wake_ns()
+        if self.log_watcher is not None:
+            self.log_watcher.set_polling(self.session.listens_for_zones())
+        if wake is None:
+            self.tick_timer.stop()
+            return
+        self.tick_timer.start(max(0, math.ceil((wake - self.stopwatch.now()) / 1_000_000)))
+
+    def on_tick(self):
+        due, alerts = self.session.tick()
+        for timer, threshold_ns, late_ns in alerts:
+            self.alert(timer, threshold_ns, late_ns)
+        if due:
+            self.updateDisplay(self.seconds)
+        self.schedule_tick()
+
+    def alert(self, timer, threshold_ns, late_ns):
+        self.alert_lateness.append(late_ns)
+        if threshold_ns:
+            message = f"{timer.name}: {threshold_ns / NS_PER_SEC:g}s left"
+        else:
+            message = f"{timer.name}: time is up"
+        if self.tray_icon is not None:
+            from PyQt5.QtWidgets import QSystemTrayIcon
+            self.tray_icon.showMessage("PoE Timer", message, QSystemTrayIcon.Warning, 3000)
+        play_alert_sound()
 
-    def toggle_timer_wrapper(self):
-        self.toggle_timer()
+    def refresh(self):
+        # 상태 전환 뒤: 다음 깨어날 시각을 다시 잡고 표시를 갱신한다
+        self.schedule_tick()
+        return self.updateDisplay(self.seconds)
 
-    def updateDisplay(self, seconds):
-        m, s = divmod(seconds, 60)
-        h, m = divmod(m, 60)
-        time = f"{h:02d}:{m:02d}:{s:02d}"
-        self.lcd.display(time)
-        self.update()  # 화면 갱신
-
-    def timer_function(self):
-        while self.is_running:
-            time.sleep(1)
-            self.seconds += 1
-            self.signals.update.emit(self.seconds)
+    # 핫키 핸들러는 다시 그리기를 예약했는지 돌려준다 (CommandQueue.drain 참고)
+    def restart_countdowns(self):
+        return self.session.restart_countdowns() and self.refresh()
 
     def start_timer(self):
-        if not self.is_running:
-            self.is_running = True
-            self.timer_thread = threading.Thread(target=self.timer_function)
-            self.timer_thread.start()
+        return self.session.start() and self.refresh()
 
     def toggle_timer(self):
-        if self.is_running:
-            self.is_running = False
-            if self.timer_thread:
-                self.timer_thread.join()
-        else:
-            self.start_timer()
+        return self.session.toggle() and self.refresh()
+
+    def split_timer(self):
+        return self.session.split() and self.updateDisplay(self.seconds)
 
     def reset_timer(self):
-        self.is_running = False
-        if self.timer_thread:
-            self.timer_thread.join()
-        self.seconds = 0
-        self.signals.update.emit(self.seconds)
+        self.session.reset()
+        return self.refresh()
 
     def toggle_lock(self):
         self.is_locked = not self.is_locked
@@ -143,31 +458,27 @@ class OverlayTimer(QWidget):
         else:
             self.setWindowFlags(self.windowFlags() & ~Qt.WindowTransparentForInput)
         self.show()  # 윈도우 플래그 변경 후 다시 표시
-        self.update()  # 화면 갱신
+        self.apply_state_style()
+        return True
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        # 테두리 색상 설정
-        if self.is_locked:
-            border_color = QColor(255, 255, 255)  # 흰색
-        else:
-            border_color = QColor(255, 0, 0)  # 빨간색
-
-        # 테두리 그리기
-        pen = QPen(border_color)
-        pen.setWidth(2)  # 테두리 두께 설정
-        painter.setPen(pen)
-        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
-
-        # LCD 색상 설정
-        if self.is_running:
-            lcd_color = "rgb(255, 255, 255)"  # 하얀색
-        elif self.seconds > 0:
-            lcd_color = "rgb(255, 165, 0)"  # 오렌지색
-        else:
-            lcd_color = "rgb(192, 192, 192)"  # 회색
-        self.lcd.setStyleSheet(f"background-color: rgba(0, 0, 0, 100); color: {lcd_color};")
+        clip = event.rect()
+        painter.fillRect(clip, BACKGROUND)
+        self.renderer.paint(painter, clip, self.digit_color)
+
+        # 테두리 그리기 (펜은 apply_state_style 에서 미리 골라 둠, 숫자 칸만 갱신될 때는 생략)
+        border = self.rect().adjusted(1, 1, -1, -1)
+        if not border.adjusted(1, 1, -1, -1).contains(clip):
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self.border_pen)
+            painter.drawRect(border)
+        painter.end()
+        # 핫키 입력 → 페인트 지연 기록
+        self.command_queue.painted()
+        if not self.started:
+            # 첫 프레임을 내보낸 뒤 이벤트 루프로 돌아가서 나머지를 준비한다
+            QTimer.singleShot(0, self.finish_startup)
 
     def mousePressEvent(self, event):
         if not self.is_locked:
@@ -187,35 +498,43 @@ class OverlayTimer(QWidget):
                 self.save_position()
 
     def update_size_and_position(self):
-        user32 = ctypes.windll.user32
-        self.screen_width = user32.GetSystemMetrics(0)
-        self.screen_height = user32.GetSystemMetrics(1)
-
-        width_ratio = self.config.getfloat('Size', 'width', fallback=0.05)
-        height_ratio = self.config.getfloat('Size', 'height', fallback=0.025)
-        x_ratio = self.config.getfloat('Position', 'x', fallback=0.9)
-        y_ratio = self.config.getfloat('Position', 'y', fallback=0.05)
-
-        self.timer_width = int(self.screen_width * width_ratio)
-        self.timer_height = int(self.screen_height * height_ratio)
-        pos_x = int(self.screen_width * x_ratio)
-        pos_y = int(self.screen_height * y_ratio)
-
-        self.setGeometry(pos_x, pos_y, self.timer_width, self.timer_height)
-        self.lcd.resize(self.timer_width, self.timer_height)
-
-    def check_screen_size(self):
-        user32 = ctypes.windll.user32
-        new_width = user32.GetSystemMetrics(0)
-        new_height = user32.GetSystemMetrics(1)
-        if new_width != self.screen_width or new_height != self.screen_height:
-            self.update_size_and_position()
+        # 화면 키로 캐시를 찾는다. 캐시의 영역은 [Size] 비율로 잡은 글자 칸 기준이고,
+        # 실제 위젯 크기는 fit_to_text 가 글자 줄에 맞춰 정한다
+        screen = self.screen_provider.find_screen(self.settings.screen)
+        screen_key = self.screen_provider.screen_key(screen)
+        self.base_rect = self.geometry_cache.lookup(screen_key)
+        self.screen_area = QRect(*screen_key[1])
+        # 크기나 DPR 이 바뀐 경우에만 글리프 아틀라스를 다시 만든다
+        if self.renderer.resize(self.base_rect.width(), self.base_rect.height(), screen_key[2]):
+            self.update()
+        self.fit_to_text()
+
+    def fit_to_text(self):
+        # 기준 영역의 왼쪽 위에서 모든 줄이 들어가는 크기로 (칸은 줄이지 않는다).
+        # 화면 오른쪽/아래로 넘치면 안쪽으로 밀고, 영역이 실제로 달라졌을 때만 setGeometry 한 번
+        if self.base_rect is None or self.renderer.content_size is None:
+            return
+        width, height = self.renderer.content_size
+        area = self.screen_area
+        x = max(area.left(), min(self.base_rect.x(), area.right() + 1 - width))
+        y = max(area.top(), min(self.base_rect.y(), area.bottom() + 1 - height))
+        rect = QRect(x, y, width, height)
+        if rect != self.geometry():
+            self.setGeometry(rect)
 
     def save_position(self):
-        x = self.x() / self.screen_width
-        y = self.y() / self.screen_height
-        self.config['Position'] = {'x': str(x), 'y': str(y)}
+        # 위젯 중심이 놓인 화면을 기준으로 비율을 저장한다
+        screen = self.screen_provider.screen_at(self.geometry().center())
+        screen_x, screen_y, screen_width, screen_height = self.screen_provider.screen_key(screen)[1]
+        x = (self.x() - screen_x) / screen_width
+        y = (self.y() - screen_y) / screen_height
+        self.settings.screen = screen.name()
+        self.settings.ratios = self.settings.ratios._replace(x=x, y=y)
+        self.geometry_cache.set_ratios(self.settings.ratios)
+        self.config['Position'] = {'x': str(x), 'y': str(y), 'screen': self.settings.screen}
         self.save_config()
+        # 다른 모니터로 옮겨졌다면 그 화면의 크기/DPR 에 맞춘다
+        self.update_size_and_position()
 
     # def closeEvent(self, event):
     #     # 타이머 중지
@@ -227,17 +546,25 @@ class OverlayTimer(QWidget):
     #     self.save_position()
     #     event.accept()
     def closeEvent(self, event):
+        from PyQt5.QtWidgets import QMessageBox, QSystemTrayIcon
+        self.finish_startup()
         reply = QMessageBox.question(self, 'Exit', 'Do you want to exit the application?',
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            # 타이머 중지
-            self.is_running = False
-            if self.timer_thread:
-                self.timer_thread.join()
+            # 진행 중이던 런 기록 후 타이머 중지.
+            # 정상 종료는 기록에 남겼으므로 다음 실행은 0 부터
+            self.session.reset()
+            self.tick_timer.stop()
+            self.checkpoint.close()
             # 핫키 해제
-            keyboard.unhook_all()
+            self.input_backend.uninstall()
             self.save_position()
+            if not self.config_writer.flush():
+                print(f"Position not saved: {self.config_writer.error}", file=sys.stderr)
+            self.history_writer.close()
+            if self.history is not None:
+                self.history.close()
             event.accept()
             QApplication.instance().quit()
         else:
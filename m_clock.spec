@@ -1,4 +1,70 @@
 # -*- mode: python ; coding: utf-8 -*-
+# 빌드 프로필 (PyInstaller 6 의 "--" 뒤 인자):
+#   pyinstaller m_clock.spec                          # onefile: 예전과 같은 단일 EXE
+#   pyinstaller m_clock.spec -- --profile onefile-slim # 단일 EXE + 안 쓰는 Qt 제외 + 최적화 바이트코드
+#   pyinstaller m_clock.spec -- --profile onedir       # 폴더 배포 (실행할 때마다 임시 폴더에 풀지 않는다)
+# 프로필별 크기/실행 시간은 python -m bench.build_profiles 로 비교한다.
+import argparse
+import os
+import re
+
+PROFILES = ('onefile', 'onefile-slim', 'onedir')
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--profile', choices=PROFILES, default='onefile')
+parser.add_argument('--probe', action='store_true', help='첫 페인트 시각을 남기는 런타임 훅 포함 (벤치마크용)')
+options = parser.parse_args()
+slim = options.profile != 'onefile'
+
+# QtCore/QtGui/QtWidgets 만 쓰므로 나머지 Qt 모듈과 그쪽만 쓰는 표준 라이브러리는 뺀다
+QT_EXCLUDES = [
+    'PyQt5.QtNetwork', 'PyQt5.QtQml', 'PyQt5.QtQuick', 'PyQt5.QtQuickWidgets', 'PyQt5.QtSvg',
+    'PyQt5.QtDBus', 'PyQt5.QtOpenGL', 'PyQt5.QtPrintSupport', 'PyQt5.QtSql', 'PyQt5.QtTest',
+    'PyQt5.QtXml', 'PyQt5.QtXmlPatterns', 'PyQt5.QtMultimedia', 'PyQt5.QtMultimediaWidgets',
+    'PyQt5.QtWebSockets', 'PyQt5.QtWebChannel', 'PyQt5.QtWebEngineCore', 'PyQt5.QtWebEngineWidgets',
+    'PyQt5.QtBluetooth', 'PyQt5.QtNfc', 'PyQt5.QtPositioning', 'PyQt5.QtLocation', 'PyQt5.QtSensors',
+    'PyQt5.QtSerialPort', 'PyQt5.QtDesigner', 'PyQt5.QtHelp', 'PyQt5.QtRemoteObjects',
+    'PyQt5.QtTextToSpeech', 'PyQt5.QtWinExtras', 'PyQt5.QAxContainer', 'PyQt5.uic',
+]
+PYTHON_EXCLUDES = ['tkinter', 'unittest', 'pydoc', 'doctest', 'pdb', 'xmlrpc', 'lib2to3', 'setuptools']
+
+# 플러그인은 종류별로 남길 것만 (없는 종류는 통째로 뺀다).
+# qico: 창 아이콘(.ico), qoffscreen: 화면 없이 띄우는 벤치마크/CI 용
+QT_PLUGINS_KEEP = {
+    'platforms': ('qwindows', 'qxcb', 'qcocoa', 'qoffscreen'),
+    'styles': None,  # 전부
+    'imageformats': ('qico',),
+}
+# 위 플러그인을 빼면 필요 없어지는 Qt 라이브러리 (qwebgl/qsvg 가 끌어오던 것) 와 소프트웨어 OpenGL.
+# Qt5DBus 는 남긴다: 리눅스의 qxcb 와 libQt5XcbQpa 가 NEEDED 로 링크한다.
+# onedir 리눅스 빌드는 최상위에 심볼릭 링크도 두므로 경로가 아니라 파일 이름으로 본다
+QT_LIBRARIES_DROP = re.compile(
+    r'^(lib)?(qt5(qml|qmlmodels|quick|network|websockets|svg)\b|opengl32sw|d3dcompiler_\d+)',
+    re.IGNORECASE,
+)
+# PyQt5 가 같이 싣고 오는 OpenSSL (QtNetwork 용). 파이썬 자체의 것은 건드리지 않는다
+QT_OPENSSL = re.compile(r'^lib(crypto|ssl)', re.IGNORECASE)
+QT_PATH = re.compile(r'(^|[\\/])PyQt5[\\/]')
+PLUGIN_PATH = re.compile(r'[\\/]Qt5?[\\/]plugins[\\/]([^\\/]+)[\\/]([^\\/]+)$')
+TRANSLATIONS_PATH = re.compile(r'[\\/]Qt5?[\\/]translations[\\/]')
+
+
+def keep_qt_file(dest_name):
+    name = os.path.basename(dest_name.replace('\\', '/'))
+    if QT_LIBRARIES_DROP.search(name):
+        return False
+    if not QT_PATH.search(dest_name):
+        return True
+    if TRANSLATIONS_PATH.search(dest_name):
+        return False  # QTranslator 를 쓰지 않는다
+    match = PLUGIN_PATH.search(dest_name)
+    if match:
+        kind, filename = match.groups()
+        if kind not in QT_PLUGINS_KEEP:
+            return False
+        keep = QT_PLUGINS_KEEP[kind]
+        return keep is None or any(re.match(rf'(lib)?{plugin}\b', filename) for plugin in keep)
+    return not QT_OPENSSL.search(name)
 
 
 a = Analysis(
@@ -9,30 +75,62 @@ a = Analysis(
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
+    runtime_hooks=[os.path.join(SPECPATH, 'bench', 'pyi_startup_probe.py')] if options.probe else [],
+    excludes=QT_EXCLUDES + PYTHON_EXCLUDES if slim else [],
     noarchive=False,
-    optimize=0,
+    # 2: assert 와 docstring 을 뺀 .pyc 를 미리 만들어 넣는다
+    optimize=2 if slim else 0,
 )
+if slim:
+    a.binaries = [entry for entry in a.binaries if keep_qt_file(entry[0])]
+    a.datas = [entry for entry in a.datas if keep_qt_file(entry[0])]
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='m_clock',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if options.profile == 'onedir':
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='m_clock',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,  # 실행할 때마다 압축을 풀지 않도록
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='m_clock',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='m_clock',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=not slim,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
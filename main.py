@@ -1,6 +1,228 @@
-def main():
-    print("Hello from m-clock!")
+import argparse
+import configparser
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+
+from history import HISTORY_PATH, History, HistoryWriter
+from session import DEFAULT_CATEGORY, TimerSession
+from stopwatch import NS_PER_SEC
+from timers import parse_timers
+
+CONFIG_PATH = 'timer_config.ini'
+# 헤드리스 타이머 상태. 오버레이의 체크포인트(m_clock_state.bin)와 섞이지 않게 따로 둔다
+STATE_PATH = 'm_clock_cli_state.bin'
+POLL_SECONDS = 1.0  # run: 멈춰 있을 때 다른 프로세스가 바꾼 상태를 확인하는 간격
+COMMANDS = ('start', 'pause', 'toggle', 'split', 'reset')
+
+
+def stats(args):
+    # numpy 는 통계를 볼 때만 필요하다
+    import analytics
+
+    history = History(args.db)
+    try:
+        categories = [args.category] if args.category else history.categories()
+        tables = [analytics.load_runs(history.connection, category) for category in categories]
+    finally:
+        history.close()
+    summaries = []
+    for table in tables:
+        summary = analytics.summarize(table, window=args.window)
+        summaries.append(summary)
+        print(analytics.format_summary(summary))
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            analytics.write_runs_csv(tables, f)
+    if args.results_csv:
+        with open(args.results_csv, 'w', newline='', encoding='utf-8') as f:
+            analytics.write_results_csv(summaries, f)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            analytics.write_json(summaries, f)
+    return 0
+
+
+def read_config(path):
+    # [Run] category 와 [Timers] 만 본다 (창/색상/핫키 설정은 오버레이 전용)
+    config = configparser.ConfigParser()
+    if path and os.path.exists(path):
+        config.read(path)
+    category = config.get('Run', 'category', fallback=DEFAULT_CATEGORY).strip() or DEFAULT_CATEGORY
+    return category, parse_timers(config)
+
+
+def open_session(args, history_writer=None):
+    from checkpoint import Checkpoint
+    from comparison import Comparison
+
+    category, timers = read_config(args.config)
+    if args.category:
+        category = args.category
+    history = None
+
+    def comparisons():
+        nonlocal history
+        if history is None:
+            history = History(args.db)
+        return Comparison.from_history(history, category)
+
+    session = TimerSession(category=category, history_writer=history_writer, checkpoint=Checkpoint(args.state),
+                           comparisons=comparisons)
+    session.restore()
+    return session, timers
+
+
+def status(session):
+    return {
+        'state': session.state(),
+        'running': session.is_running,
+        'elapsed_ns': session.elapsed_ns(),
+        'splits': list(session.splits.marks),
+        'started_at': session.run_started_at,
+        'display': session.display_text(),
+    }
+
+
+def print_status(session, as_json=False):
+    if as_json:
+        print(json.dumps(status(session)), flush=True)
+    else:
+        print(f"{session.state():8s} {session.display_text()}", flush=True)
+
+
+def control(args):
+    # 한 번의 전환을 상태 파일에 적용하고 끝난다 (달리는 중인 run 프로세스도 이 변경을 따라간다)
+    history_writer = HistoryWriter(args.db) if args.command == 'reset' else None
+    session, _ = open_session(args, history_writer)
+    try:
+        if args.command != 'status':
+            getattr(session, args.command)()
+        print_status(session, args.json)
+    finally:
+        session.checkpoint.close()
+        if history_writer is not None:
+            history_writer.close()
+    return 0
+
+
+def read_commands(stream, commands):
+    # 표준 입력 한 줄 = 명령 하나. 입력이 닫혀도 타이머는 계속 돈다 (백그라운드 실행)
+    for line in stream:
+        line = line.strip()
+        if line:
+            commands.put(line)
+
+
+def run(args):
+    # 터미널/백그라운드에서 타이머를 돌린다. 표시가 바뀔 때마다 한 줄씩 내보내고
+    # 표준 입력의 명령(start, pause, toggle, split, reset, countdown, status, quit)을 처리한다
+    history_writer = HistoryWriter(args.db)
+    session, timers = open_session(args, history_writer)
+    session.set_timers(timers)
+    handlers = {
+        'start': session.start,
+        'pause': session.pause,
+        'toggle': session.toggle,
+        'split': session.split,
+        'reset': session.reset,
+        'countdown': session.restart_countdowns,
+        'status': lambda: True,
+    }
+    commands = queue.Queue()
+    threading.Thread(target=read_commands, args=(sys.stdin, commands), daemon=True).start()
+    # --record: 받은 명령을 시각과 함께 남겨 replay.Replay 로 다시 돌려 볼 수 있게 한다
+    record = open(args.record, 'a', encoding='utf-8') if args.record else None
+    origin_ns = session.clock()
+    print_status(session, args.json)
+    try:
+        while True:
+            wake = session.next_wake_ns()
+            timeout = args.poll
+            if wake is not None:
+                timeout = min(timeout, max(wake - session.clock(), 0) / NS_PER_SEC)
+            try:
+                command = commands.get(timeout=timeout)
+            except queue.Empty:
+                command = None
+            if command == 'quit':
+                break
+            # 다른 터미널의 python main.py start/split/... 가 바꾼 상태를 먼저 따라간다.
+            # 명령을 먼저 적용하면 그 저장이 같은 번호/슬롯으로 다른 프로세스의 변경을 덮어쓴다
+            if session.checkpoint.changed() is not None:
+                session.restore()
+                print_status(session, args.json)
+            if command is not None:
+                handler = handlers.get(command)
+                if handler is None:
+                    print(f"unknown command: {command}", file=sys.stderr, flush=True)
+                else:
+                    if record is not None:
+                        t = (session.clock() - origin_ns) / NS_PER_SEC
+                        record.write(json.dumps({'t': t, 'command': command}) + '\n')
+                        record.flush()
+                    if handler():
+                        print_status(session, args.json)
+            due, alerts = session.tick()
+            for timer, threshold_ns, late_ns in alerts:
+                left = f"{threshold_ns / NS_PER_SEC:g}s left" if threshold_ns else "time is up"
+                print(f"alert    {timer.name}: {left} (late {late_ns / 1e6:.1f}ms)", flush=True)
+            if due and not args.quiet:
+                print_status(session, args.json)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # 끝내도 런은 상태 파일에 남아 다음 run 이나 status 에서 이어진다
+        session.checkpoint.close()
+        history_writer.close()
+        if record is not None:
+            record.close()
+    return 0
+
+
+def add_session_arguments(parser):
+    parser.add_argument('--state', default=STATE_PATH, help='타이머 상태 파일')
+    parser.add_argument('--db', default=HISTORY_PATH)
+    parser.add_argument('--config', default=CONFIG_PATH, help='[Run] category 와 [Timers] 를 읽을 설정 파일')
+    parser.add_argument('--category', help='설정 파일의 카테고리 대신')
+    parser.add_argument('--json', action='store_true', help='상태를 JSON 한 줄로')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest='command')
+    stats_parser = commands.add_parser('stats', help='런 기록 통계 (PB, sum of best, 구간 분포)')
+    stats_parser.add_argument('--db', default=HISTORY_PATH)
+    stats_parser.add_argument('--category', help='없으면 모든 카테고리')
+    stats_parser.add_argument('--window', type=int, default=10, help='이동 평균 런 수')
+    stats_parser.add_argument('--csv', help='런별 구간 시간을 CSV 로 내보낼 경로')
+    stats_parser.add_argument('--results-csv', help='계산한 요약 (백분위수, 이동 평균, sum of best 등) 을 CSV 로 내보낼 경로')
+    stats_parser.add_argument('--json', help='요약을 JSON 으로 내보낼 경로')
+    run_parser = commands.add_parser('run', help='GUI 없이 타이머를 돌린다 (표준 입력으로 명령)')
+    add_session_arguments(run_parser)
+    run_parser.add_argument('--quiet', action='store_true', help='매 초 표시는 빼고 상태가 바뀔 때만 출력')
+    run_parser.add_argument('--record', help='받은 명령을 JSONL 로 남길 경로 (python -m bench.replay 로 재생)')
+    run_parser.add_argument('--poll', type=float, default=POLL_SECONDS, help=argparse.SUPPRESS)
+    for command in COMMANDS + ('status',):
+        add_session_arguments(commands.add_parser(command, help=f'타이머 {command}' if command != 'status' else '현재 상태'))
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'stats':
+            return stats(args)
+        if args.command == 'run':
+            return run(args)
+        if args.command in COMMANDS or args.command == 'status':
+            return control(args)
+    except sqlite3.Error as e:
+        print(f"history database error: {e}", file=sys.stderr)
+        return 1
+    parser.print_help()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
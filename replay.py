@@ -0,0 +1,96 @@
+import json
+import time
+
+from stopwatch import NS_PER_SEC
+
+
+def read_recording(f):
+    # main.py run --record 로 남긴 JSONL {"t": 런 시작 뒤 초, "command": 명령[, "zone": 지역]} -> (ns, 명령, 값)
+    for line in f:
+        line = line.strip()
+        if line:
+            event = json.loads(line)
+            yield round(event['t'] * NS_PER_SEC), event['command'], event.get('zone')
+
+
+def log_events(index, since=None, until=None):
+    # log_index.LogIndex 의 지역 이동 -> (첫 이동 기준 ns, 'zone', 지역 이름). 로그 시각은 초 단위
+    from log_index import ZONE
+
+    first = None
+    for stamp, kind, _, zone in index.events(since, until):
+        if kind != ZONE:
+            continue
+        if first is None:
+            first = stamp
+        yield (stamp - first) * NS_PER_SEC, 'zone', index.zones[zone]
+
+
+class Replay:
+    # 기록된 이벤트를 clock.VirtualClock 으로 도는 TimerSession 에 다시 흘려보낸다.
+    # 이벤트 사이의 마감(초 표시, 카운트다운 알림)도 오버레이/run 루프가 깨어나는 그 시각에 하나씩 처리한다.
+    #   speed: 0 이면 기다리지 않고 가상 시계만 옮긴다. 1 이면 실제 속도, 60 이면 60배속으로 실제로 기다린다
+    #   events 의 시각은 재생을 시작한 가상 시각 기준 ns
+    def __init__(self, session, clock, speed=0, sleep=time.sleep):
+        self.session = session
+        self.clock = clock
+        self.speed = speed
+        self.sleep = sleep
+        self.origin_ns = clock()
+        self.events = 0
+        self.ticks = 0
+        self.alerts = []  # (재생 시각 ns, 타이머 이름, 임계값 ns, 늦은 ns)
+        self.handlers = {
+            'start': session.start,
+            'pause': session.pause,
+            'toggle': session.toggle,
+            'split': session.split,
+            'reset': session.reset,
+            'countdown': session.restart_countdowns,
+            'status': lambda: False,
+        }
+
+    def wait(self, t_ns):
+        # 가상 시계를 t_ns 로 옮긴다 (speed > 0 이면 그 간격을 배속으로 나눈 만큼 실제로 기다린 뒤)
+        if self.speed > 0:
+            gap_ns = t_ns - self.clock()
+            if gap_ns > 0:
+                self.sleep(gap_ns / self.speed / NS_PER_SEC)
+        self.clock.advance_to(t_ns)
+
+    def advance(self, t_ns):
+        # t_ns 까지 깨어날 시각마다 틱을 처리한다
+        session = self.session
+        while True:
+            wake = session.next_wake_ns()
+            if wake is None or wake > t_ns:
+                break
+            self.wait(wake)
+            _, alerts = session.tick()
+            self.ticks += 1
+            for timer, threshold_ns, late_ns in alerts:
+                self.alerts.append((wake - self.origin_ns, timer.name, threshold_ns, late_ns))
+        self.wait(t_ns)
+
+    def apply(self, command, value=None):
+        # 명령 하나를 적용하고 상태가 바뀌었는지 돌려준다
+        if command == 'zone':
+            return self.session.on_zone(value) is not None
+        handler = self.handlers.get(command)
+        if handler is None:
+            raise ValueError(f"unknown command: {command}")
+        return handler()
+
+    def run(self, events, until_ns=None):
+        # 이벤트를 시각 순서대로 적용하고, until_ns 가 있으면 그때까지 시간을 더 흘린다
+        for t_ns, command, value in events:
+            self.advance(self.origin_ns + t_ns)
+            self.apply(command, value)
+            self.events += 1
+        if until_ns is not None:
+            self.advance(self.origin_ns + until_ns)
+        return self
+
+    def elapsed_ns(self):
+        # 재생한 가상 시간
+        return self.clock() - self.origin_ns
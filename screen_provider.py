@@ -0,0 +1,76 @@
+import sys
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+
+class ScreenProvider(QObject):
+    # 화면 구성을 폴링하지 않고 QScreen / QGuiApplication 시그널로만 변화를 감지한다
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self.on_screen_added)
+        app.screenRemoved.connect(self.on_screens_changed)
+        app.primaryScreenChanged.connect(self.on_screens_changed)
+        for screen in app.screens():
+            self.on_screen_added(screen, notify=False)
+        self.last_snapshot = self.snapshot()
+
+    def on_screen_added(self, screen, notify=True):
+        screen.geometryChanged.connect(self.on_screens_changed)
+        screen.logicalDotsPerInchChanged.connect(self.on_screens_changed)
+        if notify:
+            self.on_screens_changed()
+
+    def on_screens_changed(self, *args):
+        # 실제로 화면 영역이나 DPR 이 바뀐 경우에만 알린다
+        snapshot = self.snapshot()
+        if snapshot != self.last_snapshot:
+            self.last_snapshot = snapshot
+            self.changed.emit()
+
+    def snapshot(self):
+        return tuple(self.screen_key(screen) for screen in QGuiApplication.screens())
+
+    def find_screen(self, name=None):
+        for screen in QGuiApplication.screens():
+            if screen.name() == name:
+                return screen
+        return QGuiApplication.primaryScreen()
+
+    def screen_at(self, point):
+        return QGuiApplication.screenAt(point) or QGuiApplication.primaryScreen()
+
+    def screen_key(self, screen):
+        # 지오메트리 캐시 키: (화면 이름, (x, y, 너비, 높이), DPR)
+        geometry = screen.geometry()
+        rect = (geometry.x(), geometry.y(), geometry.width(), geometry.height())
+        return screen.name(), rect, screen.devicePixelRatio()
+
+
+class Win32ScreenProvider(ScreenProvider):
+    # Windows 주 모니터는 기존처럼 GetSystemMetrics 로 크기를 읽되, 읽는 시점은 Qt 시그널이 정한다
+    def screen_key(self, screen):
+        if screen != QGuiApplication.primaryScreen():
+            return super().screen_key(screen)
+        import ctypes
+        user32 = ctypes.windll.user32
+        rect = (0, 0, user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+        return screen.name(), rect, screen.devicePixelRatio()
+
+
+class FixedScreenProvider(ScreenProvider):
+    # 고정 크기 단일 화면 (헤드리스 실행/벤치마크용)
+    def __init__(self, width, height, dpr=1.0, parent=None):
+        self.fixed_key = ('fixed', (0, 0, width, height), dpr)
+        super().__init__(parent)
+
+    def screen_key(self, screen):
+        return self.fixed_key
+
+
+def create_screen_provider(parent=None):
+    if sys.platform == 'win32':
+        return Win32ScreenProvider(parent)
+    return ScreenProvider(parent)
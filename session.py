@@ -0,0 +1,243 @@
+from clock import SYSTEM_CLOCK
+from splits import SplitLog, format_hms, segment_display, split_display
+from stopwatch import Stopwatch
+from timers import Countdown, TimerScheduler, build_timers
+
+DEFAULT_CATEGORY = 'default'  # [Run] category
+
+
+class TimerSession:
+    # 메인 스톱워치 / 스플릿 / 보조 타이머의 상태 전환을 Qt 없이 처리하는 타이머 코어.
+    # 오버레이와 헤드리스 CLI 가 같이 쓴다. 화면 갱신, 알림 표시, 깨어날 시각 예약은 부르는 쪽이 맡는다.
+    #   clock         : clock.SystemClock / VirtualClock. 호출하면 monotonic ns, wall() 은 런 시작 시각 기록용 벽시계.
+    #                   틱, 카운트다운 마감, 스플릿, 체크포인트가 모두 이 시계를 본다
+    #   history_writer: 끝난 런을 넣을 곳 (add, sync). None 이면 기록하지 않는다
+    #   checkpoint    : 상태 전환마다 저장할 곳 (save). None 이면 저장하지 않는다
+    #   comparisons   : 비교 기준을 처음 쓸 때 한 번 부르는 함수 () -> Comparison 또는 None (실패).
+    #                   이후 끝낸 런은 메모리에서 합치므로 핫키 경로에서 기록 스레드를 기다리지 않는다
+    # 전환 메서드는 상태가 바뀌었으면 True 를 돌려준다.
+    def __init__(self, clock=SYSTEM_CLOCK, slack_ns=0, category=DEFAULT_CATEGORY,
+                 history_writer=None, checkpoint=None, comparisons=None):
+        self.clock = clock
+        self.category = category
+        self.history_writer = history_writer
+        self.checkpoint = checkpoint
+        self.comparisons = comparisons
+        self.stopwatch = Stopwatch(clock)
+        self.splits = SplitLog()
+        self.scheduler = TimerScheduler(clock, slack_ns)
+        self.scheduler.add(self.stopwatch)
+        self.extra_timers = []
+        self.comparison = None  # 이번 런의 PB / sum of best 비교 기준 (baseline 의 사본)
+        self.baseline = None  # 카테고리의 비교 기준 원본 (category 를 바꾸거나 restore 하면 None 으로)
+        self.autosplitter = None  # client_log.AutoSplitter (Client.txt 연동할 때만)
+        self.run_started_at = None  # 이번 런을 처음 시작한 벽시계 시각 (기록용)
+
+    @property
+    def is_running(self):
+        return self.stopwatch.is_running
+
+    @property
+    def seconds(self):
+        return self.stopwatch.seconds
+
+    def elapsed_ns(self):
+        return self.stopwatch.elapsed_ns()
+
+    def restore(self):
+        # 강제 종료 전에, 또는 다른 프로세스가 남긴 상태로 이어서 (달리던 중이었으면 그동안 흐른 시간 포함)
+        if self.checkpoint is None:
+            return
+        self.run_started_at = self.checkpoint.restore(self.stopwatch, self.splits)
+        # 체크포인트에는 메인 스톱워치만 남으므로 보조 타이머는 그 상태(0 / 달림 / 멈춤)를 따라간다
+        zero = self.stopwatch.elapsed_ns() == 0
+        for timer in self.extra_timers:
+            if zero:
+                timer.reset()
+            elif self.is_running:
+                timer.start()
+            else:
+                timer.pause()
+        self.scheduler.reschedule_all()
+        # 다른 프로세스가 끝낸 런은 이 프로세스의 비교 기준에 합쳐지지 않았으므로 다음에 다시 읽는다
+        self.baseline = None
+        if zero:
+            self.comparison = None
+        elif self.comparison is None:
+            self.comparison = self.load_comparison()
+
+    def set_timers(self, specs):
+        # [Timers] 보조 타이머를 다시 만든다 (보조 스톱워치는 메인 타이머가 달리는 중이면 같이 시작)
+        for timer in self.extra_timers:
+            self.scheduler.remove(timer)
+        self.extra_timers = build_timers(specs, self.clock)
+        for timer in self.extra_timers:
+            if self.is_running:
+                timer.start()
+            self.scheduler.add(timer)
+
+    def each_timer(self, action):
+        # 메인/보조 타이머에 같은 전환을 적용하고 스케줄을 다시 잡는다
+        action(self.stopwatch)
+        for timer in self.extra_timers:
+            action(timer)
+        self.scheduler.reschedule_all()
+
+    def start(self):
+        if self.is_running:
+            return False
+        if self.stopwatch.elapsed_ns() == 0:
+            self.run_started_at = self.clock.wall()
+            self.comparison = self.load_comparison()
+        self.each_timer(lambda timer: timer.start())
+        self.save()
+        return True
+
+    def pause(self):
+        if not self.is_running:
+            return False
+        self.each_timer(lambda timer: timer.pause())
+        self.save()
+        return True
+
+    def toggle(self):
+        return self.pause() if self.is_running else self.start()
+
+    def split(self):
+        # 달리는 중에만 현재 경과 시간을 스플릿으로 남긴다
+        if not self.is_running:
+            return False
+        self.splits.mark(self.stopwatch.elapsed_ns())
+        if self.comparison is not None:
+            self.comparison.on_split(self.splits)
+        self.save()
+        return True
+
+    def reset(self):
+        self.record_run()
+        if self.autosplitter is not None:
+            self.autosplitter.paused = False
+        self.each_timer(lambda timer: timer.reset())
+        self.splits.clear()
+        self.comparison = None
+        self.run_started_at = None
+        self.save()
+        return True
+
+    def restart_countdowns(self):
+        # 카운트다운만 처음부터 다시 (플라스크/버프 주기 등)
+        restarted = False
+        for timer in self.extra_timers:
+            if isinstance(timer, Countdown):
+                timer.restart()
+                self.scheduler.reschedule(timer)
+                restarted = True
+        return restarted
+
+    def on_zone(self, zone):
+        # Client.txt 지역 이동을 자동 시작/스플릿/멈춤으로. 실행한 명령 이름 또는 None
+        if self.autosplitter is None:
+            return None
+        command = self.autosplitter.on_zone(zone, self.is_running, self.stopwatch.elapsed_ns() == 0)
+        if command in ('start', 'resume'):
+            self.start()
+        elif command == 'split':
+            self.split()
+        elif command == 'pause':
+            self.pause()
+        return command
+
+    def listens_for_zones(self):
+        # 지역 이동이 지금 타이머를 바꿀 수 있는지 (0 에서 자동 시작, 은신처에서 멈춘 뒤 다시 달리기 포함)
+        if self.autosplitter is None:
+            return False
+        return self.autosplitter.listening(self.is_running, self.stopwatch.elapsed_ns() == 0)
+
+    def tick(self, now=None):
+        # 마감이 지난 타이머와 울릴 카운트다운 알림 [(타이머, 임계값 ns, 늦은 ns)] 을 돌려준다
+        if now is None:
+            now = self.clock()
+        due = self.scheduler.pop_due(now)
+        alerts = []
+        for timer in due:
+            if isinstance(timer, Countdown):
+                fired = timer.take_alerts(now)
+                if fired:
+                    # 울린 임계값을 넘겼으니 다음 마감으로 다시 잡는다
+                    self.scheduler.reschedule(timer, now)
+                    alerts.extend((timer, threshold_ns, late_ns) for threshold_ns, late_ns in fired)
+        return due, alerts
+
+    def next_wake_ns(self):
+        # 다음에 깨어날 시각 (달리는 타이머가 없으면 None)
+        return self.scheduler.next_wake_ns()
+
+    def state(self):
+        # 'alert' | 'ahead' | 'behind' | 'gold' | 'running' | 'paused' | 'zero'
+        if any(isinstance(timer, Countdown) and timer.alerting for timer in self.extra_timers):
+            return 'alert'
+        if self.is_running:
+            if self.comparison is not None:
+                state = self.comparison.state(self.splits, self.stopwatch.elapsed_ns())
+                if state is not None:
+                    return state
+            return 'running'
+        if self.seconds > 0:
+            return 'paused'
+        return 'zero'
+
+    def display_text(self, seconds=None):
+        # 메인 표시 뒤에 PB/SOB 차이와 보조 타이머를 이어 붙인 한 줄
+        if seconds is None:
+            seconds = self.seconds
+        text = split_display(seconds, self.splits)
+        if self.comparison is not None:
+            deltas = self.comparison.display(self.splits, self.stopwatch.elapsed_ns())
+            if deltas:
+                text += ' ' + deltas
+        for timer in self.extra_timers:
+            text += ' ' + timer.display()
+        return text
+
+    def display_rows(self, seconds=None):
+        # 오버레이는 줄을 나눠 그린다: 전체 시간 / 현재 구간과 PB/SOB 차이 / 보조 타이머 (빈 줄은 뺀다).
+        # 한 줄에 이어 붙이면 같은 [Size] 안에서 글자 칸이 몇 픽셀로 줄어든다
+        if seconds is None:
+            seconds = self.seconds
+        rows = [format_hms(seconds)]
+        detail = []
+        segment = segment_display(seconds, self.splits)
+        if segment is not None:
+            detail.append(segment)
+        if self.comparison is not None:
+            deltas = self.comparison.display(self.splits, self.stopwatch.elapsed_ns())
+            if deltas:
+                detail.append(deltas)
+        if detail:
+            rows.append(' '.join(detail))
+        if self.extra_timers:
+            rows.append(' '.join(timer.display() for timer in self.extra_timers))
+        return rows
+
+    def load_comparison(self):
+        if self.baseline is None and self.comparisons is not None:
+            self.baseline = self.comparisons()
+        return self.baseline.copy() if self.baseline is not None else None
+
+    def record_run(self):
+        # 지금까지의 런을 기록 큐에 넣는다. 멈춘 상태에서 끝냈으면 완주로 본다.
+        elapsed_ns = self.stopwatch.elapsed_ns()
+        if elapsed_ns == 0 or self.history_writer is None:
+            return
+        from history import RunRecord
+        record = RunRecord(
+            self.category, self.run_started_at or self.clock.wall(), elapsed_ns,
+            completed=not self.is_running, marks=self.splits.marks,
+        )
+        self.history_writer.add(record)
+        if self.baseline is not None:
+            self.baseline.add_run(record.marks, elapsed_ns, record.completed)
+
+    def save(self):
+        if self.checkpoint is not None:
+            self.checkpoint.save(self.stopwatch, self.splits, self.run_started_at)
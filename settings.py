@@ -0,0 +1,63 @@
+from client_log import DEFAULT_AUTOSPLIT
+from geometry import ratios_from_config
+from hotkeys import DEFAULT_BINDINGS
+from session import DEFAULT_CATEGORY
+from timers import parse_timers
+
+# 상태별 숫자 색상 / 잠금 상태별 테두리 색상 기본값 ([Colors] 섹션으로 덮어쓸 수 있음)
+DEFAULT_COLORS = {
+    'running': '#ffffff',  # 하얀색
+    'paused': '#ffa500',  # 오렌지색
+    'zero': '#c0c0c0',  # 회색
+    'locked': '#ffffff',  # 잠금: 흰색
+    'unlocked': '#ff0000',  # 해제: 빨간색
+    'alert': '#ff4040',  # 카운트다운 알림이 울린 뒤
+    'ahead': '#00cc66',  # PB 보다 앞섬
+    'behind': '#ff5555',  # PB 보다 뒤처짐
+    'gold': '#ffd700',  # 방금 구간이 구간 최고 기록
+}
+
+
+class Settings:
+    # timer_config.ini 를 한 번만 파싱해 둔 값. 이후에는 문자열 파싱 없이 필드로 읽는다.
+    __slots__ = ('ratios', 'screen', 'colors', 'hotkeys', 'category', 'timers', 'log_path', 'autosplit')
+
+    def __init__(self, ratios, screen, colors, hotkeys, category=DEFAULT_CATEGORY, timers=(), log_path=None,
+                 autosplit=tuple(DEFAULT_AUTOSPLIT.values())):
+        self.ratios = ratios  # GeometryRatios
+        self.screen = screen  # 오버레이를 띄울 화면 이름 (없으면 주 모니터)
+        self.colors = colors  # {상태: '#rrggbb'}
+        self.hotkeys = hotkeys  # {키 이름: 명령}
+        self.category = category  # 런 기록을 묶는 카테고리 이름 (PB 비교 단위)
+        self.timers = timers  # 보조 타이머 [(이름, 'stopwatch' | 'countdown', 초, 알림 초)]
+        self.log_path = log_path  # 지켜볼 Client.txt 경로 (없으면 로그 연동 안 함)
+        self.autosplit = autosplit  # (시작 지역, 스플릿 지역, 멈춤 지역) 패턴 문자열
+
+    @classmethod
+    def from_config(cls, config):
+        colors = dict(DEFAULT_COLORS)
+        if config.has_section('Colors'):
+            for name in colors:
+                colors[name] = config.get('Colors', name, fallback=colors[name]).strip().lower()
+        hotkeys = DEFAULT_BINDINGS
+        if config.has_section('Hotkeys'):
+            # [Hotkeys] 는 "명령 = 키" 형식
+            commands = {command: key for key, command in DEFAULT_BINDINGS.items()}
+            for command in commands:
+                commands[command] = config.get('Hotkeys', command, fallback=commands[command]).strip()
+            hotkeys = {key: command for command, key in commands.items()}
+        return cls(
+            ratios=ratios_from_config(config),
+            screen=config.get('Position', 'screen', fallback=None),
+            colors=colors,
+            hotkeys=hotkeys,
+            category=config.get('Run', 'category', fallback=DEFAULT_CATEGORY).strip() or DEFAULT_CATEGORY,
+            timers=parse_timers(config),
+            log_path=config.get('LogFile', 'path', fallback='').strip() or None,
+            autosplit=tuple(
+                config.get('AutoSplit', name, fallback=default).strip() for name, default in DEFAULT_AUTOSPLIT.items()
+            ),
+        )
+
+    def changed_fields(self, other):
+        return [name for name in self.__slots__ if getattr(self, name) != getattr(other, name)]
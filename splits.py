@@ -0,0 +1,66 @@
+from array import array
+
+from stopwatch import NS_PER_SEC
+
+
+class SplitLog:
+    # 스플릿/랩 시각을 스톱워치 경과 ns (monotonic 기준점에서 계산한 값) 로 array('q') 에 이어 붙인다.
+    # 원소당 8바이트, 추가는 O(1) 이라 수만 개가 쌓여도 메모리와 비용이 일정하다.
+    __slots__ = ('marks',)
+
+    def __init__(self, marks=()):
+        self.marks = array('q', marks)
+
+    def __len__(self):
+        return len(self.marks)
+
+    def mark(self, elapsed_ns):
+        self.marks.append(elapsed_ns)
+
+    def clear(self):
+        # 버퍼를 새로 만들지 않고 비운다
+        del self.marks[:]
+
+    def last_ns(self):
+        return self.marks[-1] if self.marks else 0
+
+    def current_segment_ns(self, elapsed_ns):
+        return elapsed_ns - self.last_ns()
+
+    def segment_ns(self, index):
+        start = self.marks[index - 1] if index > 0 else 0
+        return self.marks[index] - start
+
+    def segments_ns(self):
+        previous = 0
+        for mark in self.marks:
+            yield mark - previous
+            previous = mark
+
+
+def format_hms(seconds):
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def format_segment(seconds):
+    # 구간 시간은 한 시간 미만이면 MM:SS 로 짧게
+    if seconds < 3600:
+        return "%02d:%02d" % divmod(seconds, 60)
+    return format_hms(seconds)
+
+
+def segment_display(total_seconds, splits):
+    # 마지막 스플릿 뒤 현재 구간 시간 (스플릿이 없으면 None)
+    if not splits:
+        return None
+    return format_segment(max(total_seconds - splits.last_ns() // NS_PER_SEC, 0))
+
+
+def split_display(total_seconds, splits):
+    # 스플릿이 없으면 기존처럼 전체 시간만, 있으면 "현재 구간 전체" 를 보여준다
+    segment = segment_display(total_seconds, splits)
+    if segment is None:
+        return format_hms(total_seconds)
+    return f"{segment} {format_hms(total_seconds)}"
@@ -0,0 +1,63 @@
+import time
+
+NS_PER_SEC = 1_000_000_000
+
+
+class Stopwatch:
+    # 경과 시간은 틱 횟수가 아니라 monotonic_ns 기준점(start/pause/resume)에서 계산한다.
+    # sleep 오버슈트나 시그널 처리 비용이 쌓여도 표시 시간이 벽시계에서 밀리지 않는다.
+    __slots__ = ('_clock', '_anchor_ns', '_accumulated_ns')
+
+    def __init__(self, clock=time.monotonic_ns):
+        self._clock = clock
+        self._anchor_ns = None  # 실행 중일 때 마지막 start/resume 시각
+        self._accumulated_ns = 0  # 마지막 pause 까지 누적된 경과 시간
+
+    @property
+    def is_running(self):
+        return self._anchor_ns is not None
+
+    def start(self):
+        if self._anchor_ns is None:
+            self._anchor_ns = self._clock()
+
+    def pause(self):
+        if self._anchor_ns is not None:
+            self._accumulated_ns += self._clock() - self._anchor_ns
+            self._anchor_ns = None
+
+    def reset(self):
+        self._anchor_ns = None
+        self._accumulated_ns = 0
+
+    def state(self):
+        # (누적 ns, 기준점 ns 또는 None) — 체크포인트 저장용
+        return self._accumulated_ns, self._anchor_ns
+
+    def restore(self, accumulated_ns, anchor_ns):
+        self._accumulated_ns = accumulated_ns
+        self._anchor_ns = anchor_ns
+
+    def now(self):
+        return self._clock()
+
+    def elapsed_ns(self, now=None):
+        if self._anchor_ns is None:
+            return self._accumulated_ns
+        if now is None:
+            now = self._clock()
+        return self._accumulated_ns + (now - self._anchor_ns)
+
+    @property
+    def seconds(self):
+        return self.elapsed_ns() // NS_PER_SEC
+
+    def ns_until_next_second(self, now=None):
+        # 다음 정수 초 경계까지 남은 시간 (틱을 초 경계에 맞추기 위해 사용)
+        return NS_PER_SEC - self.elapsed_ns(now) % NS_PER_SEC
+
+    def next_deadline_ns(self, now):
+        # 표시 초가 바뀌는 다음 시각 (멈춰 있으면 None). TimerScheduler 가 쓴다.
+        if self._anchor_ns is None:
+            return None
+        return now + self.ns_until_next_second(now)
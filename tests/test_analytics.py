@@ -0,0 +1,63 @@
+# 통계 요약과 CSV 내보내기 (numpy 가 없으면 건너뛴다)
+import csv
+import io
+import sqlite3
+import unittest
+
+try:
+    import numpy as np
+
+    import analytics
+except ImportError:
+    analytics = None
+
+from history import SCHEMA
+from stopwatch import NS_PER_SEC
+
+SEC = NS_PER_SEC
+
+
+@unittest.skipIf(analytics is None, 'numpy is not installed')
+class ResultsCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.table = analytics.RunTable(
+            'act1',
+            np.arange(4), np.arange(4, dtype=float), np.array([60, 70, 65, 90]) * SEC,
+            np.array([True, True, True, False]),
+            np.array([[20, 40], [30, 40], [25, 40], [20, np.nan]]) * SEC,
+        )
+
+    def test_summary(self):
+        summary = analytics.summarize(self.table, window=2)
+        self.assertEqual(summary['pb_ns'], 60 * SEC)
+        self.assertEqual(summary['sum_of_best_ns'], 60 * SEC)
+        self.assertEqual(summary['rolling_mean_ns'].tolist(), [65 * SEC, 67.5 * SEC])
+        self.assertEqual(summary['splits']['count'].tolist(), [4, 3])
+
+    def test_results_csv(self):
+        f = io.StringIO()
+        analytics.write_results_csv([analytics.summarize(self.table, window=2)], f)
+        rows = list(csv.reader(io.StringIO(f.getvalue())))
+        self.assertEqual(rows[0], ['category', 'metric', 'index', 'value'])
+        values = {(metric, index): value for _, metric, index, value in rows[1:]}
+        self.assertEqual(int(values[('pb_ns', '')]), 60 * SEC)
+        self.assertEqual(float(values[('sum_of_best_ns', '')]), 60 * SEC)
+        self.assertEqual(float(values[('rolling_mean_ns', '1')]), 67.5 * SEC)
+        self.assertEqual(float(values[('splits.percentiles.p50', '0')]), 22.5 * SEC)
+        self.assertIn(('maps_per_hour', ''), values)
+
+    def test_empty_category_has_blank_values(self):
+        f = io.StringIO()
+        empty = analytics.load_runs(self.connection(), 'none')
+        analytics.write_results_csv([analytics.summarize(empty)], f)
+        rows = list(csv.reader(io.StringIO(f.getvalue())))
+        self.assertIn(['none', 'pb_ns', '', ''], rows)
+
+    def connection(self):
+        connection = sqlite3.connect(':memory:')
+        connection.executescript(SCHEMA)
+        self.addCleanup(connection.close)
+        return connection
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# 체크포인트 복원: 같은 부팅(monotonic 이 이어짐) / 재부팅(monotonic 이 끊김) / 슬롯보다 많은 스플릿
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import checkpoint
+from checkpoint import Checkpoint
+from clock import VirtualClock
+from splits import SplitLog
+from stopwatch import NS_PER_SEC, Stopwatch
+
+SEC = NS_PER_SEC
+WALL = 1_700_000_000 * SEC
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'state.bin')
+        self.opened = []
+
+    def tearDown(self):
+        for opened in self.opened:
+            opened.close()
+        self.directory.cleanup()
+
+    def open(self, clock):
+        opened = Checkpoint(self.path, wall_clock=clock.wall_ns)
+        self.opened.append(opened)
+        return opened
+
+    def save_running(self, clock, elapsed_ns, marks=()):
+        # 달리는 중에 저장하고 닫지 않은 채로 다른 체크포인트가 읽는다 (강제 종료)
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        clock.advance(elapsed_ns)
+        splits = SplitLog(marks)
+        saved = self.open(clock)
+        saved.save(stopwatch, splits, 123.0)
+        return saved
+
+    def restore(self, clock):
+        stopwatch = Stopwatch(clock)
+        splits = SplitLog()
+        started_at = self.open(clock).restore(stopwatch, splits)
+        return stopwatch, splits, started_at
+
+    def test_same_boot_counts_time_while_down(self):
+        clock = VirtualClock(start_ns=1000 * SEC, wall_start_ns=WALL)
+        self.save_running(clock, 10 * SEC, [4 * SEC])
+        # 같은 부팅: monotonic 과 벽시계가 같이 30초 흘렀다
+        clock.advance(30 * SEC)
+        stopwatch, splits, started_at = self.restore(clock)
+        self.assertTrue(stopwatch.is_running)
+        self.assertEqual(stopwatch.elapsed_ns(), 40 * SEC)
+        self.assertEqual(list(splits.marks), [4 * SEC])
+        self.assertEqual(started_at, 123.0)
+
+    def test_reboot_uses_wall_clock(self):
+        clock = VirtualClock(start_ns=1000 * SEC, wall_start_ns=WALL)
+        self.save_running(clock, 10 * SEC)
+        saved_wall = clock.wall_ns()
+        # 재부팅: monotonic 은 5초부터 다시, 벽시계는 저장 후 60초
+        rebooted = VirtualClock(start_ns=5 * SEC, wall_start_ns=saved_wall + 60 * SEC - 5 * SEC)
+        stopwatch, _, _ = self.restore(rebooted)
+        self.assertEqual(stopwatch.elapsed_ns(), 70 * SEC)
+        rebooted.advance(SEC)
+        self.assertEqual(stopwatch.elapsed_ns(), 71 * SEC)
+
+    def test_paused_state_does_not_grow(self):
+        clock = VirtualClock(wall_start_ns=WALL)
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        clock.advance(7 * SEC)
+        stopwatch.pause()
+        self.open(clock).save(stopwatch, SplitLog(), None)
+        clock.advance(3600 * SEC)
+        restored, _, started_at = self.restore(clock)
+        self.assertFalse(restored.is_running)
+        self.assertEqual(restored.elapsed_ns(), 7 * SEC)
+        self.assertIsNone(started_at)
+
+    def test_many_splits_survive(self):
+        # 저널은 윈도우에도 있는 파일 API 로만 (os.pread/pwrite 를 쓰면 실패)
+        for name in ('pread', 'pwrite'):
+            patcher = mock.patch.object(os, name, side_effect=AssertionError(f'os.{name}'), create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        clock = VirtualClock(wall_start_ns=WALL)
+        stopwatch = Stopwatch(clock)
+        splits = SplitLog()
+        saved = self.open(clock)
+        stopwatch.start()
+        count = checkpoint.MAX_INLINE_SPLITS * 20 + 7
+        for _ in range(count):
+            clock.advance(SEC)
+            splits.mark(stopwatch.elapsed_ns())
+            saved.save(stopwatch, splits, 1.0)
+        _, restored, _ = self.restore(clock)
+        self.assertEqual(len(restored), count)
+        self.assertEqual(restored.last_ns(), count * SEC)
+        self.assertEqual(list(restored.marks), list(splits.marks))
+
+    def test_torn_slot_falls_back_to_previous_save(self):
+        clock = VirtualClock(wall_start_ns=WALL)
+        stopwatch = Stopwatch(clock)
+        splits = SplitLog()
+        saved = self.open(clock)
+        stopwatch.start()
+        for _ in range(checkpoint.MAX_INLINE_SPLITS + 3):
+            clock.advance(SEC)
+            splits.mark(stopwatch.elapsed_ns())
+            saved.save(stopwatch, splits, 1.0)
+        newest = max((0, 1), key=saved.slot_sequence)
+        saved.map[newest * checkpoint.SLOT_SIZE + 64] ^= 0xFF
+        _, restored, _ = self.restore(clock)
+        self.assertEqual(list(restored.marks), list(splits.marks[:-1]))
+
+    def test_reset_after_long_run(self):
+        clock = VirtualClock(wall_start_ns=WALL)
+        stopwatch = Stopwatch(clock)
+        splits = SplitLog()
+        saved = self.open(clock)
+        stopwatch.start()
+        for _ in range(checkpoint.MAX_INLINE_SPLITS * 2):
+            clock.advance(SEC)
+            splits.mark(stopwatch.elapsed_ns())
+            saved.save(stopwatch, splits, 1.0)
+        stopwatch.reset()
+        splits.clear()
+        saved.save(stopwatch, splits, None)
+        stopwatch.start()
+        clock.advance(SEC)
+        splits.mark(stopwatch.elapsed_ns())
+        saved.save(stopwatch, splits, 2.0)
+        _, restored, started_at = self.restore(clock)
+        self.assertEqual((list(restored.marks), started_at), ([SEC], 2.0))
+
+    def test_changed_sees_other_process(self):
+        clock = VirtualClock(wall_start_ns=WALL)
+        mine = self.open(clock)
+        other = self.open(clock)
+        self.assertIsNone(mine.changed())
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        other.save(stopwatch, SplitLog(), 1.0)
+        state = mine.changed()
+        self.assertTrue(state.running)
+        self.assertIsNone(mine.changed())
+        # 이어서 저장하면 다른 프로세스가 쓴 번호 다음으로
+        mine.save(stopwatch, SplitLog(), 1.0)
+        self.assertEqual(mine.sequence, state.sequence + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Client.txt 테일러 (덧붙임, 덜 쓴 줄, 잘림, 로테이션) 와 자동 스플릿 규칙
+import os
+import tempfile
+import unittest
+
+from client_log import AutoSplitter, LogTail, zones_in
+
+
+def zone_line(zone):
+    return f'2023/08/20 14:23:11 123456789 cffb0719 [INFO Client 12345] : You have entered {zone}.\r\n'.encode()
+
+
+class LogTailTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'Client.txt')
+        self.append(zone_line('Old Zone'))
+        self.tail = LogTail(self.path, from_end=True)
+
+    def tearDown(self):
+        self.tail.close()
+        self.directory.cleanup()
+
+    def append(self, data, mode='ab'):
+        with open(self.path, mode) as f:
+            f.write(data)
+
+    def zones(self):
+        return [zone for block in self.tail.blocks() for zone in zones_in(block)]
+
+    def test_reads_only_appended_lines(self):
+        self.assertEqual(self.zones(), [])
+        self.append(zone_line('The Coast') + zone_line('The Mud Flats'))
+        self.assertEqual(self.zones(), ['The Coast', 'The Mud Flats'])
+        self.assertEqual(self.zones(), [])
+
+    def test_waits_for_complete_line(self):
+        line = zone_line('The Coast')
+        self.append(line[:20])
+        self.assertEqual(self.zones(), [])
+        self.append(line[20:])
+        self.assertEqual(self.zones(), ['The Coast'])
+
+    def test_truncation_restarts_from_beginning(self):
+        self.append(zone_line('The Coast'))
+        self.zones()
+        self.append(zone_line('The Ledge'), mode='wb')
+        self.assertEqual(self.zones(), ['The Ledge'])
+
+    def test_rotation_finishes_old_file_then_reads_new(self):
+        self.append(zone_line('The Coast'))
+        os.replace(self.path, self.path + '.1')
+        self.append(zone_line('The Climb'), mode='wb')
+        self.assertEqual(self.zones(), ['The Coast', 'The Climb'])
+
+    def test_chat_is_not_a_zone(self):
+        self.append(b'2023/08/20 14:23:11 1 c [INFO Client 1] #Someone: ] : You have entered Fake Zone.\n')
+        self.assertEqual(self.zones(), [])
+
+    def test_missing_file_is_opened_later(self):
+        tail = LogTail(self.path + '.new')
+        self.assertEqual(list(tail.blocks()), [])
+        with open(self.path + '.new', 'wb') as f:
+            f.write(zone_line('The Coast'))
+        self.assertEqual([zone for block in tail.blocks() for zone in zones_in(block)], ['The Coast'])
+        tail.close()
+
+
+class AutoSplitterTest(unittest.TestCase):
+    def setUp(self):
+        self.splitter = AutoSplitter('The Twilight Strand', '*', '*Hideout')
+
+    def test_start_only_from_zero(self):
+        self.assertEqual(self.splitter.on_zone('The Twilight Strand', running=False, zero=True), 'start')
+        self.assertIsNone(self.splitter.on_zone('The Twilight Strand', running=False, zero=False))
+        self.assertIsNone(self.splitter.on_zone('The Coast', running=False, zero=True))
+
+    def test_split_while_running(self):
+        self.assertEqual(self.splitter.on_zone('the coast', running=True, zero=False), 'split')
+
+    def test_hideout_pauses_and_leaving_resumes(self):
+        self.assertEqual(self.splitter.on_zone('Celestial Hideout', running=True, zero=False), 'pause')
+        self.assertTrue(self.splitter.listening(running=False, zero=False))
+        self.assertEqual(self.splitter.on_zone('The Coast', running=False, zero=False), 'resume')
+        self.assertFalse(self.splitter.listening(running=False, zero=False))
+
+    def test_manual_pause_is_not_resumed(self):
+        self.assertIsNone(self.splitter.on_zone('Celestial Hideout', running=False, zero=False))
+        self.assertIsNone(self.splitter.on_zone('The Coast', running=False, zero=False))
+
+    def test_empty_patterns_never_listen(self):
+        splitter = AutoSplitter()
+        self.assertFalse(splitter.listening(running=True, zero=False))
+        self.assertFalse(splitter.listening(running=False, zero=True))
+        self.assertIsNone(splitter.on_zone('The Coast', running=True, zero=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# 가상 시계로 스톱워치 / 카운트다운 알림 마감 / 스케줄러를 기다리지 않고 확인한다
+#   python -m unittest discover tests
+import unittest
+
+from clock import SYSTEM_CLOCK, VirtualClock
+from stopwatch import NS_PER_SEC, Stopwatch
+from timers import Countdown, TimerScheduler
+
+SEC = NS_PER_SEC
+
+
+class VirtualClockTest(unittest.TestCase):
+    def test_moves_only_when_advanced(self):
+        clock = VirtualClock(start_ns=5, wall_start_ns=1000)
+        self.assertEqual(clock(), 5)
+        self.assertEqual(clock(), 5)
+        clock.advance(10)
+        clock.sleep(5)
+        self.assertEqual(clock(), 20)
+        self.assertEqual(clock.wall_ns(), 1020)
+
+    def test_never_goes_backwards(self):
+        clock = VirtualClock(start_ns=100)
+        clock.advance_to(50)
+        clock.advance(-10)
+        self.assertEqual(clock(), 100)
+        clock.advance_to(150)
+        self.assertEqual(clock(), 150)
+
+    def test_system_clock_is_monotonic(self):
+        first = SYSTEM_CLOCK()
+        self.assertLessEqual(first, SYSTEM_CLOCK())
+        self.assertGreater(SYSTEM_CLOCK.wall(), 0)
+
+
+class StopwatchTest(unittest.TestCase):
+    def test_pause_and_resume(self):
+        clock = VirtualClock()
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        clock.advance(3 * SEC + 1)
+        stopwatch.pause()
+        clock.advance(100 * SEC)
+        self.assertEqual(stopwatch.seconds, 3)
+        stopwatch.start()
+        clock.advance(2 * SEC)
+        self.assertEqual(stopwatch.elapsed_ns(), 5 * SEC + 1)
+        self.assertEqual(stopwatch.next_deadline_ns(clock()), clock() + SEC - 1)
+
+    def test_ten_hours_without_drift(self):
+        clock = VirtualClock()
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        for _ in range(36_000):
+            clock.advance_to(stopwatch.next_deadline_ns(clock()))
+        self.assertEqual(stopwatch.elapsed_ns(), 36_000 * SEC)
+
+
+class CountdownTest(unittest.TestCase):
+    def test_alerts_fire_on_their_deadlines(self):
+        clock = VirtualClock()
+        countdown = Countdown('flask', 10 * SEC, clock, alerts_ns=(3 * SEC, 0))
+        countdown.start()
+        fired = []
+        while True:
+            deadline = countdown.next_deadline_ns(clock())
+            if deadline is None:
+                break
+            clock.advance_to(deadline)
+            fired.extend((clock(), threshold, late) for threshold, late in countdown.take_alerts(clock()))
+        self.assertEqual(fired, [(7 * SEC, 3 * SEC, 0), (10 * SEC, 0, 0)])
+        self.assertTrue(countdown.alerting)
+        self.assertEqual(countdown.display(), '00:00')
+
+    def test_late_alert_reports_lateness(self):
+        clock = VirtualClock()
+        countdown = Countdown('buff', 5 * SEC, clock)
+        countdown.start()
+        clock.advance(5 * SEC + 1234)
+        self.assertEqual(countdown.take_alerts(clock()), [(0, 1234)])
+        self.assertEqual(countdown.take_alerts(clock()), [])
+
+    def test_restart_clears_alerts(self):
+        clock = VirtualClock()
+        countdown = Countdown('buff', 2 * SEC, clock)
+        countdown.start()
+        clock.advance(3 * SEC)
+        countdown.take_alerts(clock())
+        countdown.restart()
+        self.assertFalse(countdown.alerting)
+        self.assertEqual(countdown.seconds, 2)
+        self.assertTrue(countdown.is_running)
+
+
+class SchedulerTest(unittest.TestCase):
+    def test_pops_earliest_and_reschedules(self):
+        clock = VirtualClock()
+        stopwatch = Stopwatch(clock)
+        countdown = Countdown('cd', int(1.5 * SEC), clock)
+        scheduler = TimerScheduler(clock)
+        stopwatch.start()
+        countdown.start()
+        scheduler.add(stopwatch)
+        scheduler.add(countdown)
+        self.assertEqual(scheduler.next_wake_ns(), SEC // 2)
+        clock.advance_to(scheduler.next_wake_ns())
+        self.assertEqual(scheduler.pop_due(), [countdown])
+        self.assertEqual(scheduler.next_wake_ns(), SEC)
+
+    def test_slack_rounds_wake_up_to_grid(self):
+        clock = VirtualClock(start_ns=1)
+        stopwatch = Stopwatch(clock)
+        stopwatch.start()
+        scheduler = TimerScheduler(clock, slack_ns=1000)
+        scheduler.add(stopwatch)
+        self.assertEqual(scheduler.next_deadline_ns(), SEC + 1)
+        self.assertEqual(scheduler.next_wake_ns(), SEC + 1000)
+
+    def test_paused_timer_has_no_deadline(self):
+        clock = VirtualClock()
+        stopwatch = Stopwatch(clock)
+        scheduler = TimerScheduler(clock)
+        scheduler.add(stopwatch)
+        self.assertIsNone(scheduler.next_wake_ns())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# 설정 저장: 모아 쓰기, 같은 내용 건너뛰기, 임시 파일 + 바꿔치기, 실패 후 다시 쓰기
+import configparser
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from config_store import ConfigWriter
+
+HOUR = 3600.0  # 백그라운드 스레드가 끼어들지 않게 (flush 로만 쓴다)
+
+
+def config(**position):
+    parser = configparser.ConfigParser()
+    parser['Position'] = position
+    return parser
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class ConfigWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'timer_config.ini')
+
+    def read(self):
+        with open(self.path) as f:
+            return f.read()
+
+    def test_saves_in_a_burst_are_written_once(self):
+        writer = ConfigWriter(self.path, delay=0.2)
+        for i in range(5):
+            writer.save(config(x=str(i)))
+        self.assertEqual(writer.writes, 0)
+        self.assertTrue(wait_for(lambda: writer.writes))
+        time.sleep(0.3)
+        self.assertEqual(writer.writes, 1)
+        self.assertIn('x = 4', self.read())
+
+    def test_unchanged_content_is_not_written(self):
+        with open(self.path, 'w') as f:
+            config(x='0.5').write(f)
+        writer = ConfigWriter(self.path, delay=HOUR)
+        writer.save(config(x='0.5'))
+        self.assertTrue(writer.flush())
+        self.assertEqual(writer.writes, 0)
+        writer.save(config(x='0.6'))
+        writer.flush()
+        writer.save(config(x='0.6'))
+        writer.flush()
+        self.assertEqual(writer.writes, 1)
+
+    def test_writes_temp_file_then_replaces(self):
+        writer = ConfigWriter(self.path, delay=HOUR)
+        writer.save(config(x='0.5'))
+        with mock.patch('os.replace', wraps=os.replace) as replace:
+            self.assertTrue(writer.flush())
+        replace.assert_called_once_with(self.path + '.tmp', self.path)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+        self.assertEqual(self.read(), writer.written)
+
+    def test_failed_replace_keeps_old_file(self):
+        writer = ConfigWriter(self.path, delay=HOUR)
+        writer.save(config(x='0.5'))
+        writer.flush()
+        writer.save(config(x='0.6'))
+        with mock.patch('os.replace', side_effect=PermissionError('locked')), mock.patch('builtins.print'):
+            self.assertFalse(writer.flush())
+        self.assertIn('x = 0.5', self.read())
+        self.assertIsInstance(writer.error, PermissionError)
+        self.assertTrue(writer.flush())
+        self.assertIn('x = 0.6', self.read())
+        self.assertIsNone(writer.error)
+
+    def test_thread_survives_and_retries_failed_write(self):
+        path = os.path.join(self.directory.name, 'missing', 'timer_config.ini')
+        writer = ConfigWriter(path, delay=0, retry_delay=0.05)
+        with mock.patch('builtins.print'):
+            writer.save(config(x='0.5'))
+            self.assertTrue(wait_for(lambda: writer.error is not None))
+        self.assertIsInstance(writer.error, FileNotFoundError)
+        self.assertTrue(writer.thread.is_alive())
+        os.mkdir(os.path.dirname(path))
+        self.assertTrue(wait_for(lambda: writer.writes))
+        self.assertIsNone(writer.error)
+        with open(path) as f:
+            self.assertIn('x = 0.5', f.read())
+
+    def test_flush_waits_for_write_in_progress(self):
+        writer = ConfigWriter(self.path, delay=0)
+        entered = threading.Event()
+        release = threading.Event()
+        original = writer.write
+
+        def slow_write(text):
+            entered.set()
+            release.wait()
+            original(text)
+
+        writer.write = slow_write
+        writer.save(config(x='0.5'))
+        self.assertTrue(entered.wait(5))
+        threading.Timer(0.05, release.set).start()
+        self.assertTrue(writer.flush())
+        self.assertIn('x = 0.5', self.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# 핫키 명령 큐: 채터링 합치기, 큐 한도, 다시 그린 명령만 입력 → 페인트 지연 기록.
+# 스캔 코드 훅: 등록한 키만 보고, 누르고 있는 동안의 자동 반복은 무시 (SyntheticBackend 로 훅 없이)
+import os
+import threading
+import unittest
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PyQt5.QtWidgets import QApplication
+
+    from hotkeys import DEFAULT_BINDINGS, CommandQueue, KeyboardBackend, KeyEvent, ScanCodeHotkeys, SyntheticBackend
+except ImportError:
+    QApplication = None
+
+MS = 1_000_000
+
+
+@unittest.skipIf(QApplication is None, 'PyQt5 is not installed')
+class CommandQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.handled = []
+        self.repaint = {'start': True, 'reset': False, 'split': True}
+        self.queue = CommandQueue({name: self.handler(name) for name in self.repaint}, maxlen=3)
+        # 같은 스레드에서 post 하면 wake 가 바로 drain 을 부르므로 끊고 직접 drain 한다
+        self.queue.wake.disconnect()
+        self.wakes = []
+        self.queue.wake.connect(lambda: self.wakes.append(1))
+        self.now = 0
+        patcher = mock.patch('hotkeys.time.monotonic_ns', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def handler(self, name):
+        def handle():
+            self.handled.append(name)
+            return self.repaint[name]
+        return handle
+
+    def post(self, name, at_ms):
+        self.now = at_ms * MS
+        return self.queue.post(name)
+
+    def test_repeats_inside_window_are_coalesced(self):
+        self.assertTrue(self.post('start', 0))
+        self.assertFalse(self.post('start', 100))
+        # 버린 입력도 마지막 입력 시각을 늘려 잡는다 (100 + 150 안쪽)
+        self.assertFalse(self.post('start', 200))
+        self.assertTrue(self.post('split', 210))
+        self.assertTrue(self.post('start', 220))
+        self.assertEqual(self.queue.dropped, 2)
+        self.queue.drain()
+        self.assertEqual(self.handled, ['start', 'split', 'start'])
+
+    def test_repeat_after_window_is_kept(self):
+        self.post('start', 0)
+        self.assertTrue(self.post('start', 150))
+
+    def test_full_queue_drops(self):
+        for i, name in enumerate(['start', 'split', 'reset', 'start', 'split']):
+            self.post(name, i)
+        self.assertEqual(len(self.queue.pending), 3)
+        self.assertEqual(self.queue.dropped, 2)
+        # 빈 큐에 처음 넣을 때만 깨운다
+        self.assertEqual(len(self.wakes), 1)
+        self.queue.drain()
+        self.assertEqual(self.handled, ['start', 'split', 'reset'])
+        self.post('reset', 500)
+        self.assertEqual(len(self.wakes), 2)
+
+    def test_latency_only_for_commands_that_repaint(self):
+        self.post('start', 0)
+        self.post('reset', 1)
+        self.post('split', 2)
+        self.now = 5 * MS
+        self.queue.drain()
+        self.assertEqual([command.name for command in self.queue.awaiting_paint], ['start', 'split'])
+        self.now = 9 * MS
+        self.queue.painted()
+        self.assertEqual(self.queue.awaiting_paint, [])
+        self.assertEqual(list(self.queue.latency.samples), [('start', 5 * MS, 9 * MS), ('split', 3 * MS, 7 * MS)])
+        # 아무것도 바꾸지 않은 리셋은 다음 페인트에 끌려 들어가지 않는다
+        self.post('reset', 600)
+        self.queue.drain()
+        self.now = 1200 * MS
+        self.queue.painted()
+        self.assertEqual(set(self.queue.latency.summary()), {'start', 'split'})
+        self.assertEqual(self.queue.latency.summary()['split'], (1, 7.0, 7.0))
+
+
+@unittest.skipIf(QApplication is None, 'PyQt5 is not installed')
+class CrossThreadTest(unittest.TestCase):
+    def test_post_from_hook_thread_drains_on_event_loop(self):
+        app = QApplication.instance() or QApplication([])
+        handled = []
+        queue = CommandQueue({'start': lambda: handled.append(threading.get_ident()) or True})
+        thread = threading.Thread(target=queue.post, args=('start',))
+        thread.start()
+        thread.join()
+        self.assertEqual(handled, [])
+        app.processEvents()
+        self.assertEqual(handled, [threading.get_ident()])
+        self.assertEqual(len(queue.awaiting_paint), 1)
+
+
+@unittest.skipIf(QApplication is None, 'PyQt5 is not installed')
+class ScanCodeHotkeysTest(unittest.TestCase):
+    def setUp(self):
+        self.posted = []
+        self.backend = SyntheticBackend()
+        self.backend.install(DEFAULT_BINDINGS, self.posted.append)
+
+    def test_only_bound_keys_post(self):
+        for key in ('F1', 'a', 'F5', 'F9', 'F2'):
+            self.backend.tap(key)
+        self.assertEqual(self.posted, ['split', 'reset'])
+        self.assertEqual(self.backend.hotkeys.held, set())
+
+    def test_auto_repeat_is_ignored_while_held(self):
+        for _ in range(5):
+            self.backend.press('F5')
+        self.assertEqual(self.posted, ['split'])
+        # 다른 핫키는 누르고 있는 키와 상관없이
+        self.backend.press('F4')
+        self.backend.release('F5')
+        self.backend.press('F5')
+        self.assertEqual(self.posted, ['split', 'toggle', 'split'])
+        self.assertEqual(self.backend.hotkeys.held, {'F4', 'F5'})
+
+    def test_release_of_unbound_key_is_ignored(self):
+        self.backend.press('F5')
+        self.backend.hotkeys.on_event(KeyEvent('up', 'F1'))
+        self.backend.press('F5')
+        self.assertEqual(self.posted, ['split'])
+
+    def test_play_presses_from_another_thread(self):
+        self.backend.play([(0, 'F3'), (0, None), (0, 'F3')]).join()
+        self.assertEqual(self.posted, ['start', 'start'])
+        self.assertEqual([key for key, _, _ in self.backend.sent], ['F3', 'F3'])
+
+    def test_from_bindings_maps_every_scan_code(self):
+        keyboard = mock.Mock()
+        keyboard.key_to_scan_codes.side_effect = lambda key: {'F5': (63,), 'F2': (60, 0xE03C)}[key]
+        with mock.patch.dict('sys.modules', keyboard=keyboard):
+            hotkeys = ScanCodeHotkeys.from_bindings({'F5': 'split', 'F2': 'reset'}, self.posted.append)
+        self.assertEqual(hotkeys.commands, {63: 'split', 60: 'reset', 0xE03C: 'reset'})
+        hotkeys.on_event(KeyEvent('down', 0xE03C))
+        hotkeys.on_event(KeyEvent('down', 64))
+        self.assertEqual(self.posted, ['reset'])
+
+    def test_uninstall_without_install_is_safe(self):
+        KeyboardBackend().uninstall()
+        self.backend.uninstall()
+        self.assertIsNone(self.backend.hotkeys)
+
+
+if __name__ == '__main__':
+    unittest.main()
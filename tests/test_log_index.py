@@ -0,0 +1,59 @@
+# Client.txt 이진 색인: 줄 머리 시각 파싱과 이어서 색인하기
+import calendar
+import os
+import tempfile
+import unittest
+
+from log_index import ZONE, LogIndex, parse_since, parse_stamp
+
+
+def line(text, stamp='2023/08/20 14:23:11'):
+    return f'{stamp} 123456789 cffb0719 [INFO Client 12345] : {text}\r\n'.encode()
+
+
+class ParseStampTest(unittest.TestCase):
+    def test_stamp(self):
+        expected = calendar.timegm((2023, 8, 20, 14, 23, 11))
+        self.assertEqual(parse_stamp(b'2023/08/20 14:23:11', {}), expected)
+        self.assertEqual(parse_since('2023-08-20'), expected - (14 * 3600 + 23 * 60 + 11))
+
+    def test_malformed_stamp_is_none(self):
+        for head in (b'', b'[INFO Client 1] : Y', b'2023/08/20 14:23', b'2023/13/20 14:23:11', b'2023-08-20 14:23:11'):
+            self.assertIsNone(parse_stamp(head, {}), head)
+        with self.assertRaises(ValueError):
+            parse_since('yesterday')
+
+
+class LogIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'Client.txt')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def append(self, data):
+        with open(self.path, 'ab') as f:
+            f.write(data)
+
+    def test_lines_without_stamp_are_skipped(self):
+        self.append(line('You have entered The Coast.')
+                    + b'[INFO Client 12345] : You have entered Nowhere.\r\n'
+                    + line('You have entered Fake Zone.', stamp='2023/08/20 xx:23:11')
+                    + line('You have entered The Ledge.', stamp='2023/08/20 14:30:00'))
+        index = LogIndex(self.path)
+        self.assertEqual(index.update(), 2)
+        self.assertEqual([(kind, index.zones[zone]) for _, kind, _, zone in index.events()],
+                         [(ZONE, 'The Coast'), (ZONE, 'The Ledge')])
+
+    def test_continues_from_saved_offset(self):
+        self.append(line('You have entered The Coast.'))
+        self.assertEqual(LogIndex(self.path).update(), 1)
+        self.append(line('Someone (Witch) is now level 2') + line('Someone has been slain.'))
+        index = LogIndex(self.path)
+        self.assertEqual(index.update(), 2)
+        self.assertEqual(index.count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
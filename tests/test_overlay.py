@@ -0,0 +1,150 @@
+# 오버레이의 설정 다시 읽기 (offscreen Qt, 임시 디렉터리의 timer_config.ini)
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PyQt5.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+INI = '''[Position]
+x = 0.9
+y = 0.05
+
+[Size]
+width = 0.05
+height = 0.025
+
+[Run]
+category = act1
+'''
+
+
+@unittest.skipIf(QApplication is None, 'PyQt5 is not installed')
+class ReloadConfigTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from checkpoint import Checkpoint
+        from history import HistoryWriter
+        from hotkeys import SyntheticBackend
+        from m_clock import OverlayTimer
+        from screen_provider import FixedScreenProvider
+
+        # OverlayTimer 는 작업 디렉터리의 timer_config.ini 를 쓴다
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+        self.write(INI)
+        self.timer = OverlayTimer(FixedScreenProvider(1920, 1080), SyntheticBackend(), HistoryWriter(':memory:'),
+                                  Checkpoint(None))
+        self.timer.finish_startup()
+        self.addCleanup(self.close_timer)
+
+    def close_timer(self):
+        self.timer.tick_timer.stop()
+        self.timer.config_writer.flush()
+        self.timer.history_writer.close()
+        self.timer.checkpoint.close()
+        if self.timer.log_watcher is not None:
+            self.timer.log_watcher.close()
+        self.timer.deleteLater()
+
+    def write(self, text):
+        with open('timer_config.ini', 'w') as f:
+            f.write(text)
+
+    def reload(self, text):
+        self.write(text)
+        with mock.patch.object(self.timer, 'apply_settings', wraps=self.timer.apply_settings) as apply:
+            with mock.patch('sys.stderr'):
+                self.timer.reload_config()
+        return [call.args[0] for call in apply.call_args_list]
+
+    def test_applies_only_changed_fields(self):
+        self.assertEqual(self.reload(INI + '\n[Colors]\nrunning = #00ff00\n'), [['colors']])
+        self.assertEqual(self.timer.settings.colors['running'], '#00ff00')
+        self.assertEqual(self.reload(INI.replace('act1', 'act2') + '\n[Colors]\nrunning = #00ff00\n'), [['category']])
+        self.assertEqual(self.timer.session.category, 'act2')
+
+    def test_bad_values_keep_current_settings(self):
+        settings = self.timer.settings
+        for text in (INI.replace('x = 0.9', 'x = 0.9a'), INI.replace('height = 0.025', 'height = '),
+                     INI + '[Run\n', INI.replace('[Size]', 'width = 0.1\n[Size]\n[Size]')):
+            self.assertEqual(self.reload(text), [], text)
+            self.assertIs(self.timer.settings, settings)
+        # 고친 뒤에는 바뀐 항목만 적용된다
+        self.assertEqual(self.reload(INI.replace('x = 0.9', 'x = 0.5')), [['ratios']])
+        self.assertEqual(self.timer.settings.ratios.x, 0.5)
+
+
+@unittest.skipIf(QApplication is None, 'PyQt5 is not installed')
+class DigitLayoutTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_cells_keep_base_size_and_content_grows(self):
+        from digit_renderer import MARGIN, DigitRenderer
+        renderer = DigitRenderer()
+        renderer.resize(96, 27)
+        renderer.set_text('00:00:00')
+        self.assertEqual((renderer.digit_width, renderer.content_size), (13, (96, 27)))
+        self.assertIsNone(renderer.set_text('00:01:10\n00:05 +00:10 +00:20\n00:05 00:00'))
+        self.assertEqual(renderer.digit_width, 13)
+        width, height = renderer.content_size
+        self.assertEqual(height, 23 * 3 + MARGIN * 2)
+        self.assertTrue(all(cell.width() in (13, 6) for cell in renderer.cells))
+        self.assertTrue(all(cell.right() < width - MARGIN + 1 for cell in renderer.cells))
+        self.assertEqual(len(renderer.cells), len(renderer.glyphs))
+        # 배치가 같으면 바뀐 칸만
+        dirty = renderer.set_text('00:01:11\n00:05 +00:10 +00:20\n00:04 00:00')
+        self.assertEqual(len(dirty), 2)
+
+    def test_overlay_widens_instead_of_shrinking_digits(self):
+        from checkpoint import Checkpoint
+        from clock import VirtualClock
+        from comparison import Comparison
+        from history import HistoryWriter
+        from hotkeys import SyntheticBackend
+        from m_clock import OverlayTimer
+        from screen_provider import FixedScreenProvider
+        from stopwatch import NS_PER_SEC
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+        with open('timer_config.ini', 'w') as f:
+            f.write(INI.replace('y = 0.05', 'y = 0.99'))
+        clock = VirtualClock()
+        timer = OverlayTimer(FixedScreenProvider(1920, 1080), SyntheticBackend(), HistoryWriter(':memory:'),
+                             Checkpoint(None), clock=clock)
+        self.addCleanup(timer.history_writer.close)
+        self.addCleanup(timer.config_writer.flush)
+        self.assertEqual((timer.width(), timer.height(), timer.renderer.digit_width), (96, 27, 13))
+        timer.session.baseline = Comparison([30 * NS_PER_SEC], 60 * NS_PER_SEC, [30 * NS_PER_SEC])
+        timer.session.set_timers([('flask', 'countdown', 5, (1, 0)), ('map', 'stopwatch', 0, ())])
+        timer.start_timer()
+        clock.advance(40 * NS_PER_SEC)
+        timer.split_timer()
+        self.assertEqual(timer.renderer.text.count('\n'), 2)
+        self.assertEqual(timer.renderer.digit_width, 13)
+        self.assertEqual((timer.width(), timer.height()), timer.renderer.content_size)
+        # 화면 아래 끝에 두었으면 위로 밀어 화면 안에 둔다
+        self.assertLessEqual(timer.geometry().bottom(), 1079)
+        timer.reset_timer()
+        timer.session.set_timers([])
+        timer.updateDisplay(0)
+        self.assertEqual((timer.width(), timer.height()), (96, 27))
+
+
+if __name__ == '__main__':
+    unittest.main()
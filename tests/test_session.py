@@ -0,0 +1,192 @@
+# TimerSession 상태 전환 / 보조 타이머 / 재생을 가상 시계로
+import io
+import json
+import unittest
+
+from checkpoint import Checkpoint
+from client_log import AutoSplitter
+from clock import VirtualClock
+from replay import Replay, read_recording
+from session import TimerSession
+from stopwatch import NS_PER_SEC
+
+SEC = NS_PER_SEC
+TIMERS = [('flask', 'countdown', 5, (1, 0)), ('map', 'stopwatch', 0, ())]
+
+
+class FakeWriter:
+    def __init__(self):
+        self.records = []
+
+    def add(self, record):
+        self.records.append(record)
+
+
+def make_session(clock=None, **kwargs):
+    clock = clock or VirtualClock(wall_start_ns=1_700_000_000 * SEC)
+    session = TimerSession(clock, **kwargs)
+    session.set_timers(TIMERS)
+    return clock, session
+
+
+class TransitionTest(unittest.TestCase):
+    def test_start_pause_toggle(self):
+        clock, session = make_session()
+        self.assertEqual(session.state(), 'zero')
+        self.assertFalse(session.pause())
+        self.assertTrue(session.start())
+        self.assertFalse(session.start())
+        self.assertEqual(session.run_started_at, 1_700_000_000.0)
+        clock.advance(3 * SEC)
+        self.assertTrue(session.toggle())
+        self.assertEqual(session.state(), 'paused')
+        clock.advance(10 * SEC)
+        self.assertEqual(session.display_text(), '00:00:03 00:02 00:03')
+
+    def test_split_only_while_running(self):
+        clock, session = make_session()
+        self.assertFalse(session.split())
+        session.start()
+        clock.advance(61 * SEC)
+        self.assertTrue(session.split())
+        clock.advance(2 * SEC)
+        self.assertEqual(list(session.splits.marks), [61 * SEC])
+        self.assertTrue(session.display_text().startswith('00:02 00:01:03'))
+
+    def test_reset_records_run(self):
+        writer = FakeWriter()
+        clock, session = make_session(history_writer=writer, category='act1')
+        session.reset()
+        self.assertEqual(writer.records, [])
+        session.start()
+        clock.advance(5 * SEC)
+        session.split()
+        clock.advance(5 * SEC)
+        session.pause()
+        session.reset()
+        record, = writer.records
+        self.assertEqual((record.category, record.total_ns, record.completed, record.marks),
+                         ('act1', 10 * SEC, True, [5 * SEC]))
+        self.assertEqual(session.state(), 'zero')
+        self.assertEqual(len(session.splits), 0)
+
+    def test_countdown_alerts_through_tick(self):
+        clock, session = make_session()
+        session.start()
+        alerts = []
+        while clock() < 6 * SEC:
+            clock.advance_to(session.next_wake_ns())
+            alerts.extend((clock(), timer.name, threshold) for timer, threshold, _ in session.tick()[1])
+        self.assertEqual(alerts, [(4 * SEC, 'flask', SEC), (5 * SEC, 'flask', 0)])
+        self.assertEqual(session.state(), 'alert')
+        self.assertTrue(session.restart_countdowns())
+        self.assertEqual(session.state(), 'running')
+
+    def test_comparison_merges_recorded_runs(self):
+        from comparison import Comparison
+        writer = FakeWriter()
+        loads = []
+
+        def comparisons():
+            loads.append(1)
+            return Comparison((), 0, ())
+
+        clock, session = make_session(history_writer=writer, comparisons=comparisons)
+        for total in (20, 10):
+            session.start()
+            clock.advance(total * SEC // 2)
+            session.split()
+            clock.advance(total * SEC // 2)
+            session.pause()
+            session.reset()
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(list(session.baseline.pb_ns), [5 * SEC, 10 * SEC])
+        self.assertEqual(list(session.baseline.best_ns), [5 * SEC])
+        session.start()
+        clock.advance(6 * SEC)
+        self.assertEqual(session.state(), 'behind')
+
+
+class AutosplitTest(unittest.TestCase):
+    def test_zone_commands(self):
+        clock, session = make_session()
+        session.autosplitter = AutoSplitter('The Twilight Strand', '*', '*Hideout')
+        self.assertIsNone(session.on_zone('The Coast'))
+        self.assertTrue(session.listens_for_zones())
+        self.assertEqual(session.on_zone('The Twilight Strand'), 'start')
+        clock.advance(SEC)
+        self.assertEqual(session.on_zone('The Coast'), 'split')
+        self.assertEqual(session.on_zone('Celestial Hideout'), 'pause')
+        self.assertTrue(session.listens_for_zones())
+        self.assertEqual(session.on_zone('The Mud Flats'), 'resume')
+        self.assertTrue(session.is_running)
+        session.pause()
+        self.assertFalse(session.listens_for_zones())
+
+
+class RestoreTest(unittest.TestCase):
+    def test_extra_timers_follow_restored_state(self):
+        clock = VirtualClock()
+        checkpoint = Checkpoint(None, wall_clock=clock.wall_ns)
+        _, other = make_session(clock, checkpoint=checkpoint)
+        _, session = make_session(clock, checkpoint=checkpoint)
+        other.start()
+        clock.advance(2 * SEC)
+        session.restore()
+        self.assertTrue(all(timer.is_running for timer in session.extra_timers))
+        self.assertEqual(session.elapsed_ns(), 2 * SEC)
+        other.pause()
+        session.restore()
+        self.assertFalse(any(timer.is_running for timer in session.extra_timers))
+        other.reset()
+        session.restore()
+        self.assertEqual([timer.display() for timer in session.extra_timers], ['00:05', '00:00'])
+
+
+class ReplayTest(unittest.TestCase):
+    def run_session(self, events):
+        clock, session = make_session(slack_ns=2_000_000)
+        session.autosplitter = AutoSplitter('A', '*', '')
+        player = Replay(session, clock).run(events, until_ns=10 * 3600 * SEC)
+        return player, (session.display_text(), list(session.splits.marks), player.alerts, player.ticks)
+
+    def test_ten_hours_is_deterministic(self):
+        events = [(0, 'zone', 'A')]
+        for i in range(1, 3000):
+            events.append((i * 10 * SEC, 'zone', f'Z{i}'))
+            events.append((i * 10 * SEC + 3 * SEC, 'countdown', None))
+        first, result = self.run_session(events)
+        second, again = self.run_session(events)
+        self.assertEqual(result, again)
+        self.assertEqual(first.elapsed_ns(), 10 * 3600 * SEC)
+        self.assertEqual(first.events, len(events))
+        self.assertEqual(len(result[1]), 2999)
+        # 메인/map 스톱워치의 초 경계마다 (격자에 맞춰 같이 깨어나므로) 틱이 적어도 하나씩
+        self.assertGreaterEqual(first.ticks, 36_000)
+
+    def test_recording_round_trip(self):
+        f = io.StringIO('\n'.join(json.dumps(event) for event in (
+            {'t': 0.5, 'command': 'start'},
+            {'t': 2.0, 'command': 'split'},
+            {'t': 3.25, 'command': 'pause'},
+        )))
+        clock, session = make_session()
+        Replay(session, clock).run(read_recording(f))
+        self.assertEqual(session.elapsed_ns(), int(2.75 * SEC))
+        self.assertEqual(list(session.splits.marks), [int(1.5 * SEC)])
+
+    def test_speed_sleeps_scaled_real_time(self):
+        slept = []
+        clock, session = make_session()
+        Replay(session, clock, speed=60, sleep=slept.append).run([(0, 'start', None), (120 * SEC, 'pause', None)])
+        self.assertAlmostEqual(sum(slept), 2.0)
+        self.assertEqual(session.elapsed_ns(), 120 * SEC)
+
+    def test_unknown_command(self):
+        clock, session = make_session()
+        with self.assertRaises(ValueError):
+            Replay(session, clock).apply('jump')
+
+
+if __name__ == '__main__':
+    unittest.main()
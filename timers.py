@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import time
+
+from stopwatch import Stopwatch, NS_PER_SEC
+from splits import format_segment
+
+
+class Countdown:
+    # 정해진 시간에서 거꾸로 세는 타이머. 남은 시간은 Stopwatch 의 monotonic 기준점에서 계산한다.
+    # 알림은 틱을 세지 않고 "남은 시간이 임계값이 되는 절대 시각" 을 스케줄러 마감으로 건다.
+    __slots__ = ('name', 'duration_ns', 'stopwatch', 'alerts_ns', 'fired')
+
+    def __init__(self, name, duration_ns, clock=time.monotonic_ns, alerts_ns=(0,)):
+        self.name = name
+        self.duration_ns = duration_ns
+        self.stopwatch = Stopwatch(clock)
+        self.alerts_ns = sorted(alerts_ns, reverse=True)  # 남은 시간 임계값 (큰 것부터 차례로 울림)
+        self.fired = 0  # 이미 울린 임계값 수
+
+    @property
+    def alerting(self):
+        return self.fired > 0
+
+    @property
+    def is_running(self):
+        return self.stopwatch.is_running
+
+    def start(self):
+        if self.remaining_ns() > 0:
+            self.stopwatch.start()
+
+    def pause(self):
+        self.stopwatch.pause()
+
+    def reset(self):
+        self.stopwatch.reset()
+        self.fired = 0
+
+    def restart(self):
+        self.reset()
+        self.start()
+
+    def remaining_ns(self, now=None):
+        return max(self.duration_ns - self.stopwatch.elapsed_ns(now), 0)
+
+    @property
+    def seconds(self):
+        # 남은 시간을 올림한 초 (0 이 되는 순간이 만료)
+        return -(-self.remaining_ns() // NS_PER_SEC)
+
+    def next_deadline_ns(self, now):
+        # 표시 초가 바뀌는 시각과 다음 알림 시각 중 이른 것. 멈췄거나 만료 후 알림도 끝났으면 None
+        if not self.is_running:
+            return None
+        remaining = self.remaining_ns(now)
+        deadline = None
+        if remaining > 0:
+            deadline = now + (remaining % NS_PER_SEC or NS_PER_SEC)
+        if self.fired < len(self.alerts_ns):
+            alert = now + max(remaining - self.alerts_ns[self.fired], 0)
+            if deadline is None or alert < deadline:
+                deadline = alert
+        return deadline
+
+    def take_alerts(self, now):
+        # 지금까지 지난 임계값들을 [(임계값 ns, 늦은 ns)] 로 돌려주고 울린 것으로 표시한다
+        if not self.is_running:
+            return []
+        elapsed = self.stopwatch.elapsed_ns(now)
+        remaining = self.duration_ns - elapsed
+        due = []
+        while self.fired < len(self.alerts_ns) and remaining <= self.alerts_ns[self.fired]:
+            threshold = self.alerts_ns[self.fired]
+            # 전체 길이보다 큰 임계값은 시작 시각이 목표
+            due.append((threshold, min(threshold - remaining, elapsed)))
+            self.fired += 1
+        return due
+
+    def display(self):
+        return format_segment(self.seconds)
+
+
+class NamedStopwatch(Stopwatch):
+    # 오버레이에 함께 표시하는 보조 스톱워치 (맵 시간 등)
+    __slots__ = ('name',)
+
+    def __init__(self, name, clock=time.monotonic_ns):
+        super().__init__(clock)
+        self.name = name
+
+    def display(self):
+        return format_segment(self.seconds)
+
+
+def parse_timers(config):
+    # [Timers] 는 "이름 = stopwatch" 또는 "이름 = countdown 초 [alert 남은초 ...]" 형식.
+    # 알림을 적지 않으면 만료(0초) 때 한 번 울린다. 잘못된 줄은 건너뛴다.
+    timers = []
+    if not config.has_section('Timers'):
+        return timers
+    for name, value in config.items('Timers'):
+        parts = value.split()
+        if parts == ['stopwatch']:
+            timers.append((name, 'stopwatch', 0, ()))
+            continue
+        if len(parts) < 2 or parts[0] != 'countdown':
+            continue
+        alerts = ['0']
+        if len(parts) > 2:
+            if parts[2] != 'alert':
+                continue
+            alerts = parts[3:]
+        try:
+            seconds = float(parts[1])
+            alerts = tuple(float(alert) for alert in alerts)
+        except ValueError:
+            continue
+        if seconds > 0:
+            timers.append((name, 'countdown', seconds, alerts))
+    return timers
+
+
+def build_timers(specs, clock=time.monotonic_ns):
+    # Settings.timers 의 (이름, 종류, 초, 알림 초) 목록으로 보조 타이머를 만든다
+    timers = []
+    for name, kind, seconds, alerts in specs:
+        if kind == 'countdown':
+            alerts_ns = [int(alert * NS_PER_SEC) for alert in alerts]
+            timers.append(Countdown(name, int(seconds * NS_PER_SEC), clock, alerts_ns))
+        else:
+            timers.append(NamedStopwatch(name, clock))
+    return timers
+
+
+class TimerScheduler:
+    # 타이머마다 스레드를 두는 대신, 모든 타이머의 다음 표시 변경 시각을 힙 하나에 넣고
+    # 가장 이른 마감에만 깨어난다. 상태가 바뀐 타이머는 새 항목을 넣고 이전 항목은 꺼낼 때 버린다.
+    # slack_ns 만큼의 격자에 깨어날 시각을 맞춰 가까운 마감들을 한 번에 처리한다 (늦어도 slack 이내).
+    def __init__(self, clock=time.monotonic_ns, slack_ns=0):
+        self.clock = clock
+        self.slack_ns = slack_ns
+        self.heap = []  # (마감 ns, 순번, 타이머)
+        self.deadlines = {}  # 타이머 -> 현재 유효한 마감
+        self.order = itertools.count()
+        self.wakeups = 0
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def add(self, timer, now=None):
+        self.reschedule(timer, now)
+
+    def remove(self, timer):
+        self.deadlines.pop(timer, None)
+
+    def clear(self):
+        self.heap.clear()
+        self.deadlines.clear()
+
+    def reschedule(self, timer, now=None):
+        if now is None:
+            now = self.clock()
+        deadline = timer.next_deadline_ns(now)
+        self.deadlines[timer] = deadline
+        if deadline is not None:
+            heapq.heappush(self.heap, (deadline, next(self.order), timer))
+
+    def reschedule_all(self, now=None):
+        if now is None:
+            now = self.clock()
+        for timer in list(self.deadlines):
+            self.reschedule(timer, now)
+
+    def next_deadline_ns(self):
+        heap = self.heap
+        while heap:
+            deadline, _, timer = heap[0]
+            if self.deadlines.get(timer) == deadline:
+                return deadline
+            heapq.heappop(heap)  # 상태가 바뀌었거나 제거된 타이머의 옛 항목
+        return None
+
+    def next_wake_ns(self):
+        deadline = self.next_deadline_ns()
+        if deadline is None or not self.slack_ns:
+            return deadline
+        return -(-deadline // self.slack_ns) * self.slack_ns
+
+    def pop_due(self, now=None):
+        # 마감이 지난 타이머를 꺼내 다음 마감으로 다시 넣고 목록을 돌려준다
+        if now is None:
+            now = self.clock()
+        self.wakeups += 1
+        due = []
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            deadline, _, timer = heapq.heappop(heap)
+            if self.deadlines.get(timer) == deadline:
+                due.append(timer)
+        # 다 꺼낸 뒤에 다시 넣어야 마감이 now 인 항목을 같은 호출에서 또 꺼내지 않는다
+        for timer in due:
+            self.reschedule(timer, now)
+        return due